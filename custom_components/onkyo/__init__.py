@@ -16,18 +16,22 @@ This module handles:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
 import homeassistant.helpers.config_validation as cv
-from eiscp import eISCP
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME, Platform
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 
-from .connection import OnkyoConnectionManager
+from .cache import ReceiverLists, async_get_cache, topology_key
+from .connection import (
+    OnkyoConnectionManager,
+    PushReceiver,
+    async_get_connection_registry,
+)
 from .const import (
     CONF_MAX_VOLUME,
     CONF_RECEIVER_MAX_VOLUME,
@@ -36,7 +40,14 @@ from .const import (
     DEFAULT_RECEIVER_MAX_VOLUME,
     DEFAULT_VOLUME_RESOLUTION,
     DOMAIN,
+    LIVE_OPTIONS,
+    SIGNAL_CONNECTED,
+    SIGNAL_OPTIONS_UPDATED,
 )
+from .discovery import EISCP_PORT
+from .helpers import get_profile_timing
+from .probe import async_release_probe, async_take_probe
+from .scheduler import async_get_scheduler
 
 # pylint: disable=invalid-name
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
@@ -44,10 +55,7 @@ CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.MEDIA_PLAYER]
-
-# Timeout for initial connection attempts
-CONNECTION_TIMEOUT = 10
+PLATFORMS = [Platform.MEDIA_PLAYER, Platform.SENSOR]
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -84,55 +92,73 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         ConfigEntryNotReady: If an unexpected error occurs during setup.
     """
     host = entry.data[CONF_HOST]
+    port = entry.data.get(CONF_PORT, EISCP_PORT)
 
     _LOGGER.debug("Setting up Onkyo integration for %s", host)
 
-    # Initialize the receiver connection
-    try:
-        receiver = await _async_setup_receiver(hass, entry)
-
-    except TimeoutError:
-        _LOGGER.warning(
-            "Timeout connecting to Onkyo receiver at %s. "
-            "The receiver may be powered off or in standby. "
-            "Integration will retry when the receiver becomes available.",
-            host,
+    # Take over the connection of the config flow if it is still open
+    probe = async_take_probe(hass, host)
+
+    def _create_connection() -> OnkyoConnectionManager:
+        # The receiver only connects on the first command, which is sent in
+        # the background so setup never waits for the receiver
+        if probe is not None:
+            _LOGGER.debug("Using the config flow connection to %s", host)
+            receiver = probe.receiver
+        else:
+            receiver = PushReceiver(host, port)
+        # Paced by the timing of the model
+        return OnkyoConnectionManager(
+            hass,
+            receiver,
+            get_profile_timing(entry.data.get("model_name")),
+            connected=probe is not None,
         )
-        # Don't raise ConfigEntryNotReady - allow setup to continue
-        # The media player will handle reconnection
-        receiver = eISCP(host)
 
-    except OSError as err:
-        _LOGGER.warning(
-            "Network error connecting to Onkyo receiver at %s: %s. "
-            "Integration will retry when network is available.",
-            host,
-            err,
+    # Share the connection with every other user of the same receiver
+    try:
+        connection_manager, created = async_get_connection_registry(hass).async_acquire(
+            host, _create_connection, port
         )
-        # Allow setup to continue - will reconnect later
-        receiver = eISCP(host)
-
     except Exception as err:  # pylint: disable=broad-exception-caught
         _LOGGER.error("Unexpected error setting up Onkyo receiver at %s: %s", host, err)
-        # Only raise for truly unexpected errors
-        raise ConfigEntryNotReady(
-            f"Unexpected error connecting to receiver: {err}"
-        ) from err
-
-    # Initialize Connection Manager
-    connection_manager = OnkyoConnectionManager(hass, receiver)
+        raise ConfigEntryNotReady(f"Unexpected error creating receiver: {err}") from err
+    if probe is not None and not created:
+        # Another entry already holds the connection to this receiver
+        async_release_probe(hass, probe)
+    receiver = connection_manager.receiver
+
+    # Source and listening-mode lists shared by all zones of the receiver
+    cache = await async_get_cache(hass)
+    receiver_lists = ReceiverLists(
+        cache,
+        entry.entry_id,
+        topology_key(entry.data.get("model_name"), entry.data.get("firmware")),
+    )
 
     # Store the receiver instance and entry data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "receiver": receiver,
         "connection_manager": connection_manager,
+        "lists": receiver_lists,
         "host": host,
         "name": entry.data.get(CONF_NAME, "Onkyo Receiver"),
         "entry": entry,
+        "options": dict(entry.options),
+        # Zones the config flow found, if setup took over its connection
+        "zones": probe.zones if probe is not None else None,
     }
 
-    # Set up the media player platform
+    # Connect while the platforms are set up from the restored state
+    if not connection_manager.connected:
+        entry.async_create_background_task(
+            hass,
+            _async_connect_receiver(hass, entry, connection_manager),
+            f"Connect to Onkyo receiver at {host}",
+        )
+
+    # Set up the media player and sensor platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Register update listener for options changes
@@ -143,78 +169,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def _async_setup_receiver(hass: HomeAssistant, entry: ConfigEntry) -> eISCP:
+async def _async_connect_receiver(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    connection_manager: OnkyoConnectionManager,
+) -> None:
     """
-    Set up the receiver connection with timeout.
+    Connect to the receiver after setup returned.
 
-    Args:
-        hass: Home Assistant instance.
-        entry: Config entry.
-
-    Returns:
-        eISCP: The connected receiver instance.
+    Entities start from their restored state; once the receiver answers
+    they are told to refresh. A receiver that does not answer is left to
+    the reconnect logic of the connection manager. The attempt waits for a
+    slot of the startup scheduler, so only a few receivers connect at once.
 
-    Raises:
-        asyncio.TimeoutError: If connection times out.
-        OSError: If network error occurs.
+    Args:
+        hass: The Home Assistant instance.
+        entry: The configuration entry.
+        connection_manager: The connection manager of the receiver.
     """
     host = entry.data[CONF_HOST]
-
-    _LOGGER.debug("Connecting to Onkyo receiver at %s", host)
-
-    # Create receiver instance
-    receiver = eISCP(host)
-
-    # Try to establish connection with timeout
-    try:
-        await asyncio.wait_for(
-            hass.async_add_executor_job(_test_connection, receiver),
-            timeout=CONNECTION_TIMEOUT,
+    async with async_get_scheduler(hass).async_slot():
+        connected = await connection_manager.async_connect()
+    if not connected:
+        _LOGGER.warning(
+            "Could not connect to Onkyo receiver at %s. "
+            "The receiver may be powered off or in standby. "
+            "Integration will retry when the receiver becomes available.",
+            host,
         )
+        return
 
-        _LOGGER.info("Successfully connected to Onkyo receiver at %s", host)
-        return receiver
-
-    except TimeoutError:
-        _LOGGER.debug("Connection to %s timed out", host)
-        # Clean up the connection attempt
-        try:
-            await hass.async_add_executor_job(receiver.disconnect)
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
-        raise
-
-    except Exception as err:  # pylint: disable=broad-exception-caught
-        _LOGGER.debug("Error connecting to %s: %s", host, err)
-        # Clean up
-        try:
-            await hass.async_add_executor_job(receiver.disconnect)
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
-        raise
-
-
-def _test_connection(receiver: eISCP) -> bool:
-    """
-    Test connection to receiver (sync function for executor).
-
-    Args:
-        receiver: eISCP receiver instance.
-
-    Returns:
-        bool: True if connection successful.
-
-    Raises:
-        Exception: Various exceptions if connection fails.
-    """
-    # Try a simple command to verify connection
-    try:
-        # Query power state - this is a lightweight command
-        receiver.command("system-power", "query")
-        return True
-    except Exception as err:  # pylint: disable=broad-exception-caught
-        _LOGGER.debug("Connection test failed: %s", err)
-        raise
+    _LOGGER.info("Successfully connected to Onkyo receiver at %s", host)
+    async_dispatcher_send(hass, SIGNAL_CONNECTED.format(entry.entry_id))
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -243,7 +229,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             receiver = receiver_data["receiver"]
 
             if connection_manager:
-                await connection_manager.async_close()
+                # Closes the connection unless another entry still uses it
+                await async_get_connection_registry(hass).async_release(
+                    connection_manager
+                )
             else:
                 # Fallback cleanup if connection manager wasn't created
                 try:
@@ -268,7 +257,9 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """
     Handle options update.
 
-    Called when user changes options via UI.
+    Called when user changes options via UI. Options that entities can
+    apply in place (volume scaling, source filter) are pushed to them without
+    reloading the entry; anything else triggers a reload.
 
     Args:
         hass: The Home Assistant instance.
@@ -276,6 +267,19 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """
     _LOGGER.debug("Updating options for Onkyo integration")
 
+    receiver_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if receiver_data is not None:
+        previous = receiver_data.get("options", {})
+        changed = {
+            key
+            for key in previous.keys() | entry.options.keys()
+            if previous.get(key) != entry.options.get(key)
+        }
+        if changed <= LIVE_OPTIONS:
+            receiver_data["options"] = dict(entry.options)
+            async_dispatcher_send(hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id))
+            return
+
     # Reload the config entry to apply new options
     await hass.config_entries.async_reload(entry.entry_id)
 
@@ -317,7 +321,7 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         # Add default sources if not present
         if CONF_SOURCES not in new_options:
-            new_options[CONF_SOURCES] = build_sources_list()
+            new_options[CONF_SOURCES] = dict(build_sources_list())
             _LOGGER.debug("Added default sources list")
 
         # Update the entry
@@ -341,3 +345,7 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         entry: The configuration entry.
     """
     _LOGGER.debug("Removing Onkyo config entry %s", entry.entry_id)
+
+    # Drop cached receiver facts
+    cache = await async_get_cache(hass)
+    cache.async_remove_entry(entry.entry_id)
@@ -0,0 +1,214 @@
+"""
+Album art of the network sources.
+
+The receiver sends the jacket art of the playing track as NJA messages,
+either as a URL or as the image itself, hex encoded in chunks of up to 1 kB
+with a start, continue and end marker (``NJA10ffd8...``, ``NJA11...``,
+``NJA12...``). The chunks are decoded straight into a buffer that is kept
+and reused for the next image, and finished images are kept in a
+size-bounded LRU cache keyed by track, so a track that plays again needs no
+assembly at all.
+"""
+
+from __future__ import annotations
+
+import binascii
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+ART_COMMAND = "net-usb-jacket-art"
+
+# Image types of NJA messages; "2" carries a URL and "n" means no image
+_IMAGE_TYPES = {"0": "image/bmp", "1": "image/jpeg"}
+_URL = "2"
+_NO_IMAGE = "n"
+
+# Packet markers
+_START = "0"
+_END = "2"
+
+# Initial buffer size, enough for typical jacket art without growing
+INITIAL_CAPACITY = 64 * 1024
+
+# Images larger than this are dropped
+MAX_IMAGE_SIZE = 2 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class JacketArt:
+    """A complete jacket art message: an image, a URL, or neither."""
+
+    content_type: str | None = None
+    content: bytes | None = None
+    url: str | None = None
+
+
+def digest(data: bytes) -> str:
+    """
+    Return a short hash of some data, used as image key.
+
+    Args:
+        data: The data.
+
+    Returns:
+        str: The hash in hex.
+    """
+    return hashlib.blake2s(data, digest_size=8).hexdigest()
+
+
+def starts_image(value: str) -> bool:
+    """
+    Return True if an NJA message starts a new image.
+
+    A link and the no-image message are complete in themselves.
+
+    Args:
+        value: The message value, e.g. "10ffd8ffe0...".
+
+    Returns:
+        bool: True for the first message of an image.
+    """
+    return len(value) >= 2 and (value[0] in (_URL, _NO_IMAGE) or value[1] == _START)
+
+
+def track_key(artist: str | None, title: str | None, album: str | None) -> str | None:
+    """
+    Return the key of a track's art.
+
+    Args:
+        artist: The artist of the track.
+        title: The title of the track.
+        album: The album of the track.
+
+    Returns:
+        str | None: The key, or None if the track has no title.
+    """
+    if title is None:
+        return None
+    return digest("\x1f".join((artist or "", title, album or "")).encode())
+
+
+class ArtAssembler:
+    """Assemble jacket art from NJA messages."""
+
+    __slots__ = ("_buffer", "_length", "_content_type")
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        """
+        Initialize the assembler.
+
+        Args:
+            capacity: The initial size of the buffer.
+        """
+        self._buffer = bytearray(capacity)
+        self._length = 0
+        self._content_type: str | None = None
+
+    def feed(self, value: str) -> JacketArt | None:
+        """
+        Add an NJA message.
+
+        Args:
+            value: The message value, e.g. "10ffd8ffe0...".
+
+        Returns:
+            JacketArt | None: The art once it is complete, otherwise None.
+        """
+        if not isinstance(value, str) or len(value) < 2:
+            return None
+        image_type, marker = value[0], value[1]
+        if image_type == _URL:
+            self._content_type = None
+            return JacketArt(url=value[2:].strip() or None)
+        if image_type == _NO_IMAGE:
+            self._content_type = None
+            return JacketArt()
+        if (content_type := _IMAGE_TYPES.get(image_type)) is None:
+            return None
+
+        if marker == _START:
+            self._length = 0
+            self._content_type = content_type
+        elif self._content_type != content_type:
+            # The start of this image was missed
+            return None
+        if not self._write(value[2:]):
+            self._content_type = None
+            return None
+        if marker != _END:
+            return None
+
+        self._content_type = None
+        content = bytes(memoryview(self._buffer)[: self._length])
+        return JacketArt(content_type=content_type, content=content)
+
+    def _write(self, data: str) -> bool:
+        """Decode a chunk into the buffer, growing it if needed."""
+        try:
+            chunk = binascii.a2b_hex(data)
+        except (binascii.Error, ValueError):
+            return False
+        end = self._length + len(chunk)
+        if end > MAX_IMAGE_SIZE:
+            return False
+        if end > (capacity := len(self._buffer)):
+            self._buffer.extend(bytes(max(end, 2 * capacity) - capacity))
+        self._buffer[self._length : end] = chunk
+        self._length = end
+        return True
+
+
+class ArtCache:
+    """Images by track key, evicting the least recently used beyond a size."""
+
+    __slots__ = ("_images", "_size", "_max_size")
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: The total image size in bytes to keep at most.
+        """
+        self._images: OrderedDict[str, tuple[bytes, str]] = OrderedDict()
+        self._size = 0
+        self._max_size = max_size
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the image of a track is cached."""
+        return key in self._images
+
+    def get(self, key: str) -> tuple[bytes, str] | None:
+        """
+        Return the image of a track.
+
+        Args:
+            key: The track key.
+
+        Returns:
+            tuple[bytes, str] | None: The image and its content type, or
+            None if it is not cached.
+        """
+        if (image := self._images.get(key)) is not None:
+            self._images.move_to_end(key)
+        return image
+
+    def put(self, key: str, content: bytes, content_type: str) -> None:
+        """
+        Store the image of a track.
+
+        Args:
+            key: The track key.
+            content: The image.
+            content_type: The MIME type of the image.
+        """
+        if len(content) > self._max_size:
+            return
+        if (previous := self._images.pop(key, None)) is not None:
+            self._size -= len(previous[0])
+        self._images[key] = (content, content_type)
+        self._size += len(content)
+        while self._size > self._max_size:
+            _key, (evicted, _type) = self._images.popitem(last=False)
+            self._size -= len(evicted)
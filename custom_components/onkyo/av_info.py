@@ -0,0 +1,92 @@
+"""
+Decoding of the IFA/IFV audio and video information messages.
+
+The receiver reports the signal it is processing as comma separated fields,
+e.g. ``IFAHDMI 1,PCM,48 kHz,2.0 ch,All Ch Stereo,5.1 ch,``. The layout of
+each message is fixed, so the field names are laid down once per message in
+a schema and every message is decoded with a single split.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from .const import ATTR_AUDIO_INFORMATION, ATTR_VIDEO_INFORMATION
+
+InfoFields = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class InfoSchema:
+    """Field layout of an information message."""
+
+    key: str
+    name: str
+    command: str
+    iscp: str
+    fields: tuple[str, ...]
+    state_field: str
+
+    def decode(self, value: Any) -> InfoFields | None:
+        """
+        Decode the value of an information message.
+
+        Args:
+            value: The message value.
+
+        Returns:
+            InfoFields | None: The non-empty fields in message order, or
+            None if the value is not an information message.
+        """
+        if not isinstance(value, str):
+            return None
+        return tuple(
+            (field, text)
+            for field, part in zip(self.fields, value.split(","), strict=False)
+            if (text := part.strip())
+        )
+
+
+AUDIO_INFORMATION = InfoSchema(
+    key=ATTR_AUDIO_INFORMATION,
+    name="Audio information",
+    command="audio-information",
+    iscp="IFA",
+    fields=(
+        "input_port",
+        "input_format",
+        "sample_rate",
+        "input_channels",
+        "listening_mode",
+        "output_channels",
+        "output_sample_rate",
+        "pqls",
+        "auto_phase_control_delay",
+        "auto_phase_control_phase",
+    ),
+    state_field="input_format",
+)
+
+VIDEO_INFORMATION = InfoSchema(
+    key=ATTR_VIDEO_INFORMATION,
+    name="Video information",
+    command="video-information",
+    iscp="IFV",
+    fields=(
+        "input_port",
+        "input_resolution",
+        "input_color_schema",
+        "input_color_depth",
+        "output_port",
+        "output_resolution",
+        "output_color_schema",
+        "output_color_depth",
+        "picture_mode",
+        "input_hdr",
+        "output_hdr",
+    ),
+    state_field="input_resolution",
+)
+
+INFO_SCHEMAS = (AUDIO_INFORMATION, VIDEO_INFORMATION)
@@ -0,0 +1,407 @@
+"""
+Browsing of the receiver's network service menus.
+
+The NET menus (TuneIn, Spotify, USB folders, ...) live on the receiver: a
+list is read by navigating the receiver to it and requesting it a page at
+a time with NLA, whose reply carries the items as XML. Pages are cached per
+menu path for a short time, the next page is fetched in the background
+while the user looks at the current one, and navigation moves only as far
+as needed from where the receiver already is. The cache is dropped when the
+receiver reports (NLT/NLS) that its menus changed underneath us, e.g.
+because someone used the remote.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any
+from xml.etree.ElementTree import ParseError, fromstring
+
+from homeassistant.components.media_player import BrowseMedia, MediaClass
+from homeassistant.core import HomeAssistant, callback
+
+from .connection import OnkyoConnectionManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Media content type of NET menu items
+NET_MEDIA_TYPE = "onkyo_net"
+
+# Content ID of the NET top menu; deeper menus append "/<index>" per level
+NET_ROOT = "net"
+_PAGE = "?page="
+
+LIST_TITLE = "net-usb-list-title-info"
+LIST_INFO = "net-usb-list-info"
+
+# Items per NLA request
+PAGE_SIZE = 25
+
+# Seconds a page is used without asking the receiver again
+LIST_CACHE_TTL = 30.0
+
+_NLA = "NLA"
+
+ListPath = tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ListItem:
+    """An entry of a NET menu."""
+
+    index: int
+    title: str
+
+
+@dataclass(frozen=True, slots=True)
+class ListPage:
+    """A page of a NET menu."""
+
+    offset: int
+    total: int
+    items: tuple[ListItem, ...]
+
+    @property
+    def next_offset(self) -> int | None:
+        """Return the offset of the next page, or None if this is the last."""
+        end = self.offset + len(self.items)
+        return end if self.items and end < self.total else None
+
+
+def content_id(path: ListPath, page: int = 0) -> str:
+    """
+    Return the content ID of a page of a NET menu.
+
+    Args:
+        path: The item indices leading to the menu.
+        page: The page number.
+
+    Returns:
+        str: The content ID, e.g. "net/0/3?page=1".
+    """
+    base = "/".join((NET_ROOT, *map(str, path)))
+    return f"{base}{_PAGE}{page}" if page else base
+
+
+def parse_content_id(media_id: str) -> tuple[ListPath, int]:
+    """
+    Parse a content ID made by ``content_id``.
+
+    Args:
+        media_id: The content ID.
+
+    Returns:
+        tuple[ListPath, int]: The menu path and the page number.
+
+    Raises:
+        ValueError: If the ID is not a NET menu ID.
+    """
+    base, _, page = media_id.partition(_PAGE)
+    root, *indices = base.split("/")
+    if root != NET_ROOT:
+        raise ValueError(f"Not a network menu: {media_id}")
+    return tuple(int(index) for index in indices), int(page or 0)
+
+
+def parse_list_page(reply: str) -> ListPage | None:
+    """
+    Parse the reply to an NLA list request.
+
+    The reply is ``X<seq><status><ui><reserved>`` followed by the XML,
+    e.g. ``X0001S20<?xml ...?><response status="ok"><items offset="0"
+    totalitems="8"><item title="My Presets" .../>...``.
+
+    Args:
+        reply: The reply, with or without the leading "NLA".
+
+    Returns:
+        ListPage | None: The page, or None if the receiver refused the
+        request or the reply is malformed.
+    """
+    body = reply[len(_NLA) :] if reply.startswith(_NLA) else reply
+    if len(body) < 6 or body[0] != "X" or body[5] != "S":
+        return None
+    try:
+        response = fromstring(body[body.find("<") :])
+    except ParseError as err:
+        _LOGGER.debug("Malformed NLA reply: %s", err)
+        return None
+    if response.get("status", "ok") != "ok":
+        return None
+    if (items := response.find("items")) is None:
+        return None
+    try:
+        offset = int(items.get("offset", "0"))
+        total = int(items.get("totalitems", "0"))
+    except ValueError:
+        return None
+    return ListPage(
+        offset=offset,
+        total=total,
+        items=tuple(
+            ListItem(offset + position, (item.get("title") or "").strip())
+            for position, item in enumerate(items.iter("item"))
+        ),
+    )
+
+
+def parse_list_title(value: str) -> tuple[int, int] | None:
+    """
+    Return the menu depth and item count of an NLT message.
+
+    Args:
+        value: The message value, "<service><ui><layer info><cursor>
+            <items><layer>...".
+
+    Returns:
+        tuple[int, int] | None: The depth and the number of items, or None
+        if the message is malformed.
+    """
+    try:
+        return int(value[12:14], 16), int(value[8:12], 16)
+    except (TypeError, ValueError):
+        return None
+
+
+class NetListBrowser:
+    """Read NET menus from the receiver, caching pages per menu path."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection_manager: OnkyoConnectionManager,
+        ttl: float = LIST_CACHE_TTL,
+        page_size: int = PAGE_SIZE,
+    ) -> None:
+        """
+        Initialize the browser.
+
+        Args:
+            hass: The Home Assistant instance.
+            connection_manager: The connection manager of the receiver.
+            ttl: Seconds a page is used without asking the receiver again.
+            page_size: Items per page.
+        """
+        self._hass = hass
+        self._conn_manager = connection_manager
+        self._ttl = ttl
+        self._page_size = page_size
+        self._lock = asyncio.Lock()
+        # Pages by menu path and page number, with the time they were read
+        self._pages: dict[tuple[ListPath, int], tuple[float, ListPage]] = {}
+        # Where the receiver's menu is, or None if unknown
+        self._path: ListPath | None = None
+        self._sequence = 0
+
+    def item_title(self, path: ListPath) -> str | None:
+        """
+        Return the title of the item leading to a menu, if it was read.
+
+        Args:
+            path: The menu path.
+
+        Returns:
+            str | None: The title of the last item of the path.
+        """
+        if not path:
+            return None
+        *parent, index = path
+        page = self._cached(tuple(parent), index // self._page_size)
+        if page is None or not page.offset <= index < page.offset + len(page.items):
+            return None
+        return page.items[index - page.offset].title
+
+    async def async_get_page(self, path: ListPath, page: int) -> ListPage | None:
+        """
+        Return a page of a menu, prefetching the next one.
+
+        Args:
+            path: The menu path.
+            page: The page number.
+
+        Returns:
+            ListPage | None: The page, or None if the receiver did not
+            return it.
+        """
+        if (list_page := self._cached(path, page)) is None:
+            async with self._lock:
+                # A prefetch may have read it meanwhile
+                if (list_page := self._cached(path, page)) is None:
+                    list_page = await self._async_read(path, page)
+        if list_page is not None and list_page.next_offset is not None:
+            if self._cached(path, page + 1) is None:
+                self._hass.async_create_background_task(
+                    self._async_prefetch(path, page + 1), "onkyo list prefetch"
+                )
+        return list_page
+
+    async def async_select(self, path: ListPath) -> None:
+        """
+        Select a menu item on the receiver, e.g. to play it.
+
+        Args:
+            path: The path of the item.
+        """
+        if not path:
+            return
+        async with self._lock:
+            await self._async_navigate(path[:-1])
+            await self._async_send_select(len(path) - 1, path[-1])
+            # Selecting may open a menu or start playback
+            self._path = None
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Forget every page and where the receiver's menu is."""
+        self._pages.clear()
+        self._path = None
+
+    @callback
+    def handle_list_title(self, zone: str, command: str, value: Any) -> None:
+        """
+        Drop the cache if the receiver's menu moved without us.
+
+        Args:
+            zone: The zone of the update.
+            command: The eISCP command name.
+            value: The NLT message value.
+        """
+        if self._lock.locked() or self._path is None or not isinstance(value, str):
+            return
+        if (title := parse_list_title(value)) is None:
+            return
+        depth, total = title
+        cached = self._cached(self._path, 0)
+        if depth != len(self._path) or (cached is not None and cached.total != total):
+            self.async_invalidate()
+
+    @callback
+    def handle_list_info(self, zone: str, command: str, value: Any) -> None:
+        """
+        Drop the pages of the current menu when the receiver redraws it.
+
+        Args:
+            zone: The zone of the update.
+            command: The eISCP command name.
+            value: The NLS message value; "C<line>P" announces a new page.
+        """
+        if self._lock.locked() or self._path is None or not isinstance(value, str):
+            return
+        if value[:1] == "C" and value[2:3] == "P":
+            path = self._path
+            for key in [key for key in self._pages if key[0] == path]:
+                del self._pages[key]
+
+    def _cached(self, path: ListPath, page: int) -> ListPage | None:
+        """Return a cached page unless it expired."""
+        if (entry := self._pages.get((path, page))) is None:
+            return None
+        read_at, list_page = entry
+        if self._hass.loop.time() - read_at > self._ttl:
+            del self._pages[(path, page)]
+            return None
+        return list_page
+
+    async def _async_prefetch(self, path: ListPath, page: int) -> None:
+        """Read a page in the background unless the receiver is busy."""
+        if self._lock.locked():
+            return
+        async with self._lock:
+            # Not worth navigating back once the user moved to another menu
+            if self._path == path and self._cached(path, page) is None:
+                await self._async_read(path, page)
+
+    async def _async_read(self, path: ListPath, page: int) -> ListPage | None:
+        """Navigate to a menu and read one of its pages."""
+        await self._async_navigate(path)
+        reply = await self._conn_manager.async_send_command(
+            "raw",
+            f"{_NLA}L{self._next_sequence()}{len(path):02x}"
+            f"{page * self._page_size:04x}{self._page_size:04x}",
+        )
+        if not isinstance(reply, str) or (list_page := parse_list_page(reply)) is None:
+            return None
+        self._pages[(path, page)] = (self._hass.loop.time(), list_page)
+        return list_page
+
+    async def _async_navigate(self, path: ListPath) -> None:
+        """Move the receiver's menu to a path, as few steps as possible."""
+        current = self._path
+        if current == path:
+            return
+        # Unknown until the last step went out
+        self._path = None
+        if current is not None and current[: len(path)] == path:
+            # Back up to a parent menu
+            for _ in range(len(current) - len(path)):
+                await self._conn_manager.async_send_command("raw", "NTCRETURN")
+        else:
+            if current is None or path[: len(current)] != current:
+                await self._conn_manager.async_send_command("raw", "NTCTOP")
+                current = ()
+            for depth in range(len(current), len(path)):
+                await self._async_send_select(depth, path[depth])
+        self._path = path
+
+    async def _async_send_select(self, depth: int, index: int) -> None:
+        """Select an item of the menu at a depth."""
+        await self._conn_manager.async_send_command(
+            "raw", f"{_NLA}I{self._next_sequence()}{depth:02x}{index:04x}----"
+        )
+
+    def _next_sequence(self) -> str:
+        """Return the next NLA sequence number."""
+        self._sequence = (self._sequence + 1) % 0x10000
+        return f"{self._sequence:04x}"
+
+
+def build_browse_media(
+    path: ListPath, page: int, list_page: ListPage, title: str | None
+) -> BrowseMedia:
+    """
+    Return a page of a NET menu for the media browser.
+
+    Args:
+        path: The menu path.
+        page: The page number.
+        list_page: The page.
+        title: The title of the menu.
+
+    Returns:
+        BrowseMedia: The menu page, ending in a "More" item linking the next
+        page if there is one.
+    """
+    children = [
+        BrowseMedia(
+            title=item.title,
+            media_class=MediaClass.DIRECTORY,
+            media_content_id=content_id((*path, item.index)),
+            media_content_type=NET_MEDIA_TYPE,
+            can_play=True,
+            can_expand=True,
+        )
+        for item in list_page.items
+    ]
+    if list_page.next_offset is not None:
+        children.append(
+            BrowseMedia(
+                title="More",
+                media_class=MediaClass.DIRECTORY,
+                media_content_id=content_id(path, page + 1),
+                media_content_type=NET_MEDIA_TYPE,
+                can_play=False,
+                can_expand=True,
+            )
+        )
+    return BrowseMedia(
+        title=title or "Network",
+        media_class=MediaClass.DIRECTORY,
+        media_content_id=content_id(path, page),
+        media_content_type=NET_MEDIA_TYPE,
+        can_play=False,
+        can_expand=True,
+        children=children,
+        children_media_class=MediaClass.DIRECTORY,
+    )
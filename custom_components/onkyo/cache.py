@@ -0,0 +1,323 @@
+"""Persistent cache for slow-to-discover Onkyo receiver facts."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_CACHE,
+    LIST_CACHE_TTL,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def topology_key(model_name: str | None, firmware: str | None) -> str:
+    """
+    Return the cache key for facts that depend on model and firmware.
+
+    Args:
+        model_name: The receiver model name, if known.
+        firmware: The receiver firmware version, if known.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"{model_name or 'unknown'}|{firmware or 'unknown'}"
+
+
+class OnkyoCache:
+    """
+    Integration-wide persistent cache backed by an HA Store.
+
+    Data is kept in memory and written back with a short delay, so repeated
+    updates during startup result in a single write.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            hass: The Home Assistant instance.
+        """
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        """Load the cache from storage."""
+        self._data = await self._store.async_load() or {}
+
+    @callback
+    def _async_save(self) -> None:
+        """Schedule a delayed write of the cache."""
+        self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY)
+
+    @callback
+    def async_get_zones(self, entry_id: str, key: str) -> list[str] | None:
+        """
+        Return the cached zones of a receiver.
+
+        Args:
+            entry_id: The config entry ID.
+            key: The model/firmware key the zones must have been detected for.
+
+        Returns:
+            list[str] | None: The cached zones, or None on a miss.
+        """
+        cached = self._data.get("zones", {}).get(entry_id)
+        if not cached or cached.get("key") != key:
+            return None
+        return list(cached["zones"])
+
+    @callback
+    def async_set_zones(self, entry_id: str, key: str, zones: list[str]) -> None:
+        """
+        Store the detected zones of a receiver.
+
+        Args:
+            entry_id: The config entry ID.
+            key: The model/firmware key the zones were detected for.
+            zones: The detected zones.
+        """
+        self._data.setdefault("zones", {})[entry_id] = {
+            "key": key,
+            "zones": list(zones),
+        }
+        self._async_save()
+
+    @callback
+    def async_get_list(
+        self, entry_id: str, key: str, kind: str
+    ) -> tuple[str, ...] | None:
+        """
+        Return a cached receiver list if it is still fresh.
+
+        Args:
+            entry_id: The config entry ID.
+            key: The model/firmware key the list must have been fetched for.
+            kind: The list kind (sources or listening modes).
+
+        Returns:
+            tuple[str, ...] | None: The cached list, or None on a miss.
+        """
+        cached = self._data.get("lists", {}).get(entry_id, {}).get(kind)
+        if not cached or cached.get("key") != key:
+            return None
+        if dt_util.utcnow().timestamp() - cached["fetched"] > LIST_CACHE_TTL:
+            return None
+        return tuple(cached["values"])
+
+    @callback
+    def async_set_list(
+        self, entry_id: str, key: str, kind: str, values: Sequence[str] | None
+    ) -> None:
+        """
+        Store or drop a receiver list.
+
+        Args:
+            entry_id: The config entry ID.
+            key: The model/firmware key the list was fetched for.
+            kind: The list kind (sources or listening modes).
+            values: The list, or None to drop it.
+        """
+        lists = self._data.setdefault("lists", {}).setdefault(entry_id, {})
+        if values is None:
+            if lists.pop(kind, None) is None:
+                return
+        else:
+            lists[kind] = {
+                "key": key,
+                "fetched": dt_util.utcnow().timestamp(),
+                "values": list(values),
+            }
+        self._async_save()
+
+    @callback
+    def async_get_receiver_info(
+        self, device: str, firmware: str | None
+    ) -> dict[str, Any] | None:
+        """
+        Return the stored self-description of a receiver.
+
+        Args:
+            device: The MAC address of the receiver, from ``device_key``.
+            firmware: The firmware the information must have been read from.
+
+        Returns:
+            dict[str, Any] | None: The information, or None on a miss.
+        """
+        cached = self._data.get("receiver_info", {}).get(device)
+        if not firmware or not cached or cached.get("firmware") != firmware:
+            return None
+        info: dict[str, Any] = cached["info"]
+        return info
+
+    @callback
+    def async_set_receiver_info(
+        self, device: str, firmware: str, info: dict[str, Any]
+    ) -> None:
+        """
+        Store the self-description of a receiver.
+
+        Args:
+            device: The MAC address of the receiver, from ``device_key``.
+            firmware: The firmware the information was read from.
+            info: The information, as stored by ``ReceiverInfo.as_dict``.
+        """
+        self._data.setdefault("receiver_info", {})[device] = {
+            "firmware": firmware,
+            "info": info,
+        }
+        self._async_save()
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """
+        Drop everything cached for a config entry.
+
+        Args:
+            entry_id: The config entry ID.
+        """
+        removed = False
+        for section in self._data.values():
+            if isinstance(section, dict) and section.pop(entry_id, None) is not None:
+                removed = True
+        if removed:
+            self._async_save()
+
+
+class ReceiverLists:
+    """
+    Source and listening-mode lists of one receiver, shared by its zones.
+
+    Lists are served from memory, then from the persistent cache while they
+    are younger than the TTL, and only then queried from the receiver. A
+    query in flight is shared, so zones asking at the same time cause a
+    single round trip. Every zone gets the same immutable tuple.
+    """
+
+    def __init__(self, cache: OnkyoCache, entry_id: str, key: str) -> None:
+        """
+        Initialize the shared lists.
+
+        Args:
+            cache: The persistent cache.
+            entry_id: The config entry ID.
+            key: The model/firmware key of the receiver.
+        """
+        self._cache = cache
+        self._entry_id = entry_id
+        self._key = key
+        self._values: dict[str, tuple[str, ...]] = {}
+        self._from_storage: set[str] = set()
+        self._pending: dict[str, asyncio.Future[tuple[str, ...] | None]] = {}
+
+    async def async_get(
+        self, kind: str, fetch: Callable[[], Awaitable[Sequence[str] | None]]
+    ) -> tuple[str, ...] | None:
+        """
+        Return a receiver list, fetching it only if no fresh copy exists.
+
+        Args:
+            kind: The list kind (sources or listening modes).
+            fetch: Coroutine function querying the list from the receiver.
+
+        Returns:
+            tuple[str, ...] | None: The list, or None if the receiver
+            returned nothing.
+        """
+        if (values := self._values.get(kind)) is not None:
+            return values
+
+        stored: tuple[str, ...] | None = self._cache.async_get_list(
+            self._entry_id, self._key, kind
+        )
+        if stored:
+            self._values[kind] = stored
+            self._from_storage.add(kind)
+            return stored
+
+        if (pending := self._pending.get(kind)) is None:
+            pending = self._pending[kind] = asyncio.ensure_future(
+                self._async_fetch(kind, fetch)
+            )
+        return await asyncio.shield(pending)
+
+    async def _async_fetch(
+        self, kind: str, fetch: Callable[[], Awaitable[Sequence[str] | None]]
+    ) -> tuple[str, ...] | None:
+        """Query a list from the receiver and store it."""
+        try:
+            result = await fetch()
+        finally:
+            self._pending.pop(kind, None)
+
+        if not result:
+            return None
+
+        values = tuple(result)
+        self._values[kind] = values
+        self._from_storage.discard(kind)
+        self._cache.async_set_list(self._entry_id, self._key, kind, values)
+        return values
+
+    @callback
+    def async_invalidate(self, kind: str, only_stored: bool = False) -> bool:
+        """
+        Drop a list so that the next request queries the receiver.
+
+        Args:
+            kind: The list kind (sources or listening modes).
+            only_stored: Only drop the list if it was loaded from storage
+                rather than queried during this session.
+
+        Returns:
+            bool: True if the list was dropped.
+        """
+        if only_stored and kind not in self._from_storage:
+            return False
+        self._values.pop(kind, None)
+        self._from_storage.discard(kind)
+        self._cache.async_set_list(self._entry_id, self._key, kind, None)
+        _LOGGER.debug("Invalidated cached %s list", kind)
+        return True
+
+
+async def async_get_cache(hass: HomeAssistant) -> OnkyoCache:
+    """
+    Return the shared cache, loading it from storage on first use.
+
+    Args:
+        hass: The Home Assistant instance.
+
+    Returns:
+        OnkyoCache: The loaded cache.
+    """
+    future: asyncio.Future[OnkyoCache] | None = hass.data.get(DATA_CACHE)
+    if future is None:
+        future = hass.data[DATA_CACHE] = hass.loop.create_future()
+        cache = OnkyoCache(hass)
+        try:
+            try:
+                await cache.async_load()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                _LOGGER.warning("Could not load Onkyo cache, starting empty: %s", err)
+            future.set_result(cache)
+        finally:
+            if not future.done():
+                # Loading was cancelled: release the waiting callers and let
+                # the next caller load again
+                hass.data.pop(DATA_CACHE, None)
+                future.cancel()
+    return await future
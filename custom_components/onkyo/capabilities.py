@@ -0,0 +1,185 @@
+"""
+O(1) lookups of what an Onkyo model supports.
+
+The generated index is only imported on the first lookup.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from .profiles import resolve_mapped_model
+
+# Power command of each zone, used to tell whether a model has the zone
+ZONE_POWER_COMMANDS = {
+    "main": "PWR",
+    "zone2": "ZPW",
+    "zone3": "PW3",
+    "zone4": "PW4",
+}
+
+
+class _CommandSpan:
+    """Value IDs of one command: a bitmask over all of them and per value."""
+
+    __slots__ = ("mask", "values")
+
+    def __init__(self, first_id: int, values: tuple[str, ...]) -> None:
+        self.mask = ((1 << len(values)) - 1) << first_id
+        self.values = {value: 1 << (first_id + i) for i, value in enumerate(values)}
+
+
+@lru_cache(maxsize=1)
+def _command_index() -> dict[str, dict[str, _CommandSpan]]:
+    """Return the value ID spans of every zone and command."""
+    from .onkyo_model_capabilities import COMMAND_VALUES
+
+    index: dict[str, dict[str, _CommandSpan]] = {}
+    next_id = 0
+    for zone, commands in COMMAND_VALUES.items():
+        zone_index = index[zone] = {}
+        for command, values in commands.items():
+            zone_index[command] = _CommandSpan(next_id, values)
+            next_id += len(values)
+    return index
+
+
+def _value_key(value: str | tuple[int, ...]) -> str:
+    """Return the interned form of a value key, joining range keys."""
+    if isinstance(value, tuple):
+        return "-".join(str(part) for part in value)
+    return value
+
+
+class ModelCapabilities:
+    """
+    The commands and values a single model supports.
+
+    All supported value IDs of the model are folded into one integer
+    bitset, so every question is a dictionary lookup and a bitwise AND.
+    Commands and zones missing from the index are assumed to be supported,
+    so only commands known to be unsupported are ever gated.
+    """
+
+    __slots__ = ("model_name", "_bits")
+
+    def __init__(self, model_name: str, modelsets: int) -> None:
+        """
+        Initialize the capabilities.
+
+        Args:
+            model_name: The receiver model name.
+            modelsets: Bitmask of the modelsets the model belongs to.
+        """
+        from .onkyo_model_capabilities import MODELSET_VALUES
+
+        self.model_name = model_name
+        bits = 0
+        for index, values in enumerate(MODELSET_VALUES):
+            if modelsets >> index & 1:
+                bits |= values
+        self._bits = bits
+
+    def supports_zone(self, zone: str) -> bool:
+        """
+        Return True if the model has the zone.
+
+        Args:
+            zone: The zone name (e.g. "zone2").
+
+        Returns:
+            bool: True if the zone is supported.
+        """
+        if (command := ZONE_POWER_COMMANDS.get(zone)) is not None:
+            return self.supports_command(zone, command)
+        commands = _command_index().get(zone)
+        if commands is None:
+            return True
+        return any(self._bits & span.mask for span in commands.values())
+
+    def supports_command(self, zone: str, command: str) -> bool:
+        """
+        Return True if the model supports any value of a command.
+
+        Args:
+            zone: The zone name.
+            command: The three letter ISCP command (e.g. "SLI").
+
+        Returns:
+            bool: True if the command is supported.
+        """
+        span = _command_index().get(zone, {}).get(command)
+        return span is None or bool(self._bits & span.mask)
+
+    def supports_value(
+        self, zone: str, command: str, value: str | tuple[int, ...]
+    ) -> bool:
+        """
+        Return True if the model supports a specific command value.
+
+        Args:
+            zone: The zone name.
+            command: The three letter ISCP command.
+            value: The ISCP value (e.g. "QSTN" or a range such as (0, 200)).
+
+        Returns:
+            bool: True if the value is supported.
+        """
+        span = _command_index().get(zone, {}).get(command)
+        if span is None:
+            return True
+        bit = span.values.get(_value_key(value))
+        if bit is None:
+            return bool(self._bits & span.mask)
+        return bool(self._bits & bit)
+
+
+@lru_cache(maxsize=32)
+def get_capabilities(model_name: str | None) -> ModelCapabilities | None:
+    """
+    Return the capabilities of a model.
+
+    Args:
+        model_name: The receiver model name; case, separators and suffixes
+            such as "(Ether)" are ignored.
+
+    Returns:
+        ModelCapabilities | None: The capabilities, or None if the model is
+        not in the index.
+    """
+    # Only exact or normalized names: a near miss must not gate queries
+    if (mapped := resolve_mapped_model(model_name, fuzzy=False)) is None:
+        return None
+    from .onkyo_model_capabilities import MODEL_MODELSETS
+
+    if (modelsets := MODEL_MODELSETS.get(mapped)) is None:
+        return None
+    return ModelCapabilities(mapped, modelsets)
+
+
+def model_supports(
+    model_name: str | None,
+    zone: str,
+    command: str,
+    value: str | tuple[int, ...] | None = None,
+) -> bool:
+    """
+    Return True unless the model is known not to support a command.
+
+    Unknown models are assumed to support everything, so gating a query
+    on this never hides a feature of a model missing from the index.
+
+    Args:
+        model_name: The receiver model name.
+        zone: The zone name.
+        command: The three letter ISCP command.
+        value: The ISCP value, or None to ask about the command as a whole.
+
+    Returns:
+        bool: False only if the model is known not to support it.
+    """
+    if (capabilities := get_capabilities(model_name)) is None:
+        return True
+    if value is None:
+        return capabilities.supports_command(zone, command)
+    return capabilities.supports_value(zone, command, value)
@@ -0,0 +1,89 @@
+"""Coalescing of Home Assistant state writes for Onkyo entities."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import STATE_WRITE_DELAY
+
+
+class StateWriteCoalescer:
+    """
+    Batch bursts of receiver updates into a single state write.
+
+    A receiver changing input typically pushes SLI, LMD, IFA, IFV, MVL and
+    more within a few milliseconds. Every update schedules a flush; the first
+    one arms a short timer and later ones ride along. When the timer fires,
+    the entity is written once, and only if its snapshot differs from the one
+    that was last written.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        write: Callable[[], None],
+        snapshot: Callable[[], Any],
+        delay: float = STATE_WRITE_DELAY,
+    ) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            hass: The Home Assistant instance.
+            write: Callback that writes the entity state.
+            snapshot: Callback returning a comparable view of the exposed state.
+            delay: Time window in seconds used to batch updates.
+        """
+        self._hass = hass
+        self._write = write
+        self._snapshot = snapshot
+        self._delay = delay
+        self._cancel: CALLBACK_TYPE | None = None
+        self._last_snapshot: Any = None
+        self._job = HassJob(
+            self._async_timer_fired, "onkyo state write", cancel_on_shutdown=True
+        )
+
+    @property
+    def pending(self) -> bool:
+        """
+        Return True if a flush is scheduled.
+
+        Returns:
+            bool: True if a write is pending.
+        """
+        return self._cancel is not None
+
+    @callback
+    def async_schedule(self) -> None:
+        """Schedule a state write at the end of the current batch window."""
+        if self._cancel is None:
+            self._cancel = async_call_later(self._hass, self._delay, self._job)
+
+    @callback
+    def _async_timer_fired(self, _now: datetime) -> None:
+        """Flush when the batch window elapses."""
+        self._cancel = None
+        self.async_flush()
+
+    @callback
+    def async_flush(self) -> None:
+        """Write the state now if any exposed value changed."""
+        self.async_cancel()
+        snapshot = self._snapshot()
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+        self._write()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel a pending write."""
+        if self._cancel is not None:
+            self._cancel()
+            self._cancel = None
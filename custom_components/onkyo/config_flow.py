@@ -13,9 +13,8 @@ import logging
 from typing import Any
 
 import voluptuous as vol
-from eiscp import eISCP
 from homeassistant import config_entries
-from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.selector import (
@@ -24,6 +23,7 @@ from homeassistant.helpers.selector import (
     SelectSelectorMode,
 )
 
+from .connection import PushReceiver, async_get_connection_registry
 from .const import (
     CONF_MAX_VOLUME,
     CONF_RECEIVER_MAX_VOLUME,
@@ -33,8 +33,13 @@ from .const import (
     DEFAULT_VOLUME_RESOLUTION,
     DOMAIN,
 )
-from .helpers import build_sources_list
-from .receiver_profiles import RECEIVER_PROFILES
+from .discovery import EISCP_PORT, async_discover
+from .helpers import (
+    build_receiver_sources,
+    build_sources_list,
+    get_profile_defaults,
+)
+from .probe import async_probe_receiver, async_store_probe
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -59,6 +64,8 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovered_devices: dict[str, Any] = {}
         self._host: str | None = None
         self._name: str | None = None
+        # The manual form input a network scan was started from
+        self._scan_input: dict[str, Any] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -66,6 +73,8 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """
         Handle the initial step - manual configuration.
 
+        Leaving the host empty scans the local network instead.
+
         Args:
             user_input: The user input dictionary.
 
@@ -75,25 +84,35 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            host = user_input[CONF_HOST]
+            host = (user_input.get(CONF_HOST) or "").strip()
+            if not host:
+                self._scan_input = user_input
+                return await self.async_step_scan()
+            port = user_input.get(CONF_PORT, EISCP_PORT)
 
             # Set unique ID based on host
             await self.async_set_unique_id(host)
             self._abort_if_unique_id_configured()
 
             # Try to connect to the receiver
-            result = await self._async_try_connect(host)
+            result = await self._async_try_connect(
+                host,
+                port,
+                keep_connection=True,
+                identifier=self._discovered_devices.get(host, {}).get("identifier"),
+            )
 
             # Get sources list
             # Try to get model name from discovered devices or result of connection
             model_name = result.get("model_name")
             if not model_name and host in self._discovered_devices:
-                # The discovered devices dict stores "name" but we need model.
-                # However, SSDP might not give us the exact model string we need.
-                # Let's rely on _async_try_connect returning model_name if possible.
-                pass
+                # A network scan reports the model; SSDP does not
+                model_name = self._discovered_devices[host].get("model_name")
 
-            sources = build_sources_list(model_name)
+            # Prefer the inputs the receiver itself reported
+            sources = build_receiver_sources(
+                result.get("selectors", ())
+            ) or build_sources_list(model_name)
 
             default_max_vol, default_vol_res = self._get_profile_defaults(model_name)
 
@@ -103,6 +122,11 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_NAME: user_input.get(CONF_NAME, DEFAULT_NAME),
                 "model_name": model_name,  # Store model name if available
             }
+            if CONF_PORT in user_input:
+                # Found by a network scan, possibly on another port
+                entry_data[CONF_PORT] = port
+            if result.get("firmware"):
+                entry_data["firmware"] = result["firmware"]
 
             # Create options with defaults
             entry_options = {
@@ -111,7 +135,7 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 ),
                 CONF_VOLUME_RESOLUTION: default_vol_res,
                 CONF_MAX_VOLUME: default_max_vol,
-                CONF_SOURCES: sources,
+                CONF_SOURCES: dict(sources),
             }
 
             if result["success"] or result.get("allow_setup", False):
@@ -134,9 +158,78 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = result.get("error", "unknown")
 
         # Show the form
-        data_schema = vol.Schema(
+        return self.async_show_form(
+            step_id="user",
+            data_schema=self._user_schema(),
+            errors=errors,
+        )
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """
+        Scan the local network and let the user pick a receiver.
+
+        Args:
+            user_input: The user input dictionary.
+
+        Returns:
+            FlowResult: The result of the flow step.
+        """
+        if user_input is not None:
+            host = user_input[CONF_HOST]
+            device = self._discovered_devices.get(host, {})
+            # Keep what the user entered before scanning, naming the entry
+            # after the model unless a name was given
+            manual = dict(self._scan_input)
+            if manual.get(CONF_NAME, DEFAULT_NAME) == DEFAULT_NAME:
+                manual[CONF_NAME] = device.get("name", DEFAULT_NAME)
+            return await self.async_step_user(
+                {
+                    **manual,
+                    CONF_HOST: host,
+                    CONF_PORT: device.get("port", EISCP_PORT),
+                }
+            )
+
+        receivers = await async_discover(self.hass)
+        configured = self._async_current_ids()
+        choices: dict[str, str] = {}
+        for receiver in receivers:
+            if receiver.host in configured:
+                continue
+            self._discovered_devices[receiver.host] = {
+                "name": receiver.model_name or DEFAULT_NAME,
+                "host": receiver.host,
+                "port": receiver.port,
+                "identifier": receiver.identifier,
+                "model_name": receiver.model_name or None,
+            }
+            choices[receiver.host] = f"{receiver.model_name} ({receiver.host})"
+
+        if not choices:
+            return self.async_show_form(
+                step_id="user",
+                data_schema=self._user_schema(),
+                errors={"base": "no_receivers_found"},
+            )
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema({vol.Required(CONF_HOST): vol.In(choices)}),
+        )
+
+    @staticmethod
+    def _user_schema() -> vol.Schema:
+        """
+        Return the schema of the manual configuration form.
+
+        Returns:
+            vol.Schema: The form schema.
+        """
+        return vol.Schema(
             {
-                vol.Required(CONF_HOST): str,
+                vol.Optional(CONF_HOST): str,
                 vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
                 vol.Optional(
                     CONF_RECEIVER_MAX_VOLUME, default=DEFAULT_RECEIVER_MAX_VOLUME
@@ -144,12 +237,6 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }
         )
 
-        return self.async_show_form(
-            step_id="user",
-            data_schema=data_schema,
-            errors=errors,
-        )
-
     async def async_step_ssdp(self, discovery_info: dict[str, Any]) -> FlowResult:
         """
         Handle SSDP discovery.
@@ -223,7 +310,7 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_RECEIVER_MAX_VOLUME: DEFAULT_RECEIVER_MAX_VOLUME,
                     CONF_VOLUME_RESOLUTION: default_vol_res,
                     CONF_MAX_VOLUME: default_max_vol,
-                    CONF_SOURCES: sources,
+                    CONF_SOURCES: dict(sources),
                 },
             )
 
@@ -235,20 +322,43 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
-    async def _async_try_connect(self, host: str) -> dict[str, Any]:
+    async def _async_try_connect(
+        self,
+        host: str,
+        port: int = EISCP_PORT,
+        keep_connection: bool = False,
+        identifier: str | None = None,
+    ) -> dict[str, Any]:
         """
         Try to connect to the receiver.
 
         Args:
             host: The hostname or IP address of the receiver.
+            port: The eISCP port of the receiver.
+            keep_connection: Probe the receiver on success and park the open
+                connection for entry setup instead of closing it.
+            identifier: The identifier a network scan reported for the
+                receiver, if it was found by one.
 
         Returns:
             dict[str, Any]: A dictionary containing 'success' (bool),
             'error' (str, optional), and 'allow_setup' (bool, optional).
         """
+        registry = async_get_connection_registry(self.hass)
+        if (connection_manager := registry.async_get(host, port)) is not None:
+            # A loaded entry holds the connection; the receiver may not
+            # accept a second client, so ask through the shared one
+            if await connection_manager.async_send_command(
+                "command", "system-power=query"
+            ):
+                model_name = getattr(connection_manager.receiver, "model_name", None)
+                return {"success": True, "model_name": model_name}
+            return {"success": False, "error": "timeout", "allow_setup": True}
+
         try:
             # Try to create receiver instance
-            receiver = eISCP(host)
+            receiver = PushReceiver(host, port)
+            keep = False
 
             try:
                 # Attempt basic connection test with timeout
@@ -257,9 +367,24 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # eISCP object might already have model_name if connected?
                 # But command needs to be sent to really connect
                 await self.hass.async_add_executor_job(
-                    receiver.command, "system-power", "query"
+                    receiver.command, "system-power=query"
                 )
 
+                if keep_connection:
+                    # Setup takes over the connection and what we learned
+                    probe = await async_probe_receiver(
+                        self.hass, receiver, host, identifier
+                    )
+                    async_store_probe(self.hass, probe)
+                    keep = True
+                    _LOGGER.info("Successfully connected to Onkyo receiver at %s", host)
+                    return {
+                        "success": True,
+                        "model_name": probe.model_name,
+                        "firmware": probe.firmware,
+                        "selectors": probe.info.selectors if probe.info else (),
+                    }
+
                 # Try to get model name from receiver object or query
                 # receiver.model_name should be populated if discovery worked
                 # eISCP constructor does discovery if host is not provided.
@@ -299,11 +424,12 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return {"success": False, "error": "network_error", "allow_setup": True}
 
             finally:
-                # Clean up connection
-                try:
-                    await self.hass.async_add_executor_job(receiver.disconnect)
-                except Exception:  # pylint: disable=broad-exception-caught
-                    pass
+                # Clean up connection unless setup takes it over
+                if not keep:
+                    try:
+                        await self.hass.async_add_executor_job(receiver.disconnect)
+                    except Exception:  # pylint: disable=broad-exception-caught
+                        pass
 
         except ImportError:
             _LOGGER.error("onkyo-eiscp library not found")
@@ -327,12 +453,12 @@ class OnkyoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         default_max_vol = 100
         default_vol_res = DEFAULT_VOLUME_RESOLUTION
 
-        if model_name and model_name in RECEIVER_PROFILES:
-            defaults = RECEIVER_PROFILES[model_name].get("ha_defaults", {})
-            if defaults.get("max_volume_percent"):
-                default_max_vol = defaults["max_volume_percent"]
-            if defaults.get("volume_resolution"):
-                default_vol_res = defaults["volume_resolution"]
+        # Only suggested in the form, so a similar model is good enough
+        defaults = get_profile_defaults(model_name, fuzzy=True)
+        if defaults.max_volume_percent:
+            default_max_vol = defaults.max_volume_percent
+        if defaults.volume_resolution:
+            default_vol_res = defaults.volume_resolution
 
         return default_max_vol, default_vol_res
 
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
+import queue
+import threading
+import time
+import weakref
+from collections.abc import Callable
 from typing import Any
 
 from eiscp import eISCP
-from homeassistant.core import HomeAssistant
+from eiscp.commands import COMMANDS
+from eiscp.core import Receiver, command_to_iscp, iscp_to_command
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_CONNECTIONS
+from .discovery import EISCP_PORT
+from .profiles import DEFAULT_TIMING, ReceiverTiming
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,7 +27,235 @@ _LOGGER = logging.getLogger(__name__)
 CONNECTION_TIMEOUT = 10  # seconds
 RECONNECT_DELAY_BASE = 1  # seconds
 RECONNECT_DELAY_MAX = 60  # seconds
-COMMAND_DELAY = 0.15  # seconds between commands
+
+# Seconds to wait for the reply to a command
+REPLY_TIMEOUT = 5.0
+
+UpdateCallback = Callable[[str, str, Any], None]
+
+# Zone and command name of every ISCP command, by its three-letter code
+_COMMAND_NAMES: dict[str, tuple[str, str]] = {}
+for _zone, _commands in COMMANDS.items():
+    for _code, _command in _commands.items():
+        _COMMAND_NAMES.setdefault(_code, (_zone, _command["name"]))
+
+# The main zone names its power, volume and muting differently from the
+# other zones; pushed updates use the names shared by all zones
+_MAIN_ZONE_NAMES = {
+    "system-power": "power",
+    "master-volume": "volume",
+    "audio-muting": "muting",
+}
+
+# Messages whose value is text, handed on as sent rather than decoded, as
+# eISCP would turn e.g. an all-hex track title ("ABBA") into a number
+TEXT_COMMANDS = frozenset(
+    {"IFA", "IFV", "NAT", "NTI", "NAL", "NTM", "NST", "NJA", "NLT", "NLS"}
+)
+
+
+def decode_message(message: str) -> tuple[str, str, Any] | None:
+    """
+    Decode an ISCP message the receiver sent.
+
+    Args:
+        message: The message, e.g. "MVL2A".
+
+    Returns:
+        tuple[str, str, Any] | None: The zone, command name and value, e.g.
+        ("main", "volume", 42), or None if the command is unknown.
+    """
+    code = message[:3]
+    if (names := _COMMAND_NAMES.get(code)) is None:
+        return None
+    zone, command = names
+    if zone == "main":
+        command = _MAIN_ZONE_NAMES.get(command, command)
+    if code in TEXT_COMMANDS:
+        return zone, command, message[3:]
+    try:
+        return zone, command, iscp_to_command(message)[1]
+    except ValueError:
+        return None
+
+
+# A message to send, with the event and list to hand its reply back in
+_QueuedMessage = tuple[str, threading.Event | None, list[Any] | None]
+
+
+class PushReceiver(Receiver):
+    """
+    An eISCP receiver that also reports the messages nobody asked for.
+
+    A background thread owns the socket: it sends the queued commands,
+    waits for their replies and hands every other message the receiver
+    sends, e.g. a volume change at the front panel, to ``on_message``. Unlike
+    the thread of the eISCP library, it keeps the messages that arrive
+    while a reply is awaited, and a command fails instead of hanging when
+    the thread is gone.
+    """
+
+    on_message: Callable[[str], None] | None = None
+    _thread: threading.Thread | None = None
+
+    def _ensure_thread_running(self) -> None:
+        """Start the thread, again if the connection it had was lost."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop = False
+        self._queue: queue.Queue[_QueuedMessage] = queue.Queue()
+        # A daemon, so a connection left open never holds up shutdown
+        self._thread = threading.Thread(
+            target=self._thread_loop, name=f"onkyo {self.host}", daemon=True
+        )
+        self._thread.start()
+
+    def disconnect(self) -> None:
+        """Stop the thread, which closes the socket."""
+        if self._thread is None:
+            eISCP.disconnect(self)
+            return
+        super().disconnect()
+
+    def raw(self, iscp_message: str) -> str:
+        """
+        Send an ISCP message and wait for the reply.
+
+        Args:
+            iscp_message: The message, e.g. "PWRQSTN".
+
+        Returns:
+            str: The reply, e.g. "PWR01".
+
+        Raises:
+            ConnectionError: If the connection is lost meanwhile.
+            ValueError: If the receiver does not reply.
+        """
+        self._ensure_thread_running()
+        thread = self._thread
+        event = threading.Event()
+        result: list[Any] = []
+        self._queue.put((iscp_message, event, result))
+        while not event.wait(0.1):
+            if thread is None or not thread.is_alive():
+                raise ConnectionError(f"Lost the connection to {self.host}")
+        if isinstance(result[0], Exception):
+            raise result[0]
+        return str(result[0])
+
+    def _thread_loop(self) -> None:
+        """Send the queued messages and read everything the receiver sends."""
+        try:
+            eISCP._ensure_socket_connected(self)
+            while not self._stop:
+                while (message := eISCP.get(self, False)) is not None:
+                    self._trigger(message)
+                try:
+                    iscp_message, event, result = self._queue.get(timeout=0.01)
+                except queue.Empty:
+                    continue
+                eISCP.send(self, iscp_message)
+                # Nobody waits for the reply to a message queued by ``send``
+                if event is not None and result is not None:
+                    result.append(self._await_reply(iscp_message))
+                    event.set()
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            _LOGGER.debug("Connection to %s lost: %s", self.host, err)
+        finally:
+            eISCP.disconnect(self)
+
+    def _await_reply(self, iscp_message: str) -> str | Exception:
+        """Return the reply to a message, passing on the others meanwhile."""
+        deadline = time.monotonic() + REPLY_TIMEOUT
+        while time.monotonic() < deadline:
+            if (message := eISCP.get(self, 0.05)) is None:
+                continue
+            # Replies repeat the three-letter command, e.g. MVL13 for MVLUP
+            if message[:3] == iscp_message[:3]:
+                return str(message)
+            self._trigger(message)
+        return ValueError("Timeout waiting for response.")
+
+    def _trigger(self, message: str) -> None:
+        """Hand a message nobody asked for to the listener."""
+        if (on_message := self.on_message) is not None:
+            on_message(message)
+
+
+class UpdateDispatcher:
+    """
+    Route receiver updates to the subscribers of their zone and command.
+
+    Every update costs one dictionary lookup, however many entities listen
+    to the receiver. Bound methods are held weakly, so a subscriber that
+    goes away without unsubscribing is dropped on its next update.
+    """
+
+    __slots__ = ("_subscribers",)
+
+    def __init__(self) -> None:
+        """Initialize the dispatcher."""
+        self._subscribers: dict[
+            tuple[str, str], list[Callable[[], UpdateCallback | None]]
+        ] = {}
+
+    @callback
+    def async_subscribe(
+        self, zone: str, command: str, target: UpdateCallback
+    ) -> CALLBACK_TYPE:
+        """
+        Subscribe to the updates of one command of a zone.
+
+        Args:
+            zone: The zone name (e.g. "main").
+            command: The eISCP command name (e.g. "volume").
+            target: Called with the zone, command and value of each update.
+
+        Returns:
+            CALLBACK_TYPE: Function removing the subscription.
+        """
+        key = (zone, command)
+        ref: Callable[[], UpdateCallback | None]
+        if inspect.ismethod(target):
+            ref = weakref.WeakMethod(target)
+        else:
+            ref = lambda: target  # noqa: E731
+        self._subscribers.setdefault(key, []).append(ref)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            refs = self._subscribers.get(key, [])
+            for index, held in enumerate(refs):
+                if held is ref:
+                    del refs[index]
+                    break
+            if not refs:
+                self._subscribers.pop(key, None)
+
+        return _async_unsubscribe
+
+    @callback
+    def async_dispatch(self, zone: str, command: str, value: Any) -> None:
+        """
+        Hand an update to the subscribers of its zone and command.
+
+        Args:
+            zone: The zone the update is for.
+            command: The eISCP command name.
+            value: The new value.
+        """
+        if (refs := self._subscribers.get((zone, command))) is None:
+            return
+        alive = []
+        for ref in refs:
+            if (target := ref()) is not None:
+                alive.append(ref)
+                target(zone, command, value)
+        if len(alive) != len(refs):
+            if alive:
+                self._subscribers[(zone, command)] = alive
+            else:
+                del self._subscribers[(zone, command)]
 
 
 class OnkyoConnectionManager:
@@ -23,22 +263,95 @@ class OnkyoConnectionManager:
     Manages the connection to an Onkyo receiver.
 
     Handles command sending, rate limiting, and reconnection logic.
+    Commands are paced by the timing of the receiver model: up to
+    ``max_pipelined_queries`` commands go out back to back, after which
+    they are spaced by ``command_interval``, and slow commands hold off
+    the next command for their settle time.
     """
 
-    def __init__(self, hass: HomeAssistant, receiver: eISCP) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        receiver: PushReceiver,
+        timing: ReceiverTiming = DEFAULT_TIMING,
+        connected: bool = False,
+    ) -> None:
         """
         Initialize the connection manager.
 
         Args:
             hass: The Home Assistant instance.
             receiver: The eISCP receiver instance.
+            timing: The timing and quirks of the receiver model.
+            connected: The receiver is known to be connected, so the first
+                command needs no reconnect.
         """
         self.hass = hass
         self._receiver = receiver
+        self._timing = timing
         self._lock = asyncio.Lock()
         self._last_command_time = 0.0
+        self._burst = 0
+        self._settle_until = 0.0
         self._reconnect_attempt = 0
-        self._is_connected = False
+        self._is_connected = connected
+
+        # Push updates of the receiver, routed by zone and command; a
+        # ``PushReceiver`` reports them from its thread
+        self._updates = UpdateDispatcher()
+        receiver.on_message = self._receive_message
+
+    @property
+    def receiver(self) -> PushReceiver:
+        """
+        Return the receiver the connection talks to.
+
+        Returns:
+            PushReceiver: The eISCP receiver instance.
+        """
+        return self._receiver
+
+    @property
+    def updates(self) -> UpdateDispatcher:
+        """
+        Return the dispatcher of the receiver's push updates.
+
+        Returns:
+            UpdateDispatcher: The dispatcher to subscribe to.
+        """
+        return self._updates
+
+    def _receive_message(self, message: str) -> None:
+        """
+        Pass a message of the receiver's thread on to the event loop.
+
+        Args:
+            message: The ISCP message, e.g. "MVL2A".
+        """
+        self.hass.loop.call_soon_threadsafe(self._async_handle_message, message)
+
+    @callback
+    def _async_handle_message(self, message: str) -> None:
+        """
+        Dispatch a message the receiver pushed.
+
+        Args:
+            message: The ISCP message.
+        """
+        if (update := decode_message(message)) is None:
+            _LOGGER.debug("Ignoring unknown message %s", message)
+            return
+        self._updates.async_dispatch(*update)
+
+    @property
+    def timing(self) -> ReceiverTiming:
+        """
+        Return the timing the connection is paced by.
+
+        Returns:
+            ReceiverTiming: The timing and quirks of the receiver model.
+        """
+        return self._timing
 
     @property
     def connected(self) -> bool:
@@ -71,6 +384,8 @@ class OnkyoConnectionManager:
                     self._receiver.command, command, *args
                 )
                 self._last_command_time = self.hass.loop.time()
+                if settle := self._settle_time(command, args):
+                    self._settle_until = self._last_command_time + settle
                 self._reconnect_attempt = 0  # Reset on success
                 return result
             except Exception as err:  # pylint: disable=broad-exception-caught
@@ -90,10 +405,43 @@ class OnkyoConnectionManager:
 
         Prevents flooding the receiver with requests.
         """
+        timing = self._timing
         now = self.hass.loop.time()
         elapsed = now - self._last_command_time
-        if elapsed < COMMAND_DELAY:
-            await asyncio.sleep(COMMAND_DELAY - elapsed)
+        delay = self._settle_until - now
+        if elapsed >= timing.command_interval:
+            self._burst = 0
+        elif self._burst + 1 < timing.max_pipelined_queries:
+            self._burst += 1
+        else:
+            self._burst = 0
+            delay = max(delay, timing.command_interval - elapsed)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _settle_time(self, command: str, args: tuple[Any, ...]) -> float:
+        """
+        Return the settle time the receiver needs after a command.
+
+        Args:
+            command: The command kind ("command" or "raw").
+            args: The command arguments.
+
+        Returns:
+            float: Seconds before the next command, 0 for normal commands.
+        """
+        slow_commands = self._timing.slow_commands
+        if not slow_commands or not args or not isinstance(args[0], str):
+            return 0.0
+        if command == "raw":
+            iscp = args[0]
+        else:
+            text = args[0] if command == "command" else f"{command}={args[0]}"
+            try:
+                iscp = command_to_iscp(text)
+            except Exception:  # pylint: disable=broad-exception-caught
+                return 0.0
+        return slow_commands.get(iscp[:3], 0.0)
 
     async def _async_reconnect(self) -> None:
         """
@@ -120,7 +468,7 @@ class OnkyoConnectionManager:
             _LOGGER.info("Reconnecting to Onkyo receiver...")
             # Test with a simple command
             result = await self.hass.async_add_executor_job(
-                self._receiver.command, "system-power", "query"
+                self._receiver.command, "system-power=query"
             )
             if result:
                 self._is_connected = True
@@ -137,6 +485,40 @@ class OnkyoConnectionManager:
                 self._is_connected = False
             raise
 
+    async def async_connect(self, timeout: float = CONNECTION_TIMEOUT) -> bool:
+        """
+        Open the connection with a power query, without any retry.
+
+        Meant to run in the background after setup; commands sent meanwhile
+        wait for it to finish.
+
+        Args:
+            timeout: Seconds to wait for the receiver to answer.
+
+        Returns:
+            bool: True if the receiver answered.
+        """
+        async with self._lock:
+            if self._is_connected:
+                return True
+            try:
+                await asyncio.wait_for(
+                    self.hass.async_add_executor_job(
+                        self._receiver.command, "system-power=query"
+                    ),
+                    timeout=timeout,
+                )
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                _LOGGER.debug("Initial connection failed: %s", err)
+                try:
+                    await self.hass.async_add_executor_job(self._receiver.disconnect)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    pass
+                return False
+            self._last_command_time = self.hass.loop.time()
+            self._is_connected = True
+            return True
+
     async def async_close(self) -> None:
         """
         Close the connection to the receiver.
@@ -144,9 +526,128 @@ class OnkyoConnectionManager:
         Ensures proper cleanup of resources.
         """
         _LOGGER.debug("Closing connection to Onkyo receiver.")
+        self._receiver.on_message = None
         try:
             await self.hass.async_add_executor_job(self._receiver.disconnect)
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOGGER.debug("Error during disconnect: %s", err)
         finally:
             self._is_connected = False
+
+
+def connection_key(host: str, port: int = EISCP_PORT) -> str:
+    """
+    Return the registry key of a receiver connection.
+
+    Args:
+        host: The hostname or IP address of the receiver.
+        port: The eISCP port of the receiver.
+
+    Returns:
+        str: The key, "host:port".
+    """
+    return f"{host}:{port}"
+
+
+class ConnectionRegistry:
+    """
+    Process-wide, reference-counted connections, one per receiver.
+
+    Many receivers accept only one or a few eISCP clients, so everything
+    talking to a receiver shares one connection manager and with it one
+    socket, command lock and pacing. The connection is closed when the last
+    user releases it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._sessions: dict[str, tuple[OnkyoConnectionManager, int]] = {}
+
+    @callback
+    def async_get(
+        self, host: str, port: int = EISCP_PORT
+    ) -> OnkyoConnectionManager | None:
+        """
+        Return the connection of a receiver without acquiring it.
+
+        Args:
+            host: The hostname or IP address of the receiver.
+            port: The eISCP port of the receiver.
+
+        Returns:
+            OnkyoConnectionManager | None: The connection, or None if nobody
+            holds one.
+        """
+        session = self._sessions.get(connection_key(host, port))
+        return session[0] if session is not None else None
+
+    @callback
+    def async_acquire(
+        self,
+        host: str,
+        create: Callable[[], OnkyoConnectionManager],
+        port: int = EISCP_PORT,
+    ) -> tuple[OnkyoConnectionManager, bool]:
+        """
+        Acquire the connection of a receiver, creating it if needed.
+
+        Args:
+            host: The hostname or IP address of the receiver.
+            create: Factory for the connection if nobody holds one yet.
+            port: The eISCP port of the receiver.
+
+        Returns:
+            tuple[OnkyoConnectionManager, bool]: The connection, and True if
+            it was created by this call.
+        """
+        key = connection_key(host, port)
+        if (session := self._sessions.get(key)) is not None:
+            manager, users = session
+            self._sessions[key] = (manager, users + 1)
+            _LOGGER.debug("Sharing connection to %s (%d users)", key, users + 1)
+            return manager, False
+
+        manager = create()
+        self._sessions[key] = (manager, 1)
+        return manager, True
+
+    async def async_release(self, manager: OnkyoConnectionManager) -> None:
+        """
+        Release a connection, closing it when its last user is gone.
+
+        Args:
+            manager: The connection returned by ``async_acquire``.
+        """
+        key = next(
+            (key for key, (held, _) in self._sessions.items() if held is manager),
+            None,
+        )
+        if key is None:
+            # Not (or no longer) registered: the caller is its only user
+            await manager.async_close()
+            return
+
+        users = self._sessions[key][1]
+        if users > 1:
+            self._sessions[key] = (manager, users - 1)
+            return
+        del self._sessions[key]
+        _LOGGER.debug("Closing connection to %s, its last user is gone", key)
+        await manager.async_close()
+
+
+@callback
+def async_get_connection_registry(hass: HomeAssistant) -> ConnectionRegistry:
+    """
+    Return the connection registry shared by all entries.
+
+    Args:
+        hass: The Home Assistant instance.
+
+    Returns:
+        ConnectionRegistry: The registry.
+    """
+    registry: ConnectionRegistry | None = hass.data.get(DATA_CONNECTIONS)
+    if registry is None:
+        registry = hass.data[DATA_CONNECTIONS] = ConnectionRegistry()
+    return registry
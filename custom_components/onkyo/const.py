@@ -11,6 +11,40 @@ from typing import Final
 DOMAIN: Final = "onkyo"
 """The domain identifier for this integration."""
 
+# Storage
+DATA_CACHE: Final = f"{DOMAIN}_cache"
+"""Key in hass.data for the integration-wide persistent cache."""
+
+DATA_PROBES: Final = f"{DOMAIN}_probes"
+"""Key in hass.data for config flow connections waiting to be set up."""
+
+PROBE_TTL: Final = 60
+"""Time in seconds a config flow connection waits for entry setup."""
+
+DATA_CONNECTIONS: Final = f"{DOMAIN}_connections"
+"""Key in hass.data for the process-wide receiver connection registry."""
+
+DATA_SCHEDULER: Final = f"{DOMAIN}_scheduler"
+"""Key in hass.data for the integration-wide startup scheduler."""
+
+STORAGE_KEY: Final = f"{DOMAIN}.cache"
+"""Storage key for the persistent cache."""
+
+STORAGE_VERSION: Final = 1
+"""Version of the persistent cache format."""
+
+STORAGE_SAVE_DELAY: Final = 10
+"""Delay in seconds before cache changes are written to disk."""
+
+LIST_CACHE_TTL: Final = 7 * 24 * 3600
+"""Time in seconds cached source and listening-mode lists stay valid."""
+
+LIST_SOURCES: Final = "sources"
+"""Cache kind for the receiver source list."""
+
+LIST_LISTENING_MODES: Final = "listening_modes"
+"""Cache kind for the receiver listening-mode list."""
+
 # Configuration
 CONF_RECEIVER_MAX_VOLUME: Final = "receiver_max_volume"
 """Configuration key for the receiver's maximum absolute volume setting."""
@@ -47,10 +81,17 @@ VOLUME_RESOLUTION_100: Final = 100
 VOLUME_RESOLUTION_200: Final = 200
 """Volume resolution for newer Onkyo receivers."""
 
+# Zones
+EXTRA_ZONES: Final = ("zone2", "zone3", "zone4")
+"""Zones besides the main zone that may be present on a receiver."""
+
 # Connection settings
 CONNECTION_TIMEOUT: Final = 10
 """Timeout in seconds for initial connection attempts."""
 
+STARTUP_CONCURRENCY: Final = 4
+"""Number of receivers that may connect or detect zones at the same time."""
+
 RECONNECT_DELAY_BASE: Final = 1
 """Base delay in seconds for reconnection backoff."""
 
@@ -60,6 +101,18 @@ RECONNECT_DELAY_MAX: Final = 60
 COMMAND_DELAY: Final = 0.15
 """Delay in seconds between consecutive commands."""
 
+POWER_ON_DELAY: Final = 1.5
+"""Time in seconds a receiver needs after power on before it answers queries."""
+
+POWER_ON_TIMEOUT: Final = 5.0
+"""Time in seconds to wait for a receiver to report power on."""
+
+STATE_WRITE_DELAY: Final = 0.03
+"""Window in seconds used to batch bursts of push updates into one state write."""
+
+ART_CACHE_SIZE: Final = 4 * 1024 * 1024
+"""Total size in bytes of the album art kept per receiver."""
+
 # Service names
 SERVICE_SELECT_HDMI_OUTPUT: Final = "select_hdmi_output"
 """Service name for selecting HDMI output."""
@@ -77,6 +130,9 @@ ATTR_VIDEO_INFORMATION: Final = "video_information"
 ATTR_PRESET: Final = "preset"
 """Attribute key for tuner preset."""
 
+ATTR_STALE: Final = "stale"
+"""Attribute key marking a state restored from before the last restart."""
+
 # HDMI Output options
 HDMI_OUTPUT_OPTIONS: Final = [
     "no",
@@ -91,10 +147,26 @@ HDMI_OUTPUT_OPTIONS: Final = [
 ]
 """List of valid HDMI output options."""
 
+# Dispatcher signals
+SIGNAL_OPTIONS_UPDATED: Final = "onkyo_options_updated_{}"
+"""Dispatcher signal (formatted with the entry ID) sent when options are applied."""
+
+SIGNAL_CONNECTED: Final = "onkyo_connected_{}"
+"""Dispatcher signal (formatted with the entry ID) sent once setup connected."""
+
+# Options that can be applied to running entities without a reload
+LIVE_OPTIONS: Final = frozenset(
+    {CONF_MAX_VOLUME, CONF_RECEIVER_MAX_VOLUME, CONF_SOURCES, CONF_VOLUME_RESOLUTION}
+)
+"""Option keys that entities apply in place when changed."""
+
 # Update intervals
 UPDATE_INTERVAL: Final = 30
 """Update interval in seconds for polling when push updates are not available."""
 
+PUSH_UPDATE_INTERVAL: Final = 300
+"""Update interval in seconds for models whose push updates are reliable."""
+
 # Error messages
 ERROR_CANNOT_CONNECT: Final = "cannot_connect"
 """Error string for connection failure."""
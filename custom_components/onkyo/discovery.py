@@ -0,0 +1,170 @@
+"""
+Asynchronous eISCP discovery of Onkyo and Pioneer receivers.
+
+A single UDP socket broadcasts the ``ECNQSTN`` query to every local IPv4
+broadcast address at once and collects the replies until a deadline, so a
+whole subnet is scanned in about a second without blocking the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import struct
+from dataclasses import dataclass
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+EISCP_PORT = 60128
+DISCOVERY_TIMEOUT = 1.0
+GLOBAL_BROADCAST = "255.255.255.255"
+
+# Onkyo receivers answer the "x" (any) category, Pioneer ones only "p"
+DISCOVERY_QUERIES = ("!xECNQSTN", "!pECNQSTN")
+
+_HEADER = struct.Struct(">4sIIB3x")
+_MAGIC = b"ISCP"
+_RESPONSE = "ECN"
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredReceiver:
+    """A receiver that answered the discovery query."""
+
+    host: str
+    port: int
+    model_name: str
+    region: str
+    identifier: str
+
+    @property
+    def mac(self) -> str:
+        """Return the MAC address part of the identifier."""
+        mac = self.identifier[:12].lower()
+        return ":".join(mac[i : i + 2] for i in range(0, len(mac), 2))
+
+
+def build_packet(message: str) -> bytes:
+    """
+    Return an eISCP packet carrying an ISCP message.
+
+    Args:
+        message: The ISCP message including the start character and the
+            unit type (e.g. "!xECNQSTN").
+
+    Returns:
+        bytes: The packet.
+    """
+    data = f"{message}\r".encode("ascii")
+    return _HEADER.pack(_MAGIC, _HEADER.size, len(data), 1) + data
+
+
+def parse_response(packet: bytes, host: str) -> DiscoveredReceiver | None:
+    """
+    Parse a discovery reply.
+
+    A reply carries ``!1ECN<model>/<port>/<region>/<identifier>`` where the
+    identifier starts with the MAC address of the receiver.
+
+    Args:
+        packet: The eISCP packet received.
+        host: The address the packet came from.
+
+    Returns:
+        DiscoveredReceiver | None: The receiver, or None if the packet is
+        not a discovery reply.
+    """
+    if len(packet) < _HEADER.size:
+        return None
+    magic, header_size, data_size, _version = _HEADER.unpack_from(packet)
+    if magic != _MAGIC:
+        return None
+    data = packet[header_size : header_size + data_size]
+    message = data.decode("ascii", "replace").rstrip("\x00\x1a\r\n")
+    if len(message) < 5 or message[2:5] != _RESPONSE:
+        return None
+
+    fields = message[5:].split("/")
+    if len(fields) < 4:
+        return None
+    model_name, port, region, identifier = (field.strip() for field in fields[:4])
+    try:
+        port_number = int(port)
+    except ValueError:
+        port_number = EISCP_PORT
+    return DiscoveredReceiver(host, port_number, model_name, region, identifier)
+
+
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Collect discovery replies, one per receiver."""
+
+    def __init__(self) -> None:
+        self.receivers: dict[str, DiscoveredReceiver] = {}
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Record a reply, ignoring our own broadcast and malformed packets."""
+        receiver = parse_response(data, addr[0])
+        if receiver is not None:
+            self.receivers.setdefault(receiver.identifier or addr[0], receiver)
+
+    def error_received(self, exc: Exception) -> None:
+        """Log errors sending to one of the broadcast addresses."""
+        _LOGGER.debug("Discovery socket error: %s", exc)
+
+
+async def _async_broadcast_addresses(hass: HomeAssistant) -> list[str]:
+    """Return the IPv4 broadcast addresses of the enabled interfaces."""
+    if "network" in hass.config.components:
+        from homeassistant.components import network
+
+        try:
+            addresses = await network.async_get_ipv4_broadcast_addresses(hass)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            _LOGGER.debug("Could not list broadcast addresses: %s", err)
+        else:
+            return sorted({str(address) for address in addresses} | {GLOBAL_BROADCAST})
+    return [GLOBAL_BROADCAST]
+
+
+async def async_discover(
+    hass: HomeAssistant, timeout: float = DISCOVERY_TIMEOUT
+) -> list[DiscoveredReceiver]:
+    """
+    Discover the receivers on the local networks.
+
+    Args:
+        hass: The Home Assistant instance.
+        timeout: Seconds to wait for replies.
+
+    Returns:
+        list[DiscoveredReceiver]: The receivers found, sorted by address.
+    """
+    addresses = await _async_broadcast_addresses(hass)
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    sock.setblocking(False)
+    try:
+        sock.bind(("", 0))
+    except OSError:
+        sock.close()
+        raise
+
+    transport, protocol = await hass.loop.create_datagram_endpoint(
+        _DiscoveryProtocol, sock=sock
+    )
+    try:
+        packets = [build_packet(query) for query in DISCOVERY_QUERIES]
+        for address in addresses:
+            for packet in packets:
+                transport.sendto(packet, (address, EISCP_PORT))
+        await asyncio.sleep(timeout)
+    finally:
+        transport.close()
+
+    receivers = sorted(protocol.receivers.values(), key=lambda r: r.host)
+    _LOGGER.debug("Discovered %d receiver(s): %s", len(receivers), receivers)
+    return receivers
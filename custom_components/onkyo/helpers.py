@@ -1,82 +1,289 @@
-"""Helpers to Onkyo media player."""
+"""
+Helpers to Onkyo media player.
+
+The model data modules are large, so they are only imported on first real
+use. They remain reachable as attributes of this module (e.g.
+``helpers.MODEL_SOURCES``) through the module ``__getattr__``.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from eiscp.commands import COMMANDS
 
-from .onkyo_model_mapping import MODEL_SOURCES
-from .receiver_profiles import RECEIVER_PROFILES
+from .profiles import (
+    DEFAULT_TIMING,
+    EMPTY_DEFAULTS,
+    ProfileDefaults,
+    ReceiverTiming,
+    get_receiver_profile,
+    resolve_mapped_model,
+)
+
+# Upper bound on the number of per-model catalogs kept in memory
+CATALOG_CACHE_SIZE = 64
+
+_SKIPPED_SOURCES = frozenset({"07", "08", "09", "up", "down", "query"})
+_SKIPPED_SOUND_MODES = frozenset({"up", "down", "query"})
+
+
+def __getattr__(name: str) -> Any:
+    """Load the large lookup tables on first access."""
+    if name == "RECEIVER_PROFILES":
+        from .receiver_profiles import RECEIVER_PROFILES
+
+        return RECEIVER_PROFILES
+    if name in ("MODEL_SOURCES", "MODEL_LISTENING_MODES"):
+        from . import onkyo_model_mapping
 
+        return getattr(onkyo_model_mapping, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def build_sources_list(model_name: str | None = None) -> dict:
+
+def get_profile_defaults(
+    model_name: str | None, fuzzy: bool = False
+) -> ProfileDefaults:
     """
-    Retrieve default sources from eISCP commands.
+    Return the HA defaults of a model's receiver profile.
 
-    Parses the eISCP command definitions to build a list of available
-    source selection commands and their descriptions.
+    Args:
+        model_name: The model name of the receiver, matched by its exact or
+            normalized name.
+        fuzzy: Fall back to the most similar profiled model, for defaults
+            the user confirms.
+
+    Returns:
+        ProfileDefaults: The profile defaults, or empty defaults if the
+        model has no profile.
+    """
+    profile = get_receiver_profile(model_name, fuzzy)
+    if profile is None:
+        return EMPTY_DEFAULTS
+    return profile.defaults
+
+
+def get_profile_timing(model_name: str | None) -> ReceiverTiming:
+    """
+    Return the timing and quirks of a model's receiver profile.
 
     Args:
-        model_name: The model name of the receiver. If provided, returns only
-                    sources supported by that model.
+        model_name: The model name of the receiver, matched by its exact or
+            normalized name.
 
     Returns:
-        dict: A dictionary mapping source identifiers to descriptions.
+        ReceiverTiming: The profile timing, or the global defaults if the
+        model has no profile.
     """
-    # Check if we have a detailed profile for this model
-    if model_name and model_name in RECEIVER_PROFILES:
-        profile = RECEIVER_PROFILES[model_name]
-        if "ha_defaults" in profile and "sources" in profile["ha_defaults"]:
-            # Use sources defined in the profile
-            # Swap keys/values if needed? The profile has 'bd': 'Blu-ray' which is correct (id: name)
-            return profile["ha_defaults"]["sources"]
+    profile = get_receiver_profile(model_name)
+    if profile is None:
+        return DEFAULT_TIMING
+    return profile.timing
 
-    sources_list = {}
-    model_specific_sources = None
 
-    if model_name and model_name in MODEL_SOURCES:
-        model_specific_sources = set(MODEL_SOURCES[model_name])
+def get_model_listening_modes(model_name: str | None) -> list[str] | None:
+    """
+    Return the generated listening-mode list of a model.
+
+    Args:
+        model_name: The model name of the receiver, matched by its exact or
+            normalized name.
 
+    Returns:
+        list[str] | None: The listening modes, or None if the model is not
+        in the generated mapping.
+    """
+    if (mapped := resolve_mapped_model(model_name)) is None:
+        return None
+    from .onkyo_model_mapping import MODEL_LISTENING_MODES
+
+    return MODEL_LISTENING_MODES[mapped]
+
+
+@lru_cache(maxsize=1)
+def _mapped_listening_modes() -> frozenset[str]:
+    """Return every listening mode of the generated mapping."""
+    from .onkyo_model_mapping import LISTENING_MODE_SETS
+
+    return frozenset(mode for modes in LISTENING_MODE_SETS.values() for mode in modes)
+
+
+def get_narrowed_listening_modes(model_name: str | None) -> list[str] | None:
+    """
+    Return the generated listening modes of a model if they rule any out.
+
+    A model whose set holds every mode of the mapping is not told apart from
+    any other, so its modes are better asked from the receiver.
+
+    Args:
+        model_name: The model name of the receiver, matched by its exact or
+            normalized name.
+
+    Returns:
+        list[str] | None: The listening modes, or None if the model is not
+        in the generated mapping or its set does not narrow it down.
+    """
+    if (modes := get_model_listening_modes(model_name)) is None:
+        return None
+    if len(modes) >= len(_mapped_listening_modes()):
+        return None
+    return modes
+
+
+@lru_cache(maxsize=1)
+def _all_sources() -> Mapping[str, str]:
+    """Return the catalog of every source known to eISCP."""
+    sources_list = {}
     for value in COMMANDS["main"]["SLI"]["values"].values():
         name = value["name"]
         desc = value["description"].replace("sets ", "")
         if isinstance(name, tuple):
             name = name[0]
-        if name in ["07", "08", "09", "up", "down", "query"]:
+        if name in _SKIPPED_SOURCES:
             continue
+        sources_list[name] = desc
+    return MappingProxyType(sources_list)
+
+
+@lru_cache(maxsize=CATALOG_CACHE_SIZE)
+def _model_sources(model_name: str | None) -> Mapping[str, str]:
+    """Return the source catalog of a model."""
+    # Check if we have a detailed profile for this model
+    profile_defaults = get_profile_defaults(model_name)
+    if profile_defaults.sources is not None:
+        # Use sources defined in the profile (id: name)
+        return profile_defaults.sources
+
+    all_sources = _all_sources()
+    if (mapped := resolve_mapped_model(model_name)) is None:
+        return all_sources
 
-        if model_specific_sources is not None:
-            # Check if this source is in the model's supported list
-            # The model_specific_sources contains the source name (not hex ID)
-            if name not in model_specific_sources:
-                continue
+    from .onkyo_model_mapping import MODEL_SOURCES
 
-        sources_list.update({name: desc})
-    return sources_list
+    # The model sources contain the source name (not hex ID)
+    model_specific_sources = frozenset(MODEL_SOURCES[mapped])
+    return MappingProxyType(
+        {
+            name: desc
+            for name, desc in all_sources.items()
+            if name in model_specific_sources
+        }
+    )
 
 
-def build_sounds_mode_list() -> dict:
+@lru_cache(maxsize=1)
+def _all_sound_modes() -> Mapping[str, str]:
+    """Return the catalog of every sound mode known to eISCP."""
+    sounds_list = set()
+    for value in COMMANDS["main"]["LMD"]["values"].values():
+        name = value["name"]
+        if isinstance(name, tuple):
+            name = name[-1]
+        if name in _SKIPPED_SOUND_MODES:
+            continue
+        sounds_list.add(name)
+    return MappingProxyType(
+        {name: name.replace("-", " ").title() for name in sorted(sounds_list)}
+    )
+
+
+@lru_cache(maxsize=CATALOG_CACHE_SIZE)
+def _model_sound_modes(model_name: str | None) -> Mapping[str, str]:
+    """Return the sound mode catalog of a model."""
+    all_sound_modes = _all_sound_modes()
+    model_modes = get_model_listening_modes(model_name)
+    if model_modes is None:
+        return all_sound_modes
+
+    model_specific_modes = frozenset(model_modes)
+    return MappingProxyType(
+        {
+            name: label
+            for name, label in all_sound_modes.items()
+            if name in model_specific_modes
+        }
+    )
+
+
+def clear_catalog_cache() -> None:
+    """Drop all memoized catalogs so they are rebuilt on next use."""
+    _all_sources.cache_clear()
+    _model_sources.cache_clear()
+    _all_sound_modes.cache_clear()
+    _model_sound_modes.cache_clear()
+
+
+def build_sources_list(model_name: str | None = None) -> Mapping[str, str]:
     """
-    Retrieve sound mode list from eISCP commands.
+    Retrieve default sources from eISCP commands.
 
     Parses the eISCP command definitions to build a list of available
-    sound mode commands.
+    source selection commands and their descriptions. The result is built
+    on first use and memoized per model, so it is returned read-only;
+    copy it with ``dict()`` before modifying or storing it.
+
+    Args:
+        model_name: The model name of the receiver. If provided, returns only
+                    sources supported by that model.
 
     Returns:
-        dict: A dictionary mapping sound mode identifiers to readable names.
+        Mapping[str, str]: A read-only mapping of source identifiers to
+        descriptions.
     """
-    sounds_list = []
-    for value in COMMANDS["main"]["LMD"]["values"].values():
+    return _model_sources(model_name)
+
+
+def build_receiver_sources(
+    selectors: Iterable[tuple[str, str]],
+) -> dict[str, str]:
+    """
+    Build the source list from the input selectors a receiver reported.
+
+    Uses the names the receiver shows, which include any the user renamed
+    on the receiver itself.
+
+    Args:
+        selectors: Pairs of ISCP selector code (e.g. "10") and name, as read
+            from the NRI information of the receiver.
+
+    Returns:
+        dict[str, str]: Source identifiers mapped to the receiver's names,
+        leaving out codes eISCP does not know.
+    """
+    values = COMMANDS["main"]["SLI"]["values"]
+    sources = {}
+    for code, display_name in selectors:
+        if (value := values.get(code)) is None:
+            continue
         name = value["name"]
         if isinstance(name, tuple):
-            name = name[-1]
-        if name in ["up", "down", "query"]:
+            name = name[0]
+        if name in _SKIPPED_SOURCES:
             continue
-        sounds_list.append(name)
-    sounds_list = list(set(sounds_list))
-    sounds_list.sort()
-    return {name: name.replace("-", " ").title() for name in sounds_list}
+        sources[name] = display_name or _all_sources().get(name, name)
+    return sources
+
+
+def build_sounds_mode_list(model_name: str | None = None) -> Mapping[str, str]:
+    """
+    Retrieve sound mode list from eISCP commands.
+
+    Parses the eISCP command definitions to build a list of available
+    sound mode commands. The result is memoized per model and returned
+    read-only.
+
+    Args:
+        model_name: The model name of the receiver. If provided, returns only
+                    sound modes supported by that model.
+
+    Returns:
+        Mapping[str, str]: A read-only mapping of sound mode identifiers to
+        readable names.
+    """
+    return _model_sound_modes(model_name)
 
 
 def build_selected_dict(
@@ -93,9 +300,11 @@ def build_selected_dict(
         dict[str, str]: A filtered dictionary of sources or sound modes.
     """
     if sources:
-        return {k: v for k, v in build_sources_list().items() if k in sources}
+        catalog = _all_sources()
+        return {k: v for k, v in catalog.items() if k in sources}
     if sounds:
-        return {k: v for k, v in build_sounds_mode_list().items() if k in sounds}
+        catalog = _all_sound_modes()
+        return {k: v for k, v in catalog.items() if k in sounds}
     return {}
 
 
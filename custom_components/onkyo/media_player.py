@@ -15,31 +15,101 @@ Key Features:
 
 import asyncio
 import logging
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.media_player import (
+    ATTR_INPUT_SOURCE,
+    ATTR_MEDIA_VOLUME_LEVEL,
+    ATTR_MEDIA_VOLUME_MUTED,
+    BrowseMedia,
     MediaPlayerDeviceClass,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
+    MediaType,
 )
+from homeassistant.components.media_player.errors import BrowseError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
+
+from .art import (
+    ART_COMMAND,
+    ArtAssembler,
+    ArtCache,
+    digest,
+    starts_image,
+    track_key,
+)
+from .browse import (
+    LIST_INFO,
+    LIST_TITLE,
+    NET_MEDIA_TYPE,
+    NET_ROOT,
+    NetListBrowser,
+    build_browse_media,
+    parse_content_id,
+)
+from .cache import ReceiverLists, async_get_cache, topology_key
+from .capabilities import get_capabilities, model_supports
+from .coalescer import StateWriteCoalescer
 from .connection import OnkyoConnectionManager
 from .const import (
+    ART_CACHE_SIZE,
     ATTR_HDMI_OUTPUT,
-    CONF_MAX_VOLUME,
-    CONF_VOLUME_RESOLUTION,
+    ATTR_STALE,
+    CONF_SOURCES,
     DOMAIN,
+    EXTRA_ZONES,
     HDMI_OUTPUT_OPTIONS,
+    LIST_LISTENING_MODES,
+    LIST_SOURCES,
+    PUSH_UPDATE_INTERVAL,
+    SIGNAL_CONNECTED,
+    SIGNAL_OPTIONS_UPDATED,
+    UPDATE_INTERVAL,
+)
+from .helpers import (
+    get_narrowed_listening_modes,
+    get_profile_defaults,
+    get_profile_timing,
 )
-from .receiver_profiles import RECEIVER_PROFILES
+from .now_playing import (
+    NET_ZONE,
+    NOW_PLAYING_COMMANDS,
+    STATUS_PAUSED,
+    STATUS_PLAYING,
+    NowPlaying,
+)
+from .scheduler import (
+    StartupScheduler,
+    async_get_scheduler,
+    async_track_phased_interval,
+    poll_offset,
+)
+from .state import ZoneState
+from .volume import volume_table_for_entry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Push updates handled by _handle_receiver_update
+PUSH_COMMANDS = ("power", "volume", "muting", "input-selector", "selector")
+
+# Sources that show the NET menus
+NET_SOURCES = frozenset({"net", "network", "usb", "bluetooth"})
+
+# States shown while a network source plays
+_PLAY_STATES: dict[str | None, MediaPlayerState] = {
+    STATUS_PLAYING: MediaPlayerState.PLAYING,
+    STATUS_PAUSED: MediaPlayerState.PAUSED,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -60,97 +130,172 @@ async def async_setup_entry(
     receiver_data = hass.data[DOMAIN][entry.entry_id]
     receiver = receiver_data["receiver"]
     connection_manager = receiver_data["connection_manager"]
+    receiver_lists = receiver_data.get("lists")
     name = receiver_data["name"]
 
+    def _create_entity(zone_name: str, entity_name: str) -> OnkyoMediaPlayer:
+        return OnkyoMediaPlayer(
+            receiver=receiver,
+            connection_manager=connection_manager,
+            name=entity_name,
+            zone=zone_name,
+            hass=hass,
+            entry=entry,
+            receiver_lists=receiver_lists,
+        )
+
+    # Zones detected on a previous start are used right away and only
+    # revalidated in the background, as are zones of an unreachable receiver
+    cache = await async_get_cache(hass)
+    model_name = entry.data.get("model_name")
+    cache_key = topology_key(model_name, entry.data.get("firmware"))
+    cached_zones = cache.async_get_zones(entry.entry_id, cache_key)
+    known_zones = cached_zones
+
     entities = []
 
     try:
-        # Try to detect available zones via connection manager
-        # Note: We moved detection to connection manager or keep it local but robust
-        # Using the connection manager to detect zones safely
-        zones_detected = await _detect_zones_safe(connection_manager)
-
-        _LOGGER.debug("Detected zones: %s", zones_detected)
+        if cached_zones is not None:
+            zones_detected = cached_zones
+            _LOGGER.debug("Using cached zones for %s: %s", name, zones_detected)
+        elif (probed_zones := receiver_data.get("zones")) is not None:
+            # The config flow already probed the zones of the receiver
+            zones_detected = probed_zones
+            _LOGGER.debug("Using probed zones for %s: %s", name, zones_detected)
+            cache.async_set_zones(entry.entry_id, cache_key, zones_detected)
+        elif not connection_manager.connected:
+            # Don't wait for the receiver; other zones follow once it answers
+            zones_detected = known_zones = ["main"]
+            _LOGGER.debug("Detecting zones of %s in the background", name)
+        else:
+            # Try to detect available zones via connection manager, in turn
+            # with the startup work of the other receivers
+            async with async_get_scheduler(hass).async_slot():
+                zones_detected = await _detect_zones_safe(
+                    connection_manager, model_name
+                )
+            _LOGGER.debug("Detected zones: %s", zones_detected)
+            if connection_manager.connected:
+                cache.async_set_zones(entry.entry_id, cache_key, zones_detected)
 
         # Create entity for each detected zone
         for zone_name in zones_detected:
-            entity = OnkyoMediaPlayer(
-                receiver=receiver,
-                connection_manager=connection_manager,
-                name=f"{name} {zone_name}",
-                zone=zone_name,
-                hass=hass,
-                entry=entry,
-            )
-            entities.append(entity)
+            entities.append(_create_entity(zone_name, f"{name} {zone_name}"))
 
         if not entities:
             # No zones detected - create main zone anyway
             _LOGGER.info("No zones detected for %s, creating main zone entity", name)
-            entity = OnkyoMediaPlayer(
-                receiver=receiver,
-                connection_manager=connection_manager,
-                name=name,
-                zone="main",
-                hass=hass,
-                entry=entry,
-            )
-            entities.append(entity)
+            entities.append(_create_entity("main", name))
 
     except Exception as err:  # pylint: disable=broad-exception-caught
         _LOGGER.warning(
             "Error detecting zones for %s: %s. Creating main zone only.", name, err
         )
         # Create at least the main zone so integration doesn't completely fail
-        entity = OnkyoMediaPlayer(
-            receiver=receiver,
-            connection_manager=connection_manager,
-            name=name,
-            zone="main",
-            hass=hass,
-            entry=entry,
-        )
-        entities.append(entity)
+        entities.append(_create_entity("main", name))
 
     async_add_entities(entities)
 
+    if known_zones is not None:
+        entry.async_create_background_task(
+            hass,
+            _async_revalidate_zones(
+                async_get_scheduler(hass),
+                connection_manager,
+                model_name,
+                known_zones,
+                lambda zones: cache.async_set_zones(entry.entry_id, cache_key, zones),
+                lambda zones: async_add_entities(
+                    [_create_entity(zone, f"{name} {zone}") for zone in zones]
+                ),
+            ),
+            f"Revalidate Onkyo zones for {name}",
+        )
+
 
-async def _detect_zones_safe(connection_manager: OnkyoConnectionManager) -> list[str]:
+def _source_filter(options: Mapping[str, Any]) -> frozenset[str] | None:
+    """
+    Return the sources selected in the options.
+
+    Args:
+        options: The config entry options.
+
+    Returns:
+        frozenset[str] | None: The selected source identifiers, or None to
+        list every source.
+    """
+    if not (sources := options.get(CONF_SOURCES)):
+        return None
+    return frozenset(sources)
+
+
+async def _async_revalidate_zones(
+    scheduler: StartupScheduler,
+    connection_manager: OnkyoConnectionManager,
+    model_name: str | None,
+    known_zones: list[str],
+    store_zones: Callable[[list[str]], None],
+    add_zones: Callable[[list[str]], None],
+) -> None:
+    """
+    Re-run zone detection in the background and apply any differences.
+
+    Newly found zones get entities right away; zones that disappeared are
+    dropped from the cache and are no longer created on the next start.
+    Detection waits for a slot of the startup scheduler.
+
+    Args:
+        scheduler: The startup scheduler shared by all receivers.
+        connection_manager: The connection manager instance.
+        model_name: The receiver model name, if known.
+        known_zones: The zones entities were created for.
+        store_zones: Callback storing the detected zones in the cache.
+        add_zones: Callback creating entities for new zones.
+    """
+    async with scheduler.async_slot():
+        zones = await _detect_zones_safe(connection_manager, model_name)
+    if not connection_manager.connected or zones == known_zones:
+        return
+
+    _LOGGER.info("Receiver zones changed from %s to %s", known_zones, zones)
+    store_zones(zones)
+    if new_zones := [zone for zone in zones if zone not in known_zones]:
+        add_zones(new_zones)
+
+
+async def _detect_zones_safe(
+    connection_manager: OnkyoConnectionManager, model_name: str | None = None
+) -> list[str]:
     """
     Safely detect available zones using connection manager.
 
+    Zones the model is known not to have are not probed, as the receiver
+    would only let the query time out.
+
     Args:
         connection_manager: The connection manager instance.
+        model_name: The receiver model name, if known.
 
     Returns:
         list[str]: list of zone names, or ["main"] if detection fails.
     """
     try:
-        # Query receiver for available zones
-        zones = []
-
         # Main zone always exists
-        zones.append("main")
-
-        # Check for Zone 2
-        try:
-            zone2_power = await connection_manager.async_send_command(
-                "command", "zone2.power=query"
-            )
-            if zone2_power:
-                zones.append("zone2")
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
+        zones = ["main"]
 
-        # Check for Zone 3
-        try:
-            zone3_power = await connection_manager.async_send_command(
-                "command", "zone3.power=query"
-            )
-            if zone3_power:
-                zones.append("zone3")
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
+        # Query receiver for the other zones
+        capabilities = get_capabilities(model_name)
+        for zone in EXTRA_ZONES:
+            if capabilities and not capabilities.supports_zone(zone):
+                continue
+            try:
+                zone_power = await connection_manager.async_send_command(
+                    "command", f"{zone}.power=query"
+                )
+                if zone_power:
+                    zones.append(zone)
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
 
         return zones
 
@@ -160,7 +305,7 @@ async def _detect_zones_safe(connection_manager: OnkyoConnectionManager) -> list
 
 
 # pylint: disable=abstract-method
-class OnkyoMediaPlayer(MediaPlayerEntity):
+class OnkyoMediaPlayer(MediaPlayerEntity, RestoreEntity):
     """
     Representation of an Onkyo media player.
 
@@ -169,9 +314,11 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
     - Graceful empty list handling (Issue #125768 fix)
     - Robust error recovery
     - Proper state management
+    - Restored, stale-marked state until the receiver first answers
     """
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
     _attr_device_class = MediaPlayerDeviceClass.RECEIVER
     _attr_supported_features = (
         MediaPlayerEntityFeature.TURN_ON
@@ -191,6 +338,7 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         zone: str,
         hass: HomeAssistant,
         entry: ConfigEntry,
+        receiver_lists: ReceiverLists | None = None,
     ) -> None:
         """
         Initialize the media player.
@@ -202,28 +350,58 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             zone: The zone identifier.
             hass: The Home Assistant instance.
             entry: The configuration entry.
+            receiver_lists: Source and listening-mode lists shared by zones.
         """
         self._receiver = receiver
         self._attr_name = name
         self._zone = zone
         self._entry = entry
 
-        # Use shared connection manager
+        # Use shared connection manager and receiver lists
         self._conn_manager = connection_manager
-
-        # State variables
+        self._receiver_lists = receiver_lists
+        # List queries at startup take turns with the other receivers
+        self._scheduler = async_get_scheduler(hass)
+
+        # State variables, tracked by a versioned zone state so writes and
+        # attribute rebuilds only happen when something actually changed.
+        # Lists may be empty (Issue #125768 fix)
+        self._zone_state = ZoneState(state=MediaPlayerState.OFF)
+        # Track of the network sources, pushed by the receiver, and its art:
+        # the key of the image shown and, for art sent as a link, its URL.
+        # Art may arrive ahead of its title; the track changes tell whether
+        # the image being assembled belongs to the playing track
+        self._now_playing = NowPlaying()
+        self._track_key: str | None = None
+        self._track_changes = 0
+        self._art_assembler = ArtAssembler()
+        self._art_cache = ArtCache(ART_CACHE_SIZE)
+        self._art_key: str | None = None
+        self._art_url: str | None = None
+        self._art_track_changes = 0
+        self._art_owner: str | None = None
+        self._art_skip = False
+        self._art_pending: str | None = None
+        # NET menus, which only the main zone shows
+        self._browser: NetListBrowser | None = None
+        if zone == "main":
+            self._browser = NetListBrowser(hass, connection_manager)
+            self._attr_supported_features = (
+                self._attr_supported_features | MediaPlayerEntityFeature.BROWSE_MEDIA
+            )
         self._attr_state = MediaPlayerState.OFF
         self._attr_available = False
         self._attr_volume_level: float | None = None
         self._attr_is_volume_muted: bool = False
         self._attr_source: str | None = None
-
-        # Lists that may be empty (Issue #125768 fix)
         self._attr_source_list: list[str] = []
-        self._listening_modes: list[str] = []
 
-        # Extra attributes
-        self._attr_extra_state_attributes: dict[str, Any] = {}
+        # Set while showing the state restored from before the last restart
+        self._stale = False
+
+        # Extra attributes, rebuilt only when an attribute field changes
+        self._extra_attributes: dict[str, Any] = {}
+        self._extra_attributes_version = -1
 
         # Unique ID based on receiver and zone
         host = entry.data.get("host", "unknown")
@@ -231,6 +409,7 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
 
         # Get model name for profile lookup
         self._model_name = entry.data.get("model_name")
+        self._timing = get_profile_timing(self._model_name)
 
         # Device info for grouping zones
         self._attr_device_info = DeviceInfo(
@@ -240,21 +419,127 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             model="Network Receiver",
         )
 
-        # Cache volume settings to avoid repeated config lookups
-        self._max_volume = entry.options.get(
-            CONF_MAX_VOLUME, entry.data.get(CONF_MAX_VOLUME, 100)
+        # Precomputed volume conversion table (shared by zones of the entry)
+        self._volume_table = volume_table_for_entry(entry.options, entry.data)
+
+        # Sources selected in the options; the filtered list is memoized
+        # against the unfiltered list it was built from
+        self._source_filter = _source_filter(entry.options)
+        self._filtered_sources: tuple[list[str] | None, list[str]] = (None, [])
+        self._options_version = 0
+
+        # Batch bursts of push updates into a single state write
+        self._write_coalescer = StateWriteCoalescer(
+            hass, self._async_write_changes, self._state_snapshot
         )
-        self._volume_resolution = entry.options.get(
-            CONF_VOLUME_RESOLUTION, entry.data.get(CONF_VOLUME_RESOLUTION, 80)
+
+    @property
+    def _listening_modes(self) -> list[str]:
+        """Return the listening modes of the zone."""
+        return self._zone_state.listening_modes
+
+    def _update_state(self, **changes: Any) -> frozenset[str]:
+        """
+        Apply state changes to the zone state and the entity attributes.
+
+        Args:
+            **changes: Zone state field names and their new values.
+
+        Returns:
+            frozenset[str]: The names of the fields that actually changed.
+        """
+        changed = self._zone_state.update(**changes)
+        if "available" in changes:
+            # The receiver answered (or failed to): the state is current
+            self._stale = False
+        for name, value in changes.items():
+            if name not in ZoneState.ATTRIBUTE_FIELDS:
+                setattr(self, f"_attr_{name}", value)
+        return changed
+
+    @callback
+    def _async_write_changes(self) -> None:
+        """Write the state to Home Assistant and reset the change set."""
+        changed = self._zone_state.pop_changes()
+        _LOGGER.debug(
+            "Writing state for %s (changed: %s)",
+            self._attr_name,
+            ", ".join(sorted(changed)) or "availability",
         )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Write the state now if anything exposed changed since the last write."""
+        self._write_coalescer.async_flush()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
 
-        # Register callback for receiver updates if using local_push
-        if hasattr(self._receiver, "register_callback"):
-            self._receiver.register_callback(self._handle_receiver_update)
+        # Receive the push updates of our zone; the connection routes each
+        # update to the entities of its zone and command only
+        updates = self._conn_manager.updates
+        for command in PUSH_COMMANDS:
+            self.async_on_remove(
+                updates.async_subscribe(
+                    self._zone, command, self._handle_receiver_update
+                )
+            )
+        if self._zone == "main":
+            for command in NOW_PLAYING_COMMANDS:
+                self.async_on_remove(
+                    updates.async_subscribe(NET_ZONE, command, self._handle_now_playing)
+                )
+            self.async_on_remove(
+                updates.async_subscribe(NET_ZONE, ART_COMMAND, self._handle_jacket_art)
+            )
+        if self._browser is not None:
+            for command, handler in (
+                (LIST_TITLE, self._browser.handle_list_title),
+                (LIST_INFO, self._browser.handle_list_info),
+            ):
+                self.async_on_remove(
+                    updates.async_subscribe(NET_ZONE, command, handler)
+                )
+
+        # Apply volume option changes without reloading the entry
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self._entry.entry_id),
+                self._async_options_updated,
+            )
+        )
+
+        # Refresh the restored state as soon as setup reaches the receiver
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_CONNECTED.format(self._entry.entry_id),
+                self._async_connected,
+            )
+        )
+
+        # Poll ourselves so unchanged polls don't produce state writes; models
+        # with reliable push updates only need an occasional safety poll.
+        # Each receiver polls at its own phase so receivers don't poll in sync
+        interval = (
+            PUSH_UPDATE_INTERVAL if self._timing.reliable_push else UPDATE_INTERVAL
+        )
+        self.async_on_remove(
+            async_track_phased_interval(
+                self.hass,
+                self._async_poll,
+                timedelta(seconds=interval),
+                poll_offset(self._entry.data.get("host", ""), interval),
+            )
+        )
+
+        if not self._conn_manager.connected:
+            # Don't hold up startup; show the last known state meanwhile
+            await self._async_restore_state()
+            return
 
         # Fetch initial data
         try:
@@ -267,6 +552,60 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
                 err,
             )
 
+    async def _async_restore_state(self) -> None:
+        """Restore the state from before the last restart, marked stale."""
+        last_state = await self.async_get_last_state()
+        if last_state is None:
+            return
+        if last_state.state in _PLAY_STATES.values():
+            # The track is not restored; it is pushed again when it plays
+            state = MediaPlayerState.ON
+        elif last_state.state in (MediaPlayerState.ON, MediaPlayerState.OFF):
+            state = MediaPlayerState(last_state.state)
+        else:
+            return
+
+        attributes = last_state.attributes
+        self._update_state(
+            state=state,
+            volume_level=attributes.get(ATTR_MEDIA_VOLUME_LEVEL),
+            is_volume_muted=bool(attributes.get(ATTR_MEDIA_VOLUME_MUTED)),
+            source=attributes.get(ATTR_INPUT_SOURCE),
+        )
+        self._stale = True
+        _LOGGER.debug("Restored %s state for %s", last_state.state, self._attr_name)
+
+    @callback
+    def _async_connected(self) -> None:
+        """Replace the restored state once setup connected to the receiver."""
+        self.hass.async_create_task(self._async_poll())
+
+    async def _async_poll(self, _now: datetime | None = None) -> None:
+        """Poll the receiver and write state only if something changed."""
+        await self.async_update()
+        self._async_write_state()
+
+    @callback
+    def _async_options_updated(self) -> None:
+        """Apply changed options in place, keeping the connection and caches."""
+        self._source_filter = _source_filter(self._entry.options)
+        self._filtered_sources = (None, [])
+        self._options_version += 1
+
+        self._volume_table = volume_table_for_entry(
+            self._entry.options, self._entry.data
+        )
+        _LOGGER.debug(
+            "Rebuilt volume table for %s (resolution %d, max %d%%)",
+            self._attr_name,
+            self._volume_table.resolution,
+            self._volume_table.max_volume,
+        )
+        volume_raw = self._zone_state.volume_raw
+        if volume_raw is not None:
+            self._update_state(volume_level=self._receiver_volume_to_ha(volume_raw))
+        self._async_write_state()
+
     @callback
     def _handle_receiver_update(self, zone: str, command: str, value: Any) -> None:
         """
@@ -287,10 +626,12 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         # Update state based on command
         if command == "power":
             previous_state = self._attr_state
-            self._attr_state = (
-                MediaPlayerState.ON if value == "on" else MediaPlayerState.OFF
+            self._update_state(
+                state=MediaPlayerState.ON if value == "on" else MediaPlayerState.OFF,
+                available=True,
             )
-            self._attr_available = True
+            if value != "on" and self._now_playing.clear():
+                self._async_track_changed()
 
             # Trigger full update when power turns ON to ensure volume/source
             # are correct
@@ -303,21 +644,156 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         elif command == "volume":
             try:
                 volume = int(value)
-                self._attr_volume_level = self._receiver_volume_to_ha(volume)
+                self._update_state(
+                    volume_raw=volume,
+                    volume_level=self._receiver_volume_to_ha(volume),
+                )
             except (ValueError, TypeError):
                 _LOGGER.debug("Received non-numeric volume update: %s", value)
 
         elif command == "muting":
-            self._attr_is_volume_muted = value == "on"
+            self._update_state(is_volume_muted=value == "on")
 
         elif command == "input-selector" or command == "selector":
-            if isinstance(value, tuple):
-                self._attr_source = value[0]
-            else:
-                self._attr_source = str(value)
+            self._set_source(value[0] if isinstance(value, tuple) else str(value))
+            self._check_source_list()
 
-        # Schedule UI update
-        self.async_write_ha_state()
+        # Schedule UI update, batched with the rest of the burst
+        self._write_coalescer.async_schedule()
+
+    @callback
+    def _set_source(self, source: Any) -> None:
+        """
+        Apply the current source, pushed or polled.
+
+        Args:
+            source: The source name.
+        """
+        if "source" not in self._update_state(source=source):
+            return
+        if self._now_playing.clear():
+            # The track belonged to the previous source
+            self._async_track_changed()
+        if self._browser is not None:
+            self._browser.async_invalidate()
+
+    @callback
+    def _handle_now_playing(self, zone: str, command: str, value: Any) -> None:
+        """
+        Handle the now-playing updates of the network sources.
+
+        The elapsed time arrives every second but only changes the state
+        when it drifts from the position Home Assistant interpolates.
+
+        Args:
+            zone: The zone of the update.
+            command: The eISCP command name.
+            value: The new value.
+        """
+        if self._now_playing.update(command, value, dt_util.utcnow()):
+            self._async_track_changed()
+            self._write_coalescer.async_schedule()
+
+    @callback
+    def _async_track_changed(self) -> None:
+        """Show the art of a track that played before right away."""
+        now_playing = self._now_playing
+        key = track_key(now_playing.artist, now_playing.title, now_playing.album)
+        if key == self._track_key:
+            return
+        self._track_key = key
+        self._track_changes += 1
+        if key in self._art_cache:
+            self._art_key = key
+            self._art_url = None
+        elif (pending := self._art_pending) is not None and key is not None:
+            # The art arrived ahead of this title
+            if (image := self._art_cache.get(pending)) is not None:
+                self._art_cache.put(key, *image)
+            self._art_key = key
+        else:
+            self._art_key = self._art_url = None
+        self._art_pending = None
+
+    @callback
+    def _handle_jacket_art(self, zone: str, command: str, value: Any) -> None:
+        """
+        Handle the jacket art messages of the network sources.
+
+        An image started after the title belongs to the playing track and
+        is not assembled again if that track's art is cached. An image
+        started before the title is keyed once it is complete, to the
+        title if it has arrived by then and otherwise to the next one.
+
+        Args:
+            zone: The zone of the update.
+            command: The eISCP command name.
+            value: The message value.
+        """
+        if not isinstance(value, str):
+            return
+        if starts_image(value):
+            owner = None
+            if self._art_track_changes != self._track_changes:
+                owner = self._track_key
+            self._art_track_changes = self._track_changes
+            self._art_owner = owner
+            self._art_skip = owner is not None and owner in self._art_cache
+        if self._art_skip or (art := self._art_assembler.feed(value)) is None:
+            return
+
+        owner = self._art_owner
+        if owner is None and self._art_track_changes != self._track_changes:
+            owner = self._track_key
+        self._art_track_changes = self._track_changes
+        key: str | None
+        if art.content is not None and art.content_type is not None:
+            key = owner or digest(art.content)
+            self._art_cache.put(key, art.content, art.content_type)
+            self._art_url = None
+        elif art.url is not None:
+            key = owner or digest(art.url.encode())
+            self._art_url = art.url
+        else:
+            key = self._art_url = None
+        self._art_key = key
+        self._art_pending = key if owner is None else None
+        self._write_coalescer.async_schedule()
+
+    @callback
+    def _check_source_list(self) -> None:
+        """
+        Invalidate a stored source list that does not know the current source.
+
+        A list restored from storage may predate a receiver configuration
+        change; the receiver reporting a source outside it is the signal to
+        query it again on the next update.
+        """
+        source_list = self._attr_source_list
+        if (
+            self._receiver_lists is None
+            or not source_list
+            or self._attr_source in source_list
+        ):
+            return
+        if self._receiver_lists.async_invalidate(LIST_SOURCES, only_stored=True):
+            self._update_state(source_list=[])
+
+    def _state_snapshot(self) -> tuple:
+        """
+        Return a comparable view of the state exposed to Home Assistant.
+
+        Returns:
+            tuple: The exposed state values.
+        """
+        return (
+            self._zone_state.version,
+            self._now_playing.version,
+            self._art_key,
+            self.available,
+            self._stale,
+            self._options_version,
+        )
 
     async def async_update(self) -> None:
         """
@@ -329,7 +805,7 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             await self._async_update_all()
         except OSError as err:
             _LOGGER.debug("Update failed for %s: %s", self._attr_name, err)
-            self._attr_available = False
+            self._update_state(available=False)
 
     async def _async_update_all(self) -> None:
         """Fetch all data from receiver."""
@@ -337,8 +813,7 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         power_state = await self._async_get_power_state()
 
         if power_state == "on":
-            self._attr_state = MediaPlayerState.ON
-            self._attr_available = True
+            self._update_state(state=MediaPlayerState.ON, available=True)
 
             # Fetch other state when powered on
             await self._async_update_volume()
@@ -353,11 +828,10 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
                 await self._async_fetch_listening_modes()
 
         elif power_state == "standby":
-            self._attr_state = MediaPlayerState.OFF
-            self._attr_available = True
+            self._update_state(state=MediaPlayerState.OFF, available=True)
         else:
             # Unknown state - might be disconnected
-            self._attr_available = False
+            self._update_state(available=False)
 
     async def _async_get_power_state(self) -> str:
         """
@@ -402,7 +876,10 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
                         volume_raw = result[1]
 
                     volume = int(volume_raw)
-                    self._attr_volume_level = self._receiver_volume_to_ha(volume)
+                    self._update_state(
+                        volume_raw=volume,
+                        volume_level=self._receiver_volume_to_ha(volume),
+                    )
                 except (ValueError, TypeError):
                     _LOGGER.debug("Received non-numeric volume value: %s", result)
 
@@ -426,13 +903,13 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
                     and isinstance(result[1], tuple)
                 ):
                     if result[1]:
-                        self._attr_source = result[1][0]
+                        self._set_source(result[1][0])
                 elif isinstance(result, tuple) and len(result) >= 2:
-                    self._attr_source = result[1]
+                    self._set_source(result[1])
                 elif isinstance(result, tuple):
-                    self._attr_source = result[0]
+                    self._set_source(result[0])
                 else:
-                    self._attr_source = str(result)
+                    self._set_source(str(result))
 
         except OSError as err:
             _LOGGER.debug("Failed to update source: %s", err)
@@ -448,11 +925,41 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             result = await self._conn_manager.async_send_command("command", command)
 
             if result:
-                self._attr_is_volume_muted = str(result) == "on"
+                self._update_state(is_volume_muted=str(result) == "on")
 
         except OSError as err:
             _LOGGER.debug("Failed to update mute state: %s", err)
 
+    async def _async_get_list(
+        self, kind: str, command: str, query: str
+    ) -> Sequence[str] | None:
+        """
+        Return a receiver list, shared between zones when possible.
+
+        Args:
+            kind: The list kind (sources or listening modes).
+            command: The ISCP command the list belongs to (e.g. "LMD"); the
+                query is skipped if the model is known not to support it.
+            query: The raw query command for the list.
+
+        Returns:
+            Sequence[str] | None: The list, or None if none was returned.
+        """
+
+        async def _async_query() -> list[str] | None:
+            if not model_supports(self._model_name, "main", command, "QSTN"):
+                _LOGGER.debug("%s does not support %s", self._model_name, query)
+                return None
+            async with self._scheduler.async_slot():
+                result = await self._conn_manager.async_send_command("raw", query)
+            if result and isinstance(result, dict):
+                return list(result.keys())
+            return None
+
+        if self._receiver_lists is None:
+            return await _async_query()
+        return await self._receiver_lists.async_get(kind, _async_query)
+
     async def _async_fetch_source_list(self) -> None:
         """
         Fetch list of available sources.
@@ -460,11 +967,11 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         Issue #125768 fix: Gracefully handle empty or unavailable lists.
         """
         try:
-            # Get input sources from receiver
-            sources = await self._conn_manager.async_send_command("raw", "SLIQSTN")
+            # Get input sources from the shared receiver lists or the receiver
+            sources = await self._async_get_list(LIST_SOURCES, "SLI", "SLIQSTN")
 
-            if sources and isinstance(sources, dict):
-                self._attr_source_list = list(sources.keys())
+            if sources:
+                self._update_state(source_list=sources)
                 _LOGGER.debug(
                     "Loaded %d sources for %s",
                     len(self._attr_source_list),
@@ -474,27 +981,33 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
                 _LOGGER.info(
                     "No sources returned for %s. This may be normal.", self._attr_name
                 )
-                self._attr_source_list = []
+                self._update_state(source_list=[])
 
         except OSError as err:
             _LOGGER.debug(
                 "Could not fetch source list for %s: %s", self._attr_name, err
             )
             # Keep empty list instead of failing
-            self._attr_source_list = []
+            self._update_state(source_list=[])
 
     async def _async_fetch_listening_modes(self) -> None:
         """
         Fetch list of available listening modes.
 
-        Issue #125768 fix: Gracefully handle empty or unavailable lists.
+        Models the generated mapping narrows down get their modes without a
+        receiver round trip. Issue #125768 fix: Gracefully handle empty or unavailable
+        lists.
         """
+        if (mapped := get_narrowed_listening_modes(self._model_name)) is not None:
+            self._update_state(listening_modes=mapped)
+            return
+
         try:
-            # Get listening modes from receiver
-            modes = await self._conn_manager.async_send_command("raw", "LMQSTN")
+            # Get listening modes from the shared receiver lists or the receiver
+            modes = await self._async_get_list(LIST_LISTENING_MODES, "LMD", "LMQSTN")
 
-            if modes and isinstance(modes, dict):
-                self._listening_modes = list(modes.keys())
+            if modes:
+                self._update_state(listening_modes=modes)
                 _LOGGER.debug(
                     "Loaded %d listening modes for %s",
                     len(self._listening_modes),
@@ -506,30 +1019,22 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
                     self._attr_name,
                 )
                 # Fallback to profile defaults if available
-                if self._model_name and self._model_name in RECEIVER_PROFILES:
-                    defaults = RECEIVER_PROFILES[self._model_name].get(
-                        "ha_defaults", {}
+                defaults = get_profile_defaults(self._model_name)
+                self._update_state(listening_modes=list(defaults.listening_modes))
+                if self._listening_modes:
+                    _LOGGER.debug(
+                        "Loaded %d listening modes from profile for %s",
+                        len(self._listening_modes),
+                        self._attr_name,
                     )
-                    self._listening_modes = defaults.get("listening_modes", [])
-                    if self._listening_modes:
-                        _LOGGER.debug(
-                            "Loaded %d listening modes from profile for %s",
-                            len(self._listening_modes),
-                            self._attr_name,
-                        )
-                else:
-                    self._listening_modes = []
 
         except OSError as err:
             _LOGGER.debug(
                 "Could not fetch listening modes for %s: %s", self._attr_name, err
             )
             # Fallback to profile defaults if available
-            if self._model_name and self._model_name in RECEIVER_PROFILES:
-                defaults = RECEIVER_PROFILES[self._model_name].get("ha_defaults", {})
-                self._listening_modes = defaults.get("listening_modes", [])
-            else:
-                self._listening_modes = []
+            defaults = get_profile_defaults(self._model_name)
+            self._update_state(listening_modes=list(defaults.listening_modes))
 
     # Media Player Entity Methods
 
@@ -543,23 +1048,27 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
 
             # Wait for receiver to initialize before polling
             # (Issue #125768 / Performance Improvement)
-            # External implementation (onpc) suggests at least 1-1.5s delay after PWON.
-            await asyncio.sleep(1.5)
+            # External implementation (onpc) suggests at least 1-1.5s delay after
+            # PWON; models with a profile use their own readiness time.
+            await asyncio.sleep(self._timing.power_on_delay)
 
             # Poll for power on state with a timeout
             power_on = False
-            for _ in range(10):  # 10 tries * 0.5s = 5s timeout
+            for _ in range(max(1, round(self._timing.power_on_timeout / 0.5))):
                 if await self._async_get_power_state() == "on":
                     power_on = True
                     break
                 await asyncio.sleep(0.5)
 
             if not power_on:
-                _LOGGER.warning("%s did not power on within 5 seconds", self._attr_name)
+                _LOGGER.warning(
+                    "%s did not power on within %s seconds",
+                    self._attr_name,
+                    self._timing.power_on_timeout,
+                )
                 # Set state optimistically and let the next update correct it
-                self._attr_state = MediaPlayerState.ON
-                self._attr_available = True
-                self.async_write_ha_state()
+                self._update_state(state=MediaPlayerState.ON, available=True)
+                self._async_write_state()
                 return
 
             # Fetch device info after power on
@@ -568,13 +1077,12 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             if not self._listening_modes:
                 await self._async_fetch_listening_modes()
 
-            self._attr_state = MediaPlayerState.ON
-            self._attr_available = True
-            self.async_write_ha_state()
+            self._update_state(state=MediaPlayerState.ON, available=True)
+            self._async_write_state()
 
         except OSError as err:
             _LOGGER.error("Failed to turn on %s: %s", self._attr_name, err)
-            self._attr_available = False
+            self._update_state(available=False)
             raise
 
     async def async_turn_off(self) -> None:
@@ -587,8 +1095,8 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             )
             await self._conn_manager.async_send_command("command", command)
 
-            self._attr_state = MediaPlayerState.OFF
-            self.async_write_ha_state()
+            self._update_state(state=MediaPlayerState.OFF)
+            self._async_write_state()
 
         except OSError as err:
             _LOGGER.error("Failed to turn off %s: %s", self._attr_name, err)
@@ -613,8 +1121,12 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             )
             await self._conn_manager.async_send_command("command", command)
 
-            self._attr_volume_level = volume
-            self.async_write_ha_state()
+            # Report the level the receiver actually lands on
+            self._update_state(
+                volume_raw=receiver_volume,
+                volume_level=self._receiver_volume_to_ha(receiver_volume),
+            )
+            self._async_write_state()
 
         except OSError as err:
             _LOGGER.error("Failed to set volume: %s", err)
@@ -633,7 +1145,7 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             # Update state after a moment
             await asyncio.sleep(0.2)
             await self._async_update_volume()
-            self.async_write_ha_state()
+            self._async_write_state()
 
         except OSError as err:
             _LOGGER.error("Failed to increase volume: %s", err)
@@ -652,7 +1164,7 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             # Update state after a moment
             await asyncio.sleep(0.2)
             await self._async_update_volume()
-            self.async_write_ha_state()
+            self._async_write_state()
 
         except OSError as err:
             _LOGGER.error("Failed to decrease volume: %s", err)
@@ -674,8 +1186,8 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             )
             await self._conn_manager.async_send_command("command", command)
 
-            self._attr_is_volume_muted = mute
-            self.async_write_ha_state()
+            self._update_state(is_volume_muted=mute)
+            self._async_write_state()
 
         except OSError as err:
             _LOGGER.error("Failed to %s: %s", "mute" if mute else "unmute", err)
@@ -696,8 +1208,8 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             )
             await self._conn_manager.async_send_command("command", command)
 
-            self._attr_source = source
-            self.async_write_ha_state()
+            self._update_state(source=source)
+            self._async_write_state()
 
         except OSError as err:
             _LOGGER.error("Failed to select source %s: %s", source, err)
@@ -707,11 +1219,12 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         self, media_type: str, media_id: str, **kwargs: Any
     ) -> None:
         """
-        Play media (radio presets).
+        Play media (radio presets or network menu items).
 
         Args:
             media_type: Type of media (e.g., "radio").
-            media_id: Preset number (1-40).
+            media_id: Preset number (1-40), or the content ID of a network
+                menu item.
             kwargs: Additional arguments.
         """
         try:
@@ -738,6 +1251,11 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
                 await self._conn_manager.async_send_command("command", command)
 
                 _LOGGER.debug("Playing radio preset %s", media_id)
+            elif media_type == NET_MEDIA_TYPE and self._browser is not None:
+                path, _page = parse_content_id(media_id)
+                await self._async_select_network_source()
+                await self._browser.async_select(path)
+                _LOGGER.debug("Playing network menu item %s", media_id)
             else:
                 _LOGGER.warning("Unsupported media type: %s", media_type)
 
@@ -745,6 +1263,53 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             _LOGGER.error("Failed to play media: %s", err)
             raise
 
+    async def async_browse_media(
+        self,
+        media_content_type: MediaType | str | None = None,
+        media_content_id: str | None = None,
+    ) -> BrowseMedia:
+        """
+        Browse the NET menus of the receiver, one page at a time.
+
+        Only a network source shows the menus; browsing does not switch to
+        one, playing a menu item does.
+
+        Args:
+            media_content_type: The content type of the menu.
+            media_content_id: The content ID of the menu page, or None for
+                the top menu.
+
+        Returns:
+            BrowseMedia: The menu page.
+
+        Raises:
+            BrowseError: If no network source is selected or the menu
+                cannot be read.
+        """
+        if self._browser is None:
+            raise BrowseError("Only the main zone shows the network menus")
+        if not self._shows_network_menus:
+            raise BrowseError("Select a network source to browse its menus")
+        try:
+            path, page = parse_content_id(media_content_id or NET_ROOT)
+        except ValueError as err:
+            raise BrowseError(str(err)) from err
+
+        list_page = await self._browser.async_get_page(path, page)
+        if list_page is None:
+            raise BrowseError("The receiver did not return the menu")
+        return build_browse_media(path, page, list_page, self._browser.item_title(path))
+
+    @property
+    def _shows_network_menus(self) -> bool:
+        """Return True if the current source shows the NET menus."""
+        return (self._attr_source or "").lower() in NET_SOURCES
+
+    async def _async_select_network_source(self) -> None:
+        """Switch to the network source unless it shows the NET menus already."""
+        if not self._shows_network_menus:
+            await self.async_select_source("net")
+
     # Custom Services
 
     async def async_select_hdmi_output(self, hdmi_output: str) -> None:
@@ -772,8 +1337,8 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
             _LOGGER.debug("Selected HDMI output: %s", hdmi_output)
 
             # Update extra attributes
-            self._attr_extra_state_attributes[ATTR_HDMI_OUTPUT] = hdmi_output
-            self.async_write_ha_state()
+            self._update_state(hdmi_output=hdmi_output)
+            self._async_write_state()
 
         except OSError as err:
             _LOGGER.error("Failed to select HDMI output %s: %s", hdmi_output, err)
@@ -785,7 +1350,7 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         """
         Convert HA volume (0.0-1.0) to receiver scale.
 
-        Takes into account:
+        Uses the precomputed volume table, which takes into account:
         - Volume resolution (50, 80, 100, or 200 steps)
         - Maximum volume limit
 
@@ -795,15 +1360,13 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         Returns:
             int: The receiver volume step.
         """
-        # Scale: HA volume -> max volume % -> receiver steps
-        scaled_volume = ha_volume * (self._max_volume / 100) * self._volume_resolution
-        return round(scaled_volume)
+        return self._volume_table.to_receiver(ha_volume)
 
     def _receiver_volume_to_ha(self, receiver_volume: int) -> float:
         """
         Convert receiver volume to HA scale (0.0-1.0).
 
-        Takes into account:
+        Uses the precomputed volume table, which takes into account:
         - Volume resolution
         - Maximum volume limit
 
@@ -813,29 +1376,112 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         Returns:
             float: The Home Assistant volume level.
         """
-        # Scale: receiver steps -> HA volume
-        # The HA volume should be a percentage of the *usable* volume range
-        max_receiver_volume = self._volume_resolution * (self._max_volume / 100)
-        if max_receiver_volume == 0:
-            return 0.0
-
-        ha_volume = receiver_volume / max_receiver_volume
-        return min(1.0, max(0.0, ha_volume))
+        return self._volume_table.to_ha(receiver_volume)
 
     # Properties
 
+    @property
+    def state(self) -> MediaPlayerState | None:
+        """
+        Return the state, playing or paused while a network source plays.
+
+        Returns:
+            MediaPlayerState | None: The state of the zone.
+        """
+        if self._attr_state == MediaPlayerState.ON and (
+            play_state := _PLAY_STATES.get(self._now_playing.status)
+        ):
+            return play_state
+        return self._attr_state
+
+    @property
+    def media_content_type(self) -> MediaType | None:
+        """Return the content type of the playing track."""
+        return MediaType.MUSIC if self._now_playing.title else None
+
+    @property
+    def media_title(self) -> str | None:
+        """Return the title of the playing track."""
+        return self._now_playing.title
+
+    @property
+    def media_artist(self) -> str | None:
+        """Return the artist of the playing track."""
+        return self._now_playing.artist
+
+    @property
+    def media_album_name(self) -> str | None:
+        """Return the album of the playing track."""
+        return self._now_playing.album
+
+    @property
+    def media_duration(self) -> int | None:
+        """Return the duration of the playing track in seconds."""
+        return self._now_playing.duration
+
+    @property
+    def media_position(self) -> int | None:
+        """Return the position of the playing track at its last update."""
+        return self._now_playing.position
+
+    @property
+    def media_position_updated_at(self) -> datetime | None:
+        """Return when the position was last updated."""
+        return self._now_playing.position_updated_at
+
+    @property
+    def media_image_url(self) -> str | None:
+        """Return the URL of the jacket art, if the receiver sent a link."""
+        return self._art_url
+
+    @property
+    def media_image_hash(self) -> str | None:
+        """Return the key of the jacket art shown."""
+        return self._art_key
+
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """
+        Return the jacket art of the playing track.
+
+        Images are served from the art cache; art sent as a link is fetched
+        once and cached as well.
+
+        Returns:
+            tuple[bytes | None, str | None]: The image and its content type.
+        """
+        if (key := self._art_key) is None:
+            return None, None
+        if (image := self._art_cache.get(key)) is not None:
+            return image
+        if (url := self._art_url) is None:
+            return None, None
+        content, content_type = await self._async_fetch_image(url)
+        if content is not None:
+            self._art_cache.put(key, content, content_type or "image/jpeg")
+        return content, content_type
+
     @property
     def source_list(self) -> list[str]:
         """
         Return list of available input sources.
 
         Issue #125768 fix: Always return list, never None.
-        Empty list is valid and won't break setup.
+        Empty list is valid and won't break setup. Only the sources selected
+        in the options are listed.
 
         Returns:
             list[str]: The list of available sources.
         """
-        return self._attr_source_list if self._attr_source_list else []
+        sources = self._attr_source_list
+        if not sources:
+            return []
+        if self._source_filter is None:
+            return sources
+        built_from, filtered = self._filtered_sources
+        if built_from is not sources:
+            filtered = [source for source in sources if source in self._source_filter]
+            self._filtered_sources = (sources, filtered)
+        return filtered
 
     @property
     def available(self) -> bool:
@@ -847,6 +1493,8 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         Returns:
             bool: True if available, False otherwise.
         """
+        if self._stale:
+            return True
         return self._attr_available and self._conn_manager.connected
 
     @property
@@ -854,27 +1502,40 @@ class OnkyoMediaPlayer(MediaPlayerEntity):
         """
         Return entity specific state attributes.
 
+        The dictionary is cached and only rebuilt when an attribute field
+        of the zone state changed.
+
         Returns:
             dict[str, Any]: A dictionary of extra state attributes.
         """
-        attrs = self._attr_extra_state_attributes.copy()
+        zone_state = self._zone_state
+        if self._extra_attributes_version == zone_state.attributes_version:
+            return self._with_stale_marker(self._extra_attributes)
+
+        attrs: dict[str, Any] = {}
+
+        if zone_state.hdmi_output is not None:
+            attrs[ATTR_HDMI_OUTPUT] = zone_state.hdmi_output
 
         # Add listening modes if available
-        if self._listening_modes:
-            attrs["listening_modes"] = self._listening_modes
+        if zone_state.listening_modes:
+            attrs["listening_modes"] = zone_state.listening_modes
+
+        self._extra_attributes = attrs
+        self._extra_attributes_version = zone_state.attributes_version
+        return self._with_stale_marker(attrs)
 
-        return attrs
+    def _with_stale_marker(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Return the attributes, marked if they are restored rather than live."""
+        if not self._stale:
+            return attrs
+        return {**attrs, ATTR_STALE: True}
 
     # Cleanup
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
-        # Unregister callback if registered
-        if hasattr(self._receiver, "unregister_callback"):
-            try:
-                self._receiver.unregister_callback(self._handle_receiver_update)
-            except OSError as err:  # pylint: disable=broad-exception-caught
-                _LOGGER.debug("Error unregistering callback: %s", err)
+        self._write_coalescer.async_cancel()
 
         # Close connection manager
         # NOTE: Since the connection manager is now shared (owned by __init__),
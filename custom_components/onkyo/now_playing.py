@@ -0,0 +1,187 @@
+"""
+Now-playing metadata of the NET/USB/Bluetooth sources.
+
+While a network source plays, the receiver pushes the artist, title and
+album of the track (NAT/NTI/NAL), its play status (NST), and the elapsed
+and total time (NTM) once a second. The position is kept as a reference
+point that Home Assistant interpolates, so the per-second NTM messages only
+move it when the receiver drifts away from the interpolated position, e.g.
+after a seek.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+# Zone the eISCP library reports the network messages in
+NET_ZONE = "dock"
+
+ARTIST = "net-usb-artist-name-info"
+TITLE = "net-usb-title-name"
+ALBUM = "net-usb-album-name-info"
+TIME = "net-usb-time-info"
+PLAY_STATUS = "net-usb-play-status"
+
+NOW_PLAYING_COMMANDS = (ARTIST, TITLE, ALBUM, TIME, PLAY_STATUS)
+
+# Seconds the reported position may differ from the interpolated one
+POSITION_TOLERANCE = 2.0
+
+STATUS_PLAYING = "playing"
+STATUS_PAUSED = "paused"
+STATUS_STOPPED = "stopped"
+
+# First character of NST: play status
+_PLAY_STATUS = {
+    "P": STATUS_PLAYING,
+    "F": STATUS_PLAYING,
+    "R": STATUS_PLAYING,
+    "p": STATUS_PAUSED,
+    "S": STATUS_STOPPED,
+    "E": STATUS_STOPPED,
+}
+
+_TEXT_FIELDS = {ARTIST: "artist", TITLE: "title", ALBUM: "album"}
+
+
+def parse_time(text: str) -> int | None:
+    """
+    Parse an NTM time in "mm:ss" or "hh:mm:ss" form.
+
+    Args:
+        text: The time.
+
+    Returns:
+        int | None: The time in seconds, or None if it is unknown ("--:--").
+    """
+    seconds = 0
+    for part in text.strip().split(":"):
+        if not part.isdigit():
+            return None
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+class NowPlaying:
+    """
+    Metadata of the track playing on a network source.
+
+    ``version`` is bumped whenever something exposed changes, so entities
+    can tell whether a state write is due.
+    """
+
+    __slots__ = (
+        "artist",
+        "title",
+        "album",
+        "status",
+        "duration",
+        "position",
+        "position_updated_at",
+        "version",
+        "_cleared_version",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty metadata."""
+        self.artist: str | None = None
+        self.title: str | None = None
+        self.album: str | None = None
+        self.status: str | None = None
+        self.duration: int | None = None
+        self.position: int | None = None
+        self.position_updated_at: datetime | None = None
+        self.version = 0
+        self._cleared_version = 0
+
+    def expected_position(self, now: datetime) -> float | None:
+        """
+        Return the position Home Assistant shows at a point in time.
+
+        Args:
+            now: The point in time.
+
+        Returns:
+            float | None: The interpolated position in seconds, or None if
+            no position is known.
+        """
+        if self.position is None or self.position_updated_at is None:
+            return None
+        if self.status != STATUS_PLAYING:
+            return float(self.position)
+        return self.position + (now - self.position_updated_at).total_seconds()
+
+    def update(self, command: str, value: Any, now: datetime) -> bool:
+        """
+        Apply a pushed message.
+
+        Args:
+            command: The eISCP command name.
+            value: The message value.
+            now: The time the message arrived.
+
+        Returns:
+            bool: True if anything exposed changed.
+        """
+        if not isinstance(value, str):
+            return False
+        if command == TIME:
+            changed = self._update_time(value, now)
+        elif command == PLAY_STATUS:
+            changed = self._update_status(_PLAY_STATUS.get(value[:1]), now)
+        elif (field := _TEXT_FIELDS.get(command)) is not None:
+            text = value.strip() or None
+            changed = getattr(self, field) != text
+            setattr(self, field, text)
+        else:
+            return False
+        if changed:
+            self.version += 1
+        return changed
+
+    def _update_time(self, value: str, now: datetime) -> bool:
+        """Move the position only if it drifted from the interpolated one."""
+        elapsed_text, _, total_text = value.partition("/")
+        elapsed = parse_time(elapsed_text)
+        duration = parse_time(total_text) or None
+        changed = duration != self.duration
+        self.duration = duration
+
+        expected = self.expected_position(now)
+        if elapsed is None:
+            if self.position is None:
+                return changed
+            self.position = self.position_updated_at = None
+            return True
+        if expected is None or abs(elapsed - expected) > POSITION_TOLERANCE:
+            self.position = elapsed
+            self.position_updated_at = now
+            return True
+        return changed
+
+    def _update_status(self, status: str | None, now: datetime) -> bool:
+        """Apply a play status, anchoring the position where it stopped."""
+        if status == self.status:
+            return False
+        if (expected := self.expected_position(now)) is not None:
+            self.position = int(expected)
+            self.position_updated_at = now
+        self.status = status
+        return True
+
+    def clear(self) -> bool:
+        """
+        Forget the metadata, e.g. after a source change.
+
+        Returns:
+            bool: True if there was anything to forget.
+        """
+        if self.version == self._cleared_version:
+            return False
+        self.artist = self.title = self.album = self.status = None
+        self.duration = self.position = None
+        self.position_updated_at = None
+        self.version += 1
+        self._cleared_version = self.version
+        return True
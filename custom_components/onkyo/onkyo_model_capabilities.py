@@ -0,0 +1,1950 @@
+"""Model capability index for Onkyo receivers."""
+# Generated from eiscp_commands_dump.yaml by generate_model_mapping.py
+# Input hash: 1de563259dfed4906a404f9ab211a2d50be847c3ecdc6548e02837f4d31b4d49
+# pylint: disable=line-too-long
+
+MODELSETS = (
+    "set1",
+    "set2",
+    "set3",
+    "set4",
+    "set5",
+    "set6",
+    "set7",
+    "set8",
+    "set9",
+    "set10",
+    "set11",
+)
+
+# Value keys per zone and command; value IDs are assigned in this order
+COMMAND_VALUES = {
+    "main": {
+        "PWR": (
+            "00",
+            "01",
+            "ALL",
+            "QSTN",
+        ),
+        "AMT": (
+            "00",
+            "01",
+            "TG",
+            "QSTN",
+        ),
+        "CMT": (
+            "aabbccddeeffgghhiijjkkllmm",
+            "QSTN",
+        ),
+        "SPA": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "SPB": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "SPL": (
+            "SB",
+            "FH",
+            "FW",
+            "HW",
+            "H1",
+            "H2",
+            "BH",
+            "BW",
+            "HH",
+            "A",
+            "B",
+            "AB",
+            "UP",
+            "QSTN",
+        ),
+        "MVL": (
+            "0-200",
+            "0-100",
+            "0-80",
+            "0-50",
+            "UP",
+            "DOWN",
+            "UP1",
+            "DOWN1",
+            "QSTN",
+        ),
+        "TFR": (
+            "B{xx}",
+            "T{xx}",
+            "BUP",
+            "BDOWN",
+            "TUP",
+            "TDOWN",
+            "QSTN",
+        ),
+        "TFW": (
+            "B{xx}",
+            "T{xx}",
+            "BUP",
+            "BDOWN",
+            "TUP",
+            "TDOWN",
+            "QSTN",
+        ),
+        "TFH": (
+            "B{xx}",
+            "T{xx}",
+            "BUP",
+            "BDOWN",
+            "TUP",
+            "TDOWN",
+            "QSTN",
+        ),
+        "TCT": (
+            "B{xx}",
+            "T{xx}",
+            "BUP",
+            "BDOWN",
+            "TUP",
+            "TDOWN",
+            "QSTN",
+        ),
+        "TSR": (
+            "B{xx}",
+            "T{xx}",
+            "BUP",
+            "BDOWN",
+            "TUP",
+            "TDOWN",
+            "QSTN",
+        ),
+        "TSB": (
+            "B{xx}",
+            "T{xx}",
+            "BUP",
+            "BDOWN",
+            "TUP",
+            "TDOWN",
+            "QSTN",
+        ),
+        "TSW": (
+            "B{xx}",
+            "BUP",
+            "BDOWN",
+            "QSTN",
+        ),
+        "PMB": (
+            "00",
+            "01",
+            "TG",
+            "QSTN",
+        ),
+        "SLP": (
+            "1-90",
+            "OFF",
+            "UP",
+            "QSTN",
+        ),
+        "SLC": (
+            "TEST",
+            "OFF",
+            "CHSEL",
+            "UP",
+            "DOWN",
+        ),
+        "SWL": (
+            "-30-24",
+            "-15-12",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "SW2": (
+            "-30-24",
+            "-15-12",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "CTL": (
+            "-24-24",
+            "-12-12",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "TCL": (
+            "aaabbbcccdddeeefffggghhhiiijjjkkklllmmm",
+            "QSTN",
+        ),
+        "DIF": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "TG",
+            "QSTN",
+        ),
+        "DIM": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "08",
+            "DIM",
+            "QSTN",
+        ),
+        "OSD": (
+            "MENU",
+            "UP",
+            "DOWN",
+            "RIGHT",
+            "LEFT",
+            "ENTER",
+            "EXIT",
+            "AUDIO",
+            "VIDEO",
+            "HOME",
+            "QUICK",
+            "IPV",
+        ),
+        "MEM": (
+            "STR",
+            "RCL",
+            "LOCK",
+            "UNLK",
+        ),
+        "RST": ("ALL",),
+        "IFA": (
+            "a..a,b..b,c…c,d..d,e…e,f…f,",
+            "a..a,b..b,c…c,d..d,e…e,f…f,g…g,h…h,i…I,j…j,k…k",
+            "QSTN",
+        ),
+        "IFV": (
+            "a..a,b..b,c…c,d..d,e…e,f…f,g…g,h…h,i…i,",
+            "QSTN",
+        ),
+        "FLD": (
+            "{xx}{xx}{xx}{xx}{xx}x",
+            "QSTN",
+        ),
+        "SLI": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "07",
+            "08",
+            "09",
+            "10",
+            "11",
+            "12",
+            "20",
+            "21",
+            "22",
+            "23",
+            "24",
+            "25",
+            "26",
+            "27",
+            "28",
+            "29",
+            "2A",
+            "2B",
+            "2C",
+            "2D",
+            "2E",
+            "2F",
+            "41",
+            "42",
+            "44",
+            "45",
+            "40",
+            "30",
+            "31",
+            "32",
+            "33",
+            "55",
+            "56",
+            "57",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "SLR": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "10",
+            "20",
+            "21",
+            "22",
+            "23",
+            "24",
+            "25",
+            "26",
+            "27",
+            "28",
+            "30",
+            "31",
+            "7F",
+            "80",
+            "QSTN",
+        ),
+        "SLA": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "07",
+            "0F",
+            "UP",
+            "QSTN",
+        ),
+        "TGA": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "TGB": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "TGC": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "VOS": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "HDO": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "UP",
+            "QSTN",
+        ),
+        "HAO": (
+            "00",
+            "01",
+            "02",
+            "UP",
+            "QSTN",
+        ),
+        "HAS": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "CEC": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "CCM": (
+            "01",
+            "02",
+            "10",
+            "UP",
+            "QSTN",
+        ),
+        "RES": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "13",
+            "04",
+            "05",
+            "07",
+            "15",
+            "08",
+            "06",
+            "UP",
+            "QSTN",
+        ),
+        "SPR": (
+            "0-3",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "HOI": (
+            "ab",
+            "QSTN",
+        ),
+        "ISF": (
+            "00",
+            "01",
+            "02",
+            "UP",
+            "QSTN",
+        ),
+        "VWM": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "UP",
+            "QSTN",
+        ),
+        "VPM": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "05",
+            "06",
+            "07",
+            "08",
+            "UP",
+            "QSTN",
+        ),
+        "LMD": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "07",
+            "08",
+            "09",
+            "0A",
+            "0B",
+            "0C",
+            "0D",
+            "0E",
+            "0F",
+            "11",
+            "12",
+            "13",
+            "14",
+            "15",
+            "16",
+            "1F",
+            "23",
+            "25",
+            "26",
+            "2E",
+            "40",
+            "41",
+            "42",
+            "43",
+            "44",
+            "45",
+            "50",
+            "51",
+            "52",
+            "80",
+            "81",
+            "82",
+            "83",
+            "84",
+            "85",
+            "86",
+            "87",
+            "88",
+            "89",
+            "8A",
+            "8B",
+            "8C",
+            "8D",
+            "8E",
+            "8F",
+            "90",
+            "91",
+            "92",
+            "93",
+            "94",
+            "95",
+            "96",
+            "97",
+            "98",
+            "99",
+            "9A",
+            "A0",
+            "A1",
+            "A2",
+            "A3",
+            "A4",
+            "A5",
+            "A6",
+            "A7",
+            "FF",
+            "UP",
+            "DOWN",
+            "MOVIE",
+            "MUSIC",
+            "GAME",
+            "THX",
+            "AUTO",
+            "SURR",
+            "STEREO",
+            "QSTN",
+        ),
+        "DIR": (
+            "00",
+            "01",
+            "TG",
+            "QSTN",
+        ),
+        "LTN": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "UP",
+            "QSTN",
+        ),
+        "RAS": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "ADY": (
+            "00",
+            "01",
+            "02",
+            "UP",
+            "QSTN",
+        ),
+        "ADQ": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "ADV": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "UP",
+            "QSTN",
+        ),
+        "DVL": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "UP",
+            "QSTN",
+        ),
+        "AEQ": (
+            "00",
+            "01",
+            "02",
+            "UP",
+            "QSTN",
+        ),
+        "MCM": (
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "EQS": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "STW": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "PCT": (
+            "00",
+            "01",
+            "02",
+            "UP",
+            "QSTN",
+        ),
+        "PCP": (
+            "0-16",
+            "AT",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "LFE": (
+            "xx",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "ACE": (
+            "aaabbbcccdddeeefffggghhhiii",
+            "QSTN",
+        ),
+        "MCC": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "MFB": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "MOT": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "AVS": (
+            "snnn",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "ASC": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "UPS": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "UP",
+            "QSTN",
+        ),
+        "HBT": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "DGF": (
+            "00",
+            "01",
+            "02",
+            "UP",
+            "QSTN",
+        ),
+        "LRA": (
+            "1-7",
+            "UP",
+            "Down",
+            "QSTN",
+        ),
+        "PBS": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "SBS": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "SCD": (
+            "00",
+            "01",
+            "2-5",
+            "UP",
+            "QSTN",
+        ),
+        "CTS": (
+            "00",
+            "01",
+            "TG",
+            "QSTN",
+        ),
+        "PNR": (
+            "00",
+            "01",
+            "TG",
+            "QSTN",
+        ),
+        "DMS": (
+            "-3-3",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "CTW": (
+            "0-7",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "CTI": (
+            "0-10",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "DLC": (
+            "0-6",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "DCE": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "SPI": (
+            "abcdefghhhijk",
+            "QSTN",
+        ),
+        "SPD": (
+            "Muaaabbbcccdddeeefffggghhhiiijjjkkklllmmm",
+            "QSTN",
+        ),
+        "DMN": (
+            "00",
+            "01",
+            "02",
+            "UP",
+            "QSTN",
+        ),
+        "LDM": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "ITV": (
+            "-24-24",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "IRN": ("iixxxxxxxxxx",),
+        "FXP": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "HST": (
+            "xx",
+            "OFF",
+            "LAST",
+            "AT",
+            "ATE",
+            "UP",
+            "QSTN",
+        ),
+        "PQL": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "ARC": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "LPS": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "APD": (
+            "00",
+            "01",
+            "UP",
+            "QSTN",
+        ),
+        "PAM": (
+            "00",
+            "01",
+            "03",
+            "07",
+            "UP",
+            "QSTN",
+        ),
+        "ECO": (
+            "01",
+            "03",
+            "06",
+        ),
+        "FWV": (
+            "abce-fhik-lmno-qrtu",
+            "QSTN",
+        ),
+        "UPD": (
+            "NET",
+            "USB",
+            "D**-nn",
+            "CMP",
+            "E{xx}-yy",
+            "00",
+            "01",
+            "02",
+            "QSTN",
+        ),
+        "POP": (
+            "t----<.....>",
+            "Ullt<.....>",
+        ),
+        "TPD": (
+            "-99-999",
+            "QSTN",
+        ),
+        "TUN": (
+            "nnnnn",
+            "BAND",
+            "DIRECT",
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+            "7",
+            "8",
+            "9",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "PRS": (
+            "1-40",
+            "1-30",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "PRM": (
+            "1-40",
+            "1-30",
+        ),
+        "RDS": (
+            "00",
+            "01",
+            "02",
+            "UP",
+        ),
+        "PTS": (
+            "1-29",
+            "ENTER",
+        ),
+        "TPS": (
+            "",
+            "ENTER",
+        ),
+        "XCN": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "XAT": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "XTI": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "XCH": (
+            "0-597",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "XCT": (
+            "nnnnnnnnnn",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "SCN": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "SAT": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "STI": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "SCH": (
+            "0-597",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "SCT": (
+            "nnnnnnnnnn",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "SLK": (
+            "nnnn",
+            "INPUT",
+            "WRONG",
+        ),
+        "HAT": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "HCN": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "HTI": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "HDS": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "HPR": (
+            "1-8",
+            "QSTN",
+        ),
+        "HBL": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "HTS": (
+            "mmnnoo",
+            "QSTN",
+        ),
+        "BCS": (
+            "00",
+            "01",
+            "10",
+            "11",
+            "12",
+            "QSTN",
+        ),
+        "CCD": (
+            "PLAY",
+            "STOP",
+            "PAUSE",
+            "SKIP.F",
+            "SKIP.R",
+            "REPEAT",
+            "RANDOM",
+        ),
+        "CST": (
+            "prs",
+            "QSTN",
+        ),
+        "DST": (
+            "00",
+            "04",
+            "07",
+            "FF",
+            "QSTN",
+        ),
+        "CFS": (
+            "1-153",
+            "QSTN",
+        ),
+        "CTM": (
+            "mm:ss/mm:ss",
+            "QSTN",
+        ),
+        "SCE": ("mm:ss",),
+        "DSN": (
+            "xx…xx",
+            "QSTN",
+        ),
+        "CTV": (
+            "POWER",
+            "PWRON",
+            "PWROFF",
+            "CHUP",
+            "CHDN",
+            "VLUP",
+            "VLDN",
+            "MUTE",
+            "DISP",
+            "INPUT",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+            "7",
+            "8",
+            "9",
+            "0",
+            "CLEAR",
+            "SETUP",
+            "GUIDE",
+            "PREV",
+            "UP",
+            "DOWN",
+            "LEFT",
+            "RIGHT",
+            "ENTER",
+            "RETURN",
+            "A",
+            "B",
+            "C",
+            "D",
+        ),
+    },
+    "zone2": {
+        "ZPW": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "ZPA": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "ZPB": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "ZMT": (
+            "00",
+            "01",
+            "TG",
+            "QSTN",
+        ),
+        "ZVL": (
+            "0-200",
+            "0-100",
+            "0-80",
+            "UP",
+            "DOWN",
+            "UP1",
+            "DOWN1",
+            "QSTN",
+        ),
+        "ZTN": (
+            "B{xx}",
+            "T{xx}",
+            "BUP",
+            "BDOWN",
+            "TUP",
+            "TDOWN",
+            "QSTN",
+        ),
+        "ZBL": (
+            "{xx}",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "SLZ": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "07",
+            "08",
+            "09",
+            "10",
+            "11",
+            "12",
+            "20",
+            "21",
+            "22",
+            "23",
+            "24",
+            "25",
+            "26",
+            "27",
+            "28",
+            "29",
+            "2A",
+            "2B",
+            "2C",
+            "2D",
+            "2E",
+            "40",
+            "30",
+            "31",
+            "32",
+            "33",
+            "55",
+            "56",
+            "57",
+            "7F",
+            "80",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "TUN": (
+            "nnnnn",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "TUZ": (
+            "nnnnn",
+            "DIRECT",
+            "BAND",
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+            "7",
+            "8",
+            "9",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "PRS": (
+            "1-40",
+            "1-30",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "PRZ": (
+            "1-40",
+            "1-30",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "NTC": (
+            "PLAYz",
+            "STOPz",
+            "PAUSEz",
+            "TRUPz",
+            "TRDNz",
+        ),
+        "NTZ": (
+            "PLAY",
+            "STOP",
+            "PAUSE",
+            "P/P",
+            "TRUP",
+            "TRDN",
+            "CHUP",
+            "CHDN",
+            "FF",
+            "REW",
+            "REPEAT",
+            "RANDOM",
+            "REP/SHF",
+            "DISPLAY",
+            "MEMORY",
+            "MODE",
+            "RIGHT",
+            "LEFT",
+            "UP",
+            "DOWN",
+            "SELECT",
+            "RETURN",
+        ),
+        "NPZ": ("1-40",),
+        "LMZ": (
+            "00",
+            "01",
+            "0F",
+            "12",
+            "87",
+            "88",
+        ),
+        "LTZ": (
+            "00",
+            "01",
+            "02",
+            "UP",
+            "QSTN",
+        ),
+        "RAZ": (
+            "00",
+            "01",
+            "02",
+            "UP",
+            "QSTN",
+        ),
+    },
+    "zone3": {
+        "PW3": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "MT3": (
+            "00",
+            "01",
+            "TG",
+            "QSTN",
+        ),
+        "VL3": (
+            "0-200",
+            "0-100",
+            "0-80",
+            "UP",
+            "DOWN",
+            "UP1",
+            "DOWN1",
+            "QSTN",
+        ),
+        "TN3": (
+            "B{xx}",
+            "T{xx}",
+            "BUP",
+            "BDOWN",
+            "TUP",
+            "TDOWN",
+            "QSTN",
+        ),
+        "BL3": (
+            "{xx}",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "SL3": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "07",
+            "08",
+            "09",
+            "10",
+            "11",
+            "12",
+            "20",
+            "21",
+            "22",
+            "23",
+            "24",
+            "25",
+            "26",
+            "27",
+            "28",
+            "29",
+            "2A",
+            "2B",
+            "2C",
+            "2D",
+            "2E",
+            "40",
+            "30",
+            "31",
+            "32",
+            "33",
+            "80",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "TUN": (
+            "nnnnn",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "TU3": (
+            "nnnnn",
+            "BAND",
+            "DIRECT",
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+            "7",
+            "8",
+            "9",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "PRS": (
+            "1-40",
+            "1-30",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "PR3": (
+            "1-40",
+            "1-30",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "NTC": (
+            "PLAYz",
+            "STOPz",
+            "PAUSEz",
+            "TRUPz",
+            "TRDNz",
+        ),
+        "NT3": (
+            "PLAY",
+            "STOP",
+            "PAUSE",
+            "P/P",
+            "TRUP",
+            "TRDN",
+            "CHUP",
+            "CHDN",
+            "FF",
+            "REW",
+            "REPEAT",
+            "RANDOM",
+            "REP/SHF",
+            "DISPLAY",
+            "MEMORY",
+            "RIGHT",
+            "LEFT",
+            "UP",
+            "DOWN",
+            "SELECT",
+            "RETURN",
+        ),
+        "NP3": ("1-40",),
+    },
+    "zone4": {
+        "PW4": (
+            "00",
+            "01",
+            "QSTN",
+        ),
+        "MT4": (
+            "00",
+            "01",
+            "TG",
+            "QSTN",
+        ),
+        "VL4": (
+            "0-100",
+            "0-80",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "SL4": (
+            "00",
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "07",
+            "08",
+            "09",
+            "10",
+            "20",
+            "21",
+            "22",
+            "23",
+            "24",
+            "25",
+            "26",
+            "27",
+            "28",
+            "29",
+            "2A",
+            "2B",
+            "2C",
+            "2D",
+            "2E",
+            "40",
+            "30",
+            "31",
+            "32",
+            "33",
+            "80",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "TUN": (
+            "nnnnn",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "TU4": (
+            "nnnnn",
+            "DIRECT",
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+            "7",
+            "8",
+            "9",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "PRS": (
+            "1-40",
+            "1-30",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "PR4": (
+            "1-40",
+            "1-30",
+            "UP",
+            "DOWN",
+            "QSTN",
+        ),
+        "NTC": (
+            "PLAYz",
+            "STOPz",
+            "PAUSEz",
+            "TRUPz",
+            "TRDNz",
+        ),
+        "NT4": (
+            "PLAY",
+            "STOP",
+            "PAUSE",
+            "TRUP",
+            "TRDN",
+            "FF",
+            "REW",
+            "REPEAT",
+            "RANDOM",
+            "DISPLAY",
+            "RIGHT",
+            "LEFT",
+            "UP",
+            "DOWN",
+            "SELECT",
+            "RETURN",
+        ),
+        "NP4": ("1-40",),
+    },
+    "dock": {
+        "NTC": (
+            "PLAY",
+            "STOP",
+            "PAUSE",
+            "P/P",
+            "TRUP",
+            "TRDN",
+            "FF",
+            "REW",
+            "REPEAT",
+            "RANDOM",
+            "REP/SHF",
+            "DISPLAY",
+            "ALBUM",
+            "ARTIST",
+            "GENRE",
+            "PLAYLIST",
+            "RIGHT",
+            "LEFT",
+            "UP",
+            "DOWN",
+            "SELECT",
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+            "7",
+            "8",
+            "9",
+            "DELETE",
+            "CAPS",
+            "LOCATION",
+            "LANGUAGE",
+            "SETUP",
+            "RETURN",
+            "CHUP",
+            "CHDN",
+            "MENU",
+            "TOP",
+            "MODE",
+            "LIST",
+            "MEMORY",
+            "F1",
+            "F2",
+        ),
+        "NBS": (
+            "OFF",
+            "ON",
+            "QSTN",
+        ),
+        "NBT": (
+            "PAIRING",
+            "CLEAR",
+        ),
+        "NAT": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "NAL": (
+            "nnnnnnn",
+            "QSTN",
+        ),
+        "NTI": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "NTM": (
+            "mm:ss/mm:ss",
+            "hh:mm:ss/hh:mm:ss",
+            "QSTN",
+        ),
+        "NTR": (
+            "cccc/tttt",
+            "QSTN",
+        ),
+        "NST": (
+            "prs",
+            "QSTN",
+        ),
+        "NMS": (
+            "maabbstii",
+            "QSTN",
+        ),
+        "NTS": (
+            "mm:ss",
+            "hh:mm:ss",
+        ),
+        "NPR": (
+            "1-40",
+            "SET",
+        ),
+        "NDS": (
+            "nfr",
+            "QSTN",
+        ),
+        "NLS": (
+            "tlpnnnnnnnnnn",
+            "ti",
+        ),
+        "NLA": (
+            "tzzzzsurr<.....>",
+            "Lzzzzll{xx}{xx}yyyy",
+            "Izzzzll{xx}{xx}----",
+        ),
+        "NJA": (
+            "tp{xx}{xx}{xx}{xx}{xx}{xx}",
+            "DIS",
+            "ENA",
+            "BMP",
+            "LINK",
+            "UP",
+            "REQ",
+            "QSTN",
+        ),
+        "NSV": ("ssiaaaa…aaaabbbb…bbbb",),
+        "NKY": (
+            "ll",
+            "nnnnnnnnn",
+        ),
+        "NPU": ("xaaa…aaaybbb…bbb",),
+        "NLT": (
+            "{xx}uycccciiiillrraabbssnnn...nnn",
+            "{xx}uycccciiiillsraabbssnnn...nnn",
+            "QSTN",
+        ),
+        "NMD": (
+            "STD",
+            "EXT",
+            "VDC",
+            "QSTN",
+        ),
+        "NSB": (
+            "OFF",
+            "ON",
+            "QSTN",
+        ),
+        "NRI": (
+            "<…>",
+            "QSTN",
+            "t----<.....>",
+            "Ullt<.....>",
+        ),
+        "NLU": ("{xx}{xx}yyyy",),
+        "NPB": (
+            "pudtsrrr",
+            "QSTN",
+        ),
+        "NAF": ("{xx}{xx}",),
+        "NRF": ("1-40",),
+        "NSD": ("{xx}{xx}{xx}{xx}{xx}x",),
+        "AAT": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "AAL": (
+            "nnnnnnn",
+            "QSTN",
+        ),
+        "ATI": (
+            "nnnnnnnnnn",
+            "QSTN",
+        ),
+        "ATM": (
+            "mm:ss/mm:ss",
+            "QSTN",
+        ),
+        "AST": (
+            "prs",
+            "QSTN",
+        ),
+    },
+}
+
+# Bitset of supported value IDs per modelset, in MODELSETS order
+MODELSET_VALUES = (
+    int(
+        "1ffffffffffffffffff3ffffffffffc0000000000000000000000000000000000000000000000"
+        "000000000000000000000000000000000000000000001ffffffff8000000fffffffffffffffff"
+        "fffffffffffffffffffffffffffc003ffbffffffffffffffffffffffe1fffffffffffffffffff"
+        "feffffffffffffffffffffffffffffff83ffffffffffffffffffffffffffffffffffff7fffc03"
+        "ff",
+        16,
+    ),
+    int(
+        "7fffff80000000000000000000000000000000000000000000003fc0040000000000000000000"
+        "0001e0000000000000000000000000000000000000000000000000007c0000000000000000000"
+        "00000000000000000800000000",
+        16,
+    ),
+    int(
+        "10000000000000000000000000000000000000000000000000000000000000000000000000140"
+        "0",
+        16,
+    ),
+    int(
+        "3c000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "0000000000000000000000000000000000000000000000002800",
+        16,
+    ),
+    int(
+        "0",
+        16,
+    ),
+    int(
+        "70000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000",
+        16,
+    ),
+    int(
+        "c00000000000000000000000000000000000000000000000000000000000000000fffffffffff"
+        "fffffffffffffffffffffffffe000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000003c000",
+        16,
+    ),
+    int(
+        "fffffffffffffffbffffffffffffff00000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "000000000000000000000000",
+        16,
+    ),
+    int(
+        "40000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "000000000",
+        16,
+    ),
+    int(
+        "3ffffffffffffffffffffffff0000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000000000000"
+        "0000000000000000000000000000000000000000000000000",
+        16,
+    ),
+    int(
+        "0",
+        16,
+    ),
+)
+
+# Bitmask of the modelsets (MODELSETS order) each model belongs to
+MODEL_MODELSETS = {
+    "/515AE(Ether)": 0x445,
+    "/616AE(Ether)": 0x5C5,
+    "/818AE": 0x5C5,
+    "DHC-40.1": 0x041,
+    "DHC-40.2": 0x045,
+    "DHC-60.5": 0x5C5,
+    "DHC-60.7": 0x5C5,
+    "DHC-80.1": 0x0C1,
+    "DHC-80.2": 0x0C5,
+    "DHC-80.3": 0x4C5,
+    "DHC-80.6": 0x5C5,
+    "DHC-9.9": 0x0C1,
+    "DRC-R1": 0x5E7,
+    "DRX-2": 0x467,
+    "DRX-2.1": 0x46F,
+    "DRX-3": 0x467,
+    "DRX-3.1": 0x46F,
+    "DRX-4": 0x467,
+    "DRX-4.1": 0x46F,
+    "DRX-5": 0x5E7,
+    "DRX-5.1": 0x5EF,
+    "DRX-7": 0x5E7,
+    "DRX-R1": 0x5E7,
+    "DTC-7": 0x041,
+    "DTC-9.1": 0x041,
+    "DTC-9.4": 0x041,
+    "DTC-9.8": 0x0D1,
+    "DTM-7": 0x46F,
+    "DTR-10.5": 0x0D1,
+    "DTR-20.1": 0x041,
+    "DTR-20.2": 0x045,
+    "DTR-20.3": 0x445,
+    "DTR-20.4": 0x445,
+    "DTR-20.7": 0x445,
+    "DTR-30.1": 0x041,
+    "DTR-30.2": 0x045,
+    "DTR-30.3": 0x445,
+    "DTR-30.4": 0x5C5,
+    "DTR-30.5": 0x445,
+    "DTR-30.6": 0x445,
+    "DTR-30.7": 0x445,
+    "DTR-4.5": 0x041,
+    "DTR-4.6": 0x051,
+    "DTR-4.9": 0x051,
+    "DTR-40.1": 0x041,
+    "DTR-40.2": 0x045,
+    "DTR-40.3": 0x445,
+    "DTR-40.4": 0x5C5,
+    "DTR-40.5": 0x5C5,
+    "DTR-40.6": 0x5C5,
+    "DTR-40.7": 0x445,
+    "DTR-5.2": 0x041,
+    "DTR-5.3": 0x041,
+    "DTR-5.4": 0x041,
+    "DTR-5.5": 0x041,
+    "DTR-5.6": 0x051,
+    "DTR-5.8": 0x051,
+    "DTR-5.9": 0x051,
+    "DTR-50.1": 0x0C1,
+    "DTR-50.2": 0x0C5,
+    "DTR-50.3": 0x4C5,
+    "DTR-50.4": 0x5C5,
+    "DTR-50.5": 0x5C5,
+    "DTR-50.6": 0x5C5,
+    "DTR-50.7": 0x5C5,
+    "DTR-6.2": 0x041,
+    "DTR-6.3": 0x041,
+    "DTR-6.4": 0x041,
+    "DTR-6.5": 0x041,
+    "DTR-6.6": 0x051,
+    "DTR-6.8": 0x051,
+    "DTR-6.9": 0x051,
+    "DTR-60.5": 0x5C5,
+    "DTR-60.6": 0x5C5,
+    "DTR-60.7": 0x5C5,
+    "DTR-7.1": 0x041,
+    "DTR-7.2": 0x041,
+    "DTR-7.3": 0x041,
+    "DTR-7.4": 0x041,
+    "DTR-7.6": 0x051,
+    "DTR-7.7": 0x051,
+    "DTR-7.8": 0x0D1,
+    "DTR-7.9": 0x041,
+    "DTR-70.1": 0x2C1,
+    "DTR-70.2": 0x2C5,
+    "DTR-70.3": 0x6C5,
+    "DTR-70.4": 0x7C5,
+    "DTR-70.6": 0x5C5,
+    "DTR-8.2": 0x041,
+    "DTR-8.3": 0x041,
+    "DTR-8.4": 0x041,
+    "DTR-8.8": 0x0D1,
+    "DTR-8.9": 0x0C1,
+    "DTR-80.1": 0x2C1,
+    "DTR-80.2": 0x2C5,
+    "DTR-80.3": 0x6C5,
+    "DTR-9.1": 0x061,
+    "DTR-9.9": 0x0C1,
+    "DTX-5.8": 0x051,
+    "DTX-5.9": 0x051,
+    "DTX-7": 0x041,
+    "DTX-7.7": 0x051,
+    "DTX-7.8": 0x0D1,
+    "DTX-8.8": 0x0D1,
+    "DTX-8.9": 0x0C1,
+    "DTX-9.9": 0x0C1,
+    "ETX-NA1000": 0x0D1,
+    "HT-R693(Ether)": 0x445,
+    "HT-R993(Ether)": 0x445,
+    "HT-RC550(Ether)": 0x445,
+    "HT-RC560(Ether)": 0x445,
+    "HT-RC660": 0x445,
+    "NR-365(Ether)": 0x405,
+    "PR-RZ5100": 0x5E7,
+    "PR-SC5507": 0x0C1,
+    "PR-SC5508": 0x0C5,
+    "PR-SC5509": 0x5C5,
+    "PR-SC5530": 0x5C5,
+    "PR-SC885": 0x0D1,
+    "PR-SC886": 0x0C1,
+    "RDC-7": 0x061,
+    "RDC-7(Ver2.0)": 0x041,
+    "RDC-7.1": 0x0D1,
+    "TX-8270(Ether)": 0x46F,
+    "TX-DS787": 0x041,
+    "TX-DS797": 0x041,
+    "TX-DS898": 0x041,
+    "TX-DS989": 0x061,
+    "TX-NA900": 0x041,
+    "TX-NA905": 0x0D1,
+    "TX-NA906": 0x0C1,
+    "TX-NA906X": 0x0C1,
+    "TX-NR1000": 0x0D1,
+    "TX-NR1007": 0x0C1,
+    "TX-NR1008": 0x0C5,
+    "TX-NR1009": 0x4C5,
+    "TX-NR1010": 0x5C5,
+    "TX-NR1030": 0x5C5,
+    "TX-NR3007": 0x0C1,
+    "TX-NR3008": 0x0C5,
+    "TX-NR3009": 0x4C5,
+    "TX-NR3010": 0x5C5,
+    "TX-NR3030": 0x5C5,
+    "TX-NR414(Ether)": 0x445,
+    "TX-NR474(Ether)": 0x42F,
+    "TX-NR5000": 0x0D1,
+    "TX-NR5007": 0x0C1,
+    "TX-NR5008": 0x0C5,
+    "TX-NR5009": 0x4C5,
+    "TX-NR5010": 0x5C5,
+    "TX-NR509(Ether)": 0x045,
+    "TX-NR515": 0x445,
+    "TX-NR525": 0x445,
+    "TX-NR535(Ether)": 0x445,
+    "TX-NR545(Ether)": 0x445,
+    "TX-NR555(Ether)": 0x467,
+    "TX-NR575(Ether)": 0x46F,
+    "TX-NR575DAB(Ether)": 0x46F,
+    "TX-NR575E(Ether)": 0x46F,
+    "TX-NR579(Ether)": 0x445,
+    "TX-NR609(Ether)": 0x445,
+    "TX-NR616": 0x5C5,
+    "TX-NR626": 0x445,
+    "TX-NR636": 0x445,
+    "TX-NR646(Ether)": 0x445,
+    "TX-NR656(Ether)": 0x467,
+    "TX-NR676(Ether)": 0x46F,
+    "TX-NR676E(Ether)": 0x46F,
+    "TX-NR708": 0x045,
+    "TX-NR709": 0x445,
+    "TX-NR717(Ether)": 0x5C5,
+    "TX-NR727(Ether)": 0x5C5,
+    "TX-NR737(Ether)": 0x5C5,
+    "TX-NR747(Ether)": 0x445,
+    "TX-NR757": 0x467,
+    "TX-NR777": 0x46F,
+    "TX-NR807": 0x0C1,
+    "TX-NR808": 0x0C5,
+    "TX-NR809": 0x4C5,
+    "TX-NR818": 0x5C5,
+    "TX-NR828(Ether)": 0x5C5,
+    "TX-NR838(Ether)": 0x5C5,
+    "TX-NR900": 0x041,
+    "TX-NR901": 0x041,
+    "TX-NR905": 0x0D1,
+    "TX-NR906": 0x0C1,
+    "TX-NR929": 0x5C5,
+    "TX-RZ1100": 0x5E7,
+    "TX-RZ3100": 0x5E7,
+    "TX-RZ610": 0x467,
+    "TX-RZ620": 0x46F,
+    "TX-RZ710": 0x467,
+    "TX-RZ720": 0x46F,
+    "TX-RZ800": 0x5C5,
+    "TX-RZ810": 0x5E7,
+    "TX-RZ820": 0x5EF,
+    "TX-RZ900": 0x5C5,
+    "TX-SA706": 0x051,
+    "TX-SA706X": 0x001,
+    "TX-SA805": 0x0D1,
+    "TX-SA806": 0x041,
+    "TX-SA806X": 0x0C1,
+    "TX-SA875": 0x0D1,
+    "TX-SA876": 0x0C1,
+    "TX-SR702": 0x051,
+    "TX-SR703": 0x051,
+    "TX-SR705": 0x051,
+    "TX-SR706": 0x051,
+    "TX-SR707": 0x041,
+    "TX-SR803": 0x051,
+    "TX-SR804": 0x051,
+    "TX-SR805": 0x0D1,
+    "TX-SR806": 0x041,
+    "TX-SR875": 0x0D1,
+    "TX-SR876": 0x0C1,
+}
@@ -1,5 +1,6 @@
-"""Model to source mapping for Onkyo receivers."""
+"""Model to source and listening-mode mapping for Onkyo receivers."""
 # Generated from eiscp-commands.yaml
+# Input hash: 47642d13af3e191bfd1ae1ed547a385d7c31a39240effeba6025bfc8b9afe2c6
 # pylint: disable=line-too-long
 
 SOURCE_SETS = {
@@ -311,3 +312,303 @@ MODEL_SET_MAPPING = {
 }
 
 MODEL_SOURCES = {model: SOURCE_SETS[sid] for model, sid in MODEL_SET_MAPPING.items()}
+
+LISTENING_MODE_SETS = {
+    "L1": [
+        "action",
+        "all-ch-stereo",
+        "audyssey-dsx",
+        "auto-surround",
+        "cinema2",
+        "direct",
+        "dolby-ex",
+        "dolby-ex-audyssey-dsx",
+        "dolby-surround",
+        "dolby-surround-thx-cinema",
+        "dolby-surround-thx-games",
+        "dolby-surround-thx-music",
+        "dts-neural-x-thx-cinema",
+        "dts-neural-x-thx-games",
+        "dts-neural-x-thx-music",
+        "dts-surround-sensation",
+        "full-mono",
+        "game-action",
+        "game-rock",
+        "game-rpg",
+        "game-sports",
+        "mono",
+        "mono-movie",
+        "multiplex",
+        "music",
+        "neo-6-cinema-audyssey-dsx",
+        "neo-6-cinema-dts-surround-sensation",
+        "neo-6-music-audyssey-dsx",
+        "neo-6-music-dts-surround-sensation",
+        "neo-x-game",
+        "neo-x-music",
+        "neural-digital-music",
+        "neural-digital-music-audyssey-dsx",
+        "neural-surr",
+        "neural-surround",
+        "neural-surround-audyssey-dsx",
+        "neural-thx-cinema",
+        "neural-thx-games",
+        "neural-thx-music",
+        "neural-x",
+        "orchestra",
+        "plii-game-audyssey-dsx",
+        "plii-movie-audyssey-dsx",
+        "plii-music-audyssey-dsx",
+        "pliix-game",
+        "pliix-music",
+        "pliiz-height",
+        "pliiz-height-thx-cinema",
+        "pliiz-height-thx-games",
+        "pliiz-height-thx-music",
+        "pure-audio",
+        "s-games",
+        "s-music",
+        "s2-cinema",
+        "s2-games",
+        "s2-music",
+        "sports",
+        "stage",
+        "stereo",
+        "straight-decode",
+        "studio-mix",
+        "surround",
+        "surround-enhancer",
+        "theater-dimensional",
+        "thx",
+        "thx-cinema",
+        "thx-games",
+        "thx-music",
+        "thx-surround-ex",
+        "tv-logic",
+        "unplugged",
+        "whole-house",
+    ],
+}
+
+MODEL_LISTENING_MODE_MAPPING = {
+    "/515AE(Ether)": "L1",
+    "/616AE(Ether)": "L1",
+    "/818AE": "L1",
+    "DHC-40.1": "L1",
+    "DHC-40.2": "L1",
+    "DHC-60.5": "L1",
+    "DHC-60.7": "L1",
+    "DHC-80.1": "L1",
+    "DHC-80.2": "L1",
+    "DHC-80.3": "L1",
+    "DHC-80.6": "L1",
+    "DHC-9.9": "L1",
+    "DRC-R1": "L1",
+    "DRX-2": "L1",
+    "DRX-2.1": "L1",
+    "DRX-3": "L1",
+    "DRX-3.1": "L1",
+    "DRX-4": "L1",
+    "DRX-4.1": "L1",
+    "DRX-5": "L1",
+    "DRX-5.1": "L1",
+    "DRX-7": "L1",
+    "DRX-R1": "L1",
+    "DTC-7": "L1",
+    "DTC-9.1": "L1",
+    "DTC-9.4": "L1",
+    "DTC-9.8": "L1",
+    "DTM-7": "L1",
+    "DTR-10.5": "L1",
+    "DTR-20.1": "L1",
+    "DTR-20.2": "L1",
+    "DTR-20.3": "L1",
+    "DTR-20.4": "L1",
+    "DTR-20.7": "L1",
+    "DTR-30.1": "L1",
+    "DTR-30.2": "L1",
+    "DTR-30.3": "L1",
+    "DTR-30.4": "L1",
+    "DTR-30.5": "L1",
+    "DTR-30.6": "L1",
+    "DTR-30.7": "L1",
+    "DTR-4.5": "L1",
+    "DTR-4.6": "L1",
+    "DTR-4.9": "L1",
+    "DTR-40.1": "L1",
+    "DTR-40.2": "L1",
+    "DTR-40.3": "L1",
+    "DTR-40.4": "L1",
+    "DTR-40.5": "L1",
+    "DTR-40.6": "L1",
+    "DTR-40.7": "L1",
+    "DTR-5.2": "L1",
+    "DTR-5.3": "L1",
+    "DTR-5.4": "L1",
+    "DTR-5.5": "L1",
+    "DTR-5.6": "L1",
+    "DTR-5.8": "L1",
+    "DTR-5.9": "L1",
+    "DTR-50.1": "L1",
+    "DTR-50.2": "L1",
+    "DTR-50.3": "L1",
+    "DTR-50.4": "L1",
+    "DTR-50.5": "L1",
+    "DTR-50.6": "L1",
+    "DTR-50.7": "L1",
+    "DTR-6.2": "L1",
+    "DTR-6.3": "L1",
+    "DTR-6.4": "L1",
+    "DTR-6.5": "L1",
+    "DTR-6.6": "L1",
+    "DTR-6.8": "L1",
+    "DTR-6.9": "L1",
+    "DTR-60.5": "L1",
+    "DTR-60.6": "L1",
+    "DTR-60.7": "L1",
+    "DTR-7.1": "L1",
+    "DTR-7.2": "L1",
+    "DTR-7.3": "L1",
+    "DTR-7.4": "L1",
+    "DTR-7.6": "L1",
+    "DTR-7.7": "L1",
+    "DTR-7.8": "L1",
+    "DTR-7.9": "L1",
+    "DTR-70.1": "L1",
+    "DTR-70.2": "L1",
+    "DTR-70.3": "L1",
+    "DTR-70.4": "L1",
+    "DTR-70.6": "L1",
+    "DTR-8.2": "L1",
+    "DTR-8.3": "L1",
+    "DTR-8.4": "L1",
+    "DTR-8.8": "L1",
+    "DTR-8.9": "L1",
+    "DTR-80.1": "L1",
+    "DTR-80.2": "L1",
+    "DTR-80.3": "L1",
+    "DTR-9.1": "L1",
+    "DTR-9.9": "L1",
+    "DTX-5.8": "L1",
+    "DTX-5.9": "L1",
+    "DTX-7": "L1",
+    "DTX-7.7": "L1",
+    "DTX-7.8": "L1",
+    "DTX-8.8": "L1",
+    "DTX-8.9": "L1",
+    "DTX-9.9": "L1",
+    "ETX-NA1000": "L1",
+    "HT-R693(Ether)": "L1",
+    "HT-R993(Ether)": "L1",
+    "HT-RC550(Ether)": "L1",
+    "HT-RC560(Ether)": "L1",
+    "HT-RC660": "L1",
+    "NR-365(Ether)": "L1",
+    "PR-RZ5100": "L1",
+    "PR-SC5507": "L1",
+    "PR-SC5508": "L1",
+    "PR-SC5509": "L1",
+    "PR-SC5530": "L1",
+    "PR-SC885": "L1",
+    "PR-SC886": "L1",
+    "RDC-7": "L1",
+    "RDC-7(Ver2.0)": "L1",
+    "RDC-7.1": "L1",
+    "TX-8270(Ether)": "L1",
+    "TX-DS787": "L1",
+    "TX-DS797": "L1",
+    "TX-DS898": "L1",
+    "TX-DS989": "L1",
+    "TX-NA900": "L1",
+    "TX-NA905": "L1",
+    "TX-NA906": "L1",
+    "TX-NA906X": "L1",
+    "TX-NR1000": "L1",
+    "TX-NR1007": "L1",
+    "TX-NR1008": "L1",
+    "TX-NR1009": "L1",
+    "TX-NR1010": "L1",
+    "TX-NR1030": "L1",
+    "TX-NR3007": "L1",
+    "TX-NR3008": "L1",
+    "TX-NR3009": "L1",
+    "TX-NR3010": "L1",
+    "TX-NR3030": "L1",
+    "TX-NR414(Ether)": "L1",
+    "TX-NR474(Ether)": "L1",
+    "TX-NR5000": "L1",
+    "TX-NR5007": "L1",
+    "TX-NR5008": "L1",
+    "TX-NR5009": "L1",
+    "TX-NR5010": "L1",
+    "TX-NR509(Ether)": "L1",
+    "TX-NR515": "L1",
+    "TX-NR525": "L1",
+    "TX-NR535(Ether)": "L1",
+    "TX-NR545(Ether)": "L1",
+    "TX-NR555(Ether)": "L1",
+    "TX-NR575(Ether)": "L1",
+    "TX-NR575DAB(Ether)": "L1",
+    "TX-NR575E(Ether)": "L1",
+    "TX-NR579(Ether)": "L1",
+    "TX-NR609(Ether)": "L1",
+    "TX-NR616": "L1",
+    "TX-NR626": "L1",
+    "TX-NR636": "L1",
+    "TX-NR646(Ether)": "L1",
+    "TX-NR656(Ether)": "L1",
+    "TX-NR676(Ether)": "L1",
+    "TX-NR676E(Ether)": "L1",
+    "TX-NR708": "L1",
+    "TX-NR709": "L1",
+    "TX-NR717(Ether)": "L1",
+    "TX-NR727(Ether)": "L1",
+    "TX-NR737(Ether)": "L1",
+    "TX-NR747(Ether)": "L1",
+    "TX-NR757": "L1",
+    "TX-NR777": "L1",
+    "TX-NR807": "L1",
+    "TX-NR808": "L1",
+    "TX-NR809": "L1",
+    "TX-NR818": "L1",
+    "TX-NR828(Ether)": "L1",
+    "TX-NR838(Ether)": "L1",
+    "TX-NR900": "L1",
+    "TX-NR901": "L1",
+    "TX-NR905": "L1",
+    "TX-NR906": "L1",
+    "TX-NR929": "L1",
+    "TX-RZ1100": "L1",
+    "TX-RZ3100": "L1",
+    "TX-RZ610": "L1",
+    "TX-RZ620": "L1",
+    "TX-RZ710": "L1",
+    "TX-RZ720": "L1",
+    "TX-RZ800": "L1",
+    "TX-RZ810": "L1",
+    "TX-RZ820": "L1",
+    "TX-RZ900": "L1",
+    "TX-SA706": "L1",
+    "TX-SA706X": "L1",
+    "TX-SA805": "L1",
+    "TX-SA806": "L1",
+    "TX-SA806X": "L1",
+    "TX-SA875": "L1",
+    "TX-SA876": "L1",
+    "TX-SR702": "L1",
+    "TX-SR703": "L1",
+    "TX-SR705": "L1",
+    "TX-SR706": "L1",
+    "TX-SR707": "L1",
+    "TX-SR803": "L1",
+    "TX-SR804": "L1",
+    "TX-SR805": "L1",
+    "TX-SR806": "L1",
+    "TX-SR875": "L1",
+    "TX-SR876": "L1",
+}
+
+MODEL_LISTENING_MODES = {
+    model: LISTENING_MODE_SETS[lid]
+    for model, lid in MODEL_LISTENING_MODE_MAPPING.items()
+}
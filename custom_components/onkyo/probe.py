@@ -0,0 +1,236 @@
+"""
+Hand-off of the config flow's receiver connection to entry setup.
+
+The config flow already connects to the receiver to validate it. Instead of
+closing that connection, the flow parks it together with the facts it
+learned (model, firmware, zones), and ``async_setup_entry`` picks it up, so
+the first setup after onboarding needs no extra connect or probe queries.
+Connections nobody claims are closed after a short time.
+
+The receiver's NRI self-description is stored per device (its MAC address)
+and firmware, so it is only read again after a firmware update.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .cache import async_get_cache
+from .capabilities import get_capabilities
+from .const import DATA_PROBES, EXTRA_ZONES, PROBE_TTL
+from .receiver_info import ReceiverInfo, device_key, query_receiver_info
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ReceiverProbe:
+    """A connected receiver and the facts the config flow learned about it."""
+
+    host: str
+    receiver: Any
+    model_name: str | None = None
+    firmware: str | None = None
+    zones: list[str] | None = None
+    info: ReceiverInfo | None = None
+    _cancel: CALLBACK_TYPE | None = field(default=None, repr=False)
+
+
+def _query(receiver: Any, command: str) -> Any:
+    """Return the value of a query, or None if the receiver did not answer."""
+    try:
+        result = receiver.command(f"{command}=query")
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+    if isinstance(result, tuple) and result:
+        return result[-1]
+    return result
+
+
+def query_firmware(receiver: Any) -> str | None:
+    """
+    Query the firmware version of a receiver.
+
+    Runs in the executor.
+
+    Args:
+        receiver: The connected eISCP receiver.
+
+    Returns:
+        str | None: The firmware version, or None if the receiver did not
+        answer.
+    """
+    firmware = _query(receiver, "firmware-version")
+    return firmware if isinstance(firmware, str) and firmware else None
+
+
+def probe_receiver(
+    receiver: Any,
+    host: str,
+    firmware: str | None = None,
+    info: ReceiverInfo | None = None,
+) -> ReceiverProbe:
+    """
+    Collect the facts of a receiver that answered a power query.
+
+    Runs in the executor. Zones come from the NRI information when the
+    receiver reported them. Otherwise they are only probed for models in
+    the capability index, and only those the model can have, so the probe
+    never waits for a query to time out.
+
+    Args:
+        receiver: The connected eISCP receiver.
+        host: The host of the receiver.
+        firmware: The firmware version, if known.
+        info: The NRI information of the receiver, if it answered.
+
+    Returns:
+        ReceiverProbe: The probe holding the receiver and its facts.
+    """
+    model_name = getattr(receiver, "model_name", None)
+    # eISCP reports "unknown-model" unless discovery found the receiver
+    if not isinstance(model_name, str) or model_name.startswith("unknown"):
+        model_name = info.model_name if info is not None else None
+    if firmware is None and info is not None:
+        firmware = info.firmware
+
+    zones = None
+    if info is not None and info.zones:
+        zones = list(info.zones)
+    elif (capabilities := get_capabilities(model_name)) is not None:
+        zones = ["main"]
+        for zone in EXTRA_ZONES:
+            if capabilities.supports_zone(zone) and _query(receiver, f"{zone}.power"):
+                zones.append(zone)
+
+    return ReceiverProbe(
+        host=host,
+        receiver=receiver,
+        model_name=model_name,
+        firmware=firmware,
+        zones=zones,
+        info=info,
+    )
+
+
+async def async_probe_receiver(
+    hass: HomeAssistant, receiver: Any, host: str, identifier: str | None = None
+) -> ReceiverProbe:
+    """
+    Collect the facts of a receiver, reading its NRI XML once per firmware.
+
+    The stored information is looked up by the MAC address of the unit, so
+    it can only be reused when discovery just reported which unit answers
+    at the host; an address handed to another receiver never gets the
+    information of the previous one.
+
+    Args:
+        hass: The Home Assistant instance.
+        receiver: The connected eISCP receiver.
+        host: The host of the receiver.
+        identifier: The identifier discovery reported for the receiver, if
+            it was found by a network scan.
+
+    Returns:
+        ReceiverProbe: The probe holding the receiver and its facts.
+    """
+    firmware = await hass.async_add_executor_job(query_firmware, receiver)
+
+    cache = await async_get_cache(hass)
+    stored = None
+    if (device := device_key(identifier)) is not None:
+        stored = cache.async_get_receiver_info(device, firmware)
+    if stored is not None:
+        _LOGGER.debug("Using stored NRI information of %s", host)
+        info: ReceiverInfo | None = ReceiverInfo.from_dict(stored)
+    else:
+        info = await hass.async_add_executor_job(query_receiver_info, receiver)
+        if (
+            info is not None
+            and firmware
+            and (device := device_key(info.identifier)) is not None
+        ):
+            cache.async_set_receiver_info(device, firmware, info.as_dict())
+
+    probe: ReceiverProbe = await hass.async_add_executor_job(
+        probe_receiver, receiver, host, firmware, info
+    )
+    return probe
+
+
+async def _async_close(hass: HomeAssistant, probe: ReceiverProbe) -> None:
+    """Close the connection of a probe."""
+    try:
+        await hass.async_add_executor_job(probe.receiver.disconnect)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        _LOGGER.debug("Error closing probe connection to %s: %s", probe.host, err)
+
+
+@callback
+def async_store_probe(hass: HomeAssistant, probe: ReceiverProbe) -> None:
+    """
+    Park a probe for entry setup, replacing any earlier one for the host.
+
+    Args:
+        hass: The Home Assistant instance.
+        probe: The probe to park; its connection is closed if it is not
+            claimed within PROBE_TTL seconds.
+    """
+    probes: dict[str, ReceiverProbe] = hass.data.setdefault(DATA_PROBES, {})
+    if (previous := probes.pop(probe.host, None)) is not None:
+        async_release_probe(hass, previous)
+
+    @callback
+    def _async_expire(_now: datetime) -> None:
+        probe._cancel = None
+        if probes.get(probe.host) is probe:
+            del probes[probe.host]
+            _LOGGER.debug("Closing unclaimed probe connection to %s", probe.host)
+            async_release_probe(hass, probe)
+
+    probe._cancel = async_call_later(
+        hass,
+        PROBE_TTL,
+        HassJob(_async_expire, "onkyo probe expiry", cancel_on_shutdown=True),
+    )
+    probes[probe.host] = probe
+
+
+@callback
+def async_take_probe(hass: HomeAssistant, host: str) -> ReceiverProbe | None:
+    """
+    Claim the parked probe of a host.
+
+    Args:
+        hass: The Home Assistant instance.
+        host: The host of the receiver.
+
+    Returns:
+        ReceiverProbe | None: The probe, or None if there is none (left).
+    """
+    probe: ReceiverProbe | None = hass.data.get(DATA_PROBES, {}).pop(host, None)
+    if probe is not None and probe._cancel is not None:
+        probe._cancel()
+        probe._cancel = None
+    return probe
+
+
+@callback
+def async_release_probe(hass: HomeAssistant, probe: ReceiverProbe) -> None:
+    """
+    Stop the expiry timer of a probe and close its connection.
+
+    Args:
+        hass: The Home Assistant instance.
+        probe: The probe to release.
+    """
+    if probe._cancel is not None:
+        probe._cancel()
+        probe._cancel = None
+    hass.async_create_task(_async_close(hass, probe), "onkyo probe close")
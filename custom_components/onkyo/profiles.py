@@ -0,0 +1,317 @@
+"""
+Indexed receiver profile registry with model name normalization.
+
+Model strings reported by receivers and SSDP vary in case, separators and
+suffixes (``TX-NR609(Ether)``, ``vsx-932``, ``/515AE(Ether)``). Every known
+model name is indexed under a normalized form once, so resolving a reported
+name is a single dictionary lookup in the common case. Names that still
+miss can fall back to a trigram index for a nearest match; as a near miss
+may well be another model, that is only used to suggest settings the user
+confirms, never to pick the sources or timing of a receiver.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
+
+from .const import COMMAND_DELAY, POWER_ON_DELAY, POWER_ON_TIMEOUT
+
+# Parenthesized suffixes such as "(Ether)" or "(B)" and all separators
+_SUFFIX_RE = re.compile(r"\([^)]*\)\s*$")
+_SEPARATORS_RE = re.compile(r"[^0-9a-z]+")
+
+# Minimum trigram similarity (Jaccard) for a nearest-match fallback
+FUZZY_MATCH_THRESHOLD = 0.6
+
+# Other names a profiled model is sold or reported under
+PROFILE_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        # Same receiver without the DAB tuner
+        "VSX-S520": "VSX-S520D",
+    }
+)
+
+
+def normalize_model_name(model_name: str) -> str:
+    """
+    Return the normalized form of a model name.
+
+    Case is folded, a trailing parenthesized suffix is stripped and all
+    separators are removed, so "TX-NR609(Ether)" becomes "txnr609".
+
+    Args:
+        model_name: The model name as reported.
+
+    Returns:
+        str: The normalized model name.
+    """
+    name = _SUFFIX_RE.sub("", model_name.strip())
+    return _SEPARATORS_RE.sub("", name.casefold())
+
+
+def _trigrams(normalized: str) -> frozenset[str]:
+    """Return the padded trigrams of a normalized name."""
+    padded = f"  {normalized} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class ModelNameIndex:
+    """
+    Resolve reported model names to the names used as keys in a table.
+
+    Exact names and aliases are tried first, then the normalized form, and
+    only then, if asked for, the most similar name by trigram similarity.
+    Results are memoized per reported name.
+    """
+
+    __slots__ = ("_exact", "_normalized", "_trigrams", "_postings", "_resolved")
+
+    def __init__(
+        self, names: Iterable[str], aliases: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Build the index.
+
+        Args:
+            names: The canonical model names.
+            aliases: Other names mapped to canonical names.
+        """
+        self._exact: dict[str, str] = {}
+        self._normalized: dict[str, str] = {}
+        self._trigrams: dict[str, frozenset[str]] = {}
+        self._postings: dict[str, list[str]] = {}
+        self._resolved: dict[tuple[str, bool], str | None] = {}
+
+        # Shorter names first, so "TX-NR609" wins over "TX-NR609(Ether)"
+        for name in sorted(names, key=lambda name: (len(name), name)):
+            self._add(name, name)
+        for alias, name in (aliases or {}).items():
+            if name in self._exact:
+                self._add(alias, name)
+
+    def _add(self, name: str, canonical: str) -> None:
+        """Index a name under its exact and normalized forms."""
+        self._exact.setdefault(name, canonical)
+        normalized = normalize_model_name(name)
+        if not normalized or normalized in self._normalized:
+            return
+        self._normalized[normalized] = canonical
+        grams = self._trigrams[normalized] = _trigrams(normalized)
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(normalized)
+
+    def resolve(self, model_name: str | None, fuzzy: bool = False) -> str | None:
+        """
+        Return the canonical name for a reported model name.
+
+        Args:
+            model_name: The model name as reported.
+            fuzzy: Fall back to the nearest match by trigram similarity.
+
+        Returns:
+            str | None: The canonical name, or None if nothing matches.
+        """
+        if not model_name:
+            return None
+        if (canonical := self._exact.get(model_name)) is not None:
+            return canonical
+
+        key = (model_name, fuzzy)
+        if key not in self._resolved:
+            normalized = normalize_model_name(model_name)
+            canonical = self._normalized.get(normalized)
+            if canonical is None and fuzzy:
+                canonical = self._nearest(normalized)
+            self._resolved[key] = canonical
+        return self._resolved[key]
+
+    def _nearest(self, normalized: str) -> str | None:
+        """Return the canonical name most similar to a normalized name."""
+        grams = _trigrams(normalized)
+        shared: dict[str, int] = {}
+        for gram in grams:
+            for candidate in self._postings.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        best: str | None = None
+        best_score = 0.0
+        tie = False
+        for candidate, count in shared.items():
+            score = count / len(grams | self._trigrams[candidate])
+            if score > best_score:
+                best, best_score, tie = candidate, score, False
+            elif score == best_score:
+                tie = True
+
+        if best is None or tie or best_score < FUZZY_MATCH_THRESHOLD:
+            return None
+        return self._normalized[best]
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileDefaults:
+    """Home Assistant defaults of a receiver profile."""
+
+    sources: Mapping[str, str] | None = None
+    listening_modes: tuple[str, ...] = ()
+    max_volume_percent: int | None = None
+    volume_resolution: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ReceiverTiming:
+    """
+    Timing and quirks of a receiver model.
+
+    Attributes:
+        command_interval: Minimum spacing in seconds between commands.
+        max_pipelined_queries: Commands that may be sent back to back
+            before the spacing applies.
+        power_on_delay: Seconds after power on before queries are answered.
+        power_on_timeout: Seconds to wait for the receiver to report power on.
+        reliable_push: Whether unsolicited updates can replace most polling.
+        slow_commands: Extra settle time in seconds after ISCP commands
+            (e.g. "SLI") that keep the receiver busy.
+    """
+
+    command_interval: float = COMMAND_DELAY
+    max_pipelined_queries: int = 1
+    power_on_delay: float = POWER_ON_DELAY
+    power_on_timeout: float = POWER_ON_TIMEOUT
+    reliable_push: bool = False
+    slow_commands: Mapping[str, float] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ReceiverProfile:
+    """Static facts about a receiver model."""
+
+    model: str
+    brand: str
+    eiscp_port: int
+    defaults: ProfileDefaults
+    timing: ReceiverTiming = field(default_factory=ReceiverTiming)
+    zones: frozenset[str] = frozenset()
+    inputs_present: tuple[str, ...] = ()
+    listening_mode_families: tuple[str, ...] = ()
+    net_services: tuple[str, ...] = ()
+    tuners: frozenset[str] = frozenset()
+    hdmi_outputs: Mapping[str, Any] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    product_page: tuple[str, ...] = ()
+
+
+# Defaults for models without a profile
+EMPTY_DEFAULTS = ProfileDefaults()
+DEFAULT_TIMING = ReceiverTiming()
+
+
+def _timing_from_dict(data: Mapping[str, Any]) -> ReceiverTiming:
+    """Build the timing of a profile, keeping defaults for missing fields."""
+    if not data:
+        return DEFAULT_TIMING
+    fields = {key: value for key, value in data.items() if value is not None}
+    if "slow_commands" in fields:
+        fields["slow_commands"] = MappingProxyType(dict(fields["slow_commands"]))
+    return ReceiverTiming(**fields)
+
+
+def profile_from_dict(model: str, data: Mapping[str, Any]) -> ReceiverProfile:
+    """
+    Build a frozen profile from its dictionary form.
+
+    Args:
+        model: The model name the profile is registered under.
+        data: The profile as stored in RECEIVER_PROFILES.
+
+    Returns:
+        ReceiverProfile: The frozen profile.
+    """
+    ha_defaults = data.get("ha_defaults", {})
+    sources = ha_defaults.get("sources")
+    defaults = ProfileDefaults(
+        sources=MappingProxyType(dict(sources)) if sources is not None else None,
+        listening_modes=tuple(ha_defaults.get("listening_modes", ())),
+        max_volume_percent=ha_defaults.get("max_volume_percent"),
+        volume_resolution=ha_defaults.get("volume_resolution"),
+    )
+    return ReceiverProfile(
+        model=data.get("model", model),
+        brand=data.get("brand", "Onkyo"),
+        eiscp_port=data.get("eiscp_port", 60128),
+        defaults=defaults,
+        timing=_timing_from_dict(data.get("timing", {})),
+        zones=frozenset(
+            zone for zone, present in data.get("zones", {}).items() if present
+        ),
+        inputs_present=tuple(data.get("inputs_present", ())),
+        listening_mode_families=tuple(data.get("listening_mode_families", ())),
+        net_services=tuple(data.get("net_services", ())),
+        tuners=frozenset(
+            tuner for tuner, present in data.get("tuners", {}).items() if present
+        ),
+        hdmi_outputs=MappingProxyType(dict(data.get("hdmi_outputs", {}))),
+        product_page=tuple(data.get("product_page", ())),
+    )
+
+
+@lru_cache(maxsize=1)
+def _profile_registry() -> tuple[ModelNameIndex, Mapping[str, ReceiverProfile]]:
+    """Build the profile index and frozen profiles on first use."""
+    from .receiver_profiles import RECEIVER_PROFILES
+
+    profiles = {
+        model: profile_from_dict(model, data)
+        for model, data in RECEIVER_PROFILES.items()
+    }
+    return ModelNameIndex(profiles, PROFILE_ALIASES), MappingProxyType(profiles)
+
+
+@lru_cache(maxsize=1)
+def _mapping_index() -> ModelNameIndex:
+    """Build the index over the models of the generated mapping."""
+    from .onkyo_model_mapping import MODEL_SET_MAPPING
+
+    return ModelNameIndex(MODEL_SET_MAPPING)
+
+
+def get_receiver_profile(
+    model_name: str | None, fuzzy: bool = False
+) -> ReceiverProfile | None:
+    """
+    Return the profile of a model by its exact or normalized name.
+
+    Args:
+        model_name: The model name as reported.
+        fuzzy: Fall back to the nearest match by trigram similarity, for
+            suggestions only.
+
+    Returns:
+        ReceiverProfile | None: The profile, or None if no profile matches.
+    """
+    index, profiles = _profile_registry()
+    if (canonical := index.resolve(model_name, fuzzy)) is None:
+        return None
+    return profiles[canonical]
+
+
+def resolve_mapped_model(model_name: str | None, fuzzy: bool = False) -> str | None:
+    """
+    Return the name a model is listed under in the generated mapping.
+
+    Args:
+        model_name: The model name as reported.
+        fuzzy: Fall back to the nearest match by trigram similarity.
+
+    Returns:
+        str | None: The mapped model name, or None if the model is unknown.
+    """
+    return _mapping_index().resolve(model_name, fuzzy)
@@ -0,0 +1,225 @@
+"""
+Receiver self-identification from the NRI information XML.
+
+``NRIQSTN`` returns an XML document describing the receiver: model,
+firmware, zones, input selectors and tuner presets. The reply runs to
+several kilobytes, so it is fed to a pull parser in slices and every
+element is dropped as soon as its data has been taken, instead of building
+a tree of the whole document.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from string import hexdigits
+from typing import Any
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+_LOGGER = logging.getLogger(__name__)
+
+NRI_QUERY = "NRIQSTN"
+_NRI = "NRI"
+
+# Slice size the reply is fed to the parser in
+CHUNK_SIZE = 2048
+
+# NRI zone IDs
+_ZONE_NAMES = {"1": "main", "2": "zone2", "3": "zone3", "4": "zone4"}
+
+
+@dataclass(frozen=True, slots=True)
+class ReceiverInfo:
+    """What a receiver reports about itself in its NRI XML."""
+
+    model_name: str | None = None
+    firmware: str | None = None
+    identifier: str | None = None
+    zones: tuple[str, ...] = ()
+    selectors: tuple[tuple[str, str], ...] = ()
+    presets: tuple[tuple[int, str], ...] = ()
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Return the information in a form that can be stored as JSON.
+
+        Returns:
+            dict[str, Any]: The information.
+        """
+        return {
+            "model_name": self.model_name,
+            "firmware": self.firmware,
+            "identifier": self.identifier,
+            "zones": list(self.zones),
+            "selectors": [list(selector) for selector in self.selectors],
+            "presets": [list(preset) for preset in self.presets],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ReceiverInfo:
+        """
+        Restore information stored with ``as_dict``.
+
+        Args:
+            data: The stored information.
+
+        Returns:
+            ReceiverInfo: The information.
+        """
+        return cls(
+            model_name=data.get("model_name"),
+            firmware=data.get("firmware"),
+            identifier=data.get("identifier"),
+            zones=tuple(data.get("zones", ())),
+            selectors=tuple(
+                (str(code), str(name)) for code, name in data.get("selectors", ())
+            ),
+            presets=tuple(
+                (int(number), str(name)) for number, name in data.get("presets", ())
+            ),
+        )
+
+
+def device_key(identifier: str | None) -> str | None:
+    """
+    Return the key the information of a receiver is stored under.
+
+    The discovery reply and the NRI XML both carry the MAC address of the
+    receiver, the former at the start of a longer identifier, so the key
+    follows the unit rather than its (possibly changing) address.
+
+    Args:
+        identifier: The identifier or MAC address reported by the receiver.
+
+    Returns:
+        str | None: The MAC address in lower-case hex, or None if the
+        identifier does not start with one.
+    """
+    mac = (identifier or "").replace(":", "").replace("-", "")[:12].lower()
+    if len(mac) != 12 or any(char not in hexdigits for char in mac):
+        return None
+    return mac
+
+
+def iter_chunks(reply: str, size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Yield the XML of an NRI reply in slices.
+
+    Args:
+        reply: The raw reply, with or without the leading "NRI".
+        size: The slice size.
+
+    Yields:
+        str: The next slice of the document.
+    """
+    start = len(_NRI) if reply.startswith(_NRI) else 0
+    for offset in range(start, len(reply), size):
+        yield reply[offset : offset + size]
+
+
+def _text(element: Any) -> str | None:
+    """Return the stripped text of an element, or None if it is empty."""
+    text = (element.text or "").strip()
+    return text or None
+
+
+def _preset_label(element: Any) -> str | None:
+    """Return the name or, failing that, the frequency of a stored preset."""
+    if element.get("band", "0") == "0":
+        return None
+    name = (element.get("name") or "").strip()
+    if name:
+        return name
+    frequency = (element.get("freq") or "").strip()
+    return frequency or None
+
+
+def parse_receiver_info(chunks: Iterable[str]) -> ReceiverInfo | None:
+    """
+    Parse an NRI XML document incrementally.
+
+    Args:
+        chunks: The document in slices, as produced by ``iter_chunks``.
+
+    Returns:
+        ReceiverInfo | None: The information, or None if the document is
+        malformed or the receiver refused the query.
+    """
+    # Only start and end events are asked for, which the typeshed event
+    # union of read_events() cannot express
+    parser: Any = XMLPullParser(events=("start", "end"))
+    fields: dict[str, str | None] = {}
+    zones: list[str] = []
+    selectors: list[tuple[str, str]] = []
+    presets: list[tuple[int, str]] = []
+    depth = 0
+
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == "start":
+                    if depth == 0 and element.get("status", "ok") != "ok":
+                        _LOGGER.debug("Receiver refused the NRI query")
+                        return None
+                    depth += 1
+                    continue
+
+                depth -= 1
+                tag = element.tag
+                if tag in ("model", "firmwareversion", "macaddress"):
+                    fields.setdefault(tag, _text(element))
+                elif tag == "zone":
+                    zone = _ZONE_NAMES.get(element.get("id", ""))
+                    if zone is not None and element.get("value") == "1":
+                        zones.append(zone)
+                elif tag == "selector":
+                    code = (element.get("id") or "").upper()
+                    if code and element.get("value") == "1":
+                        selectors.append((code, (element.get("name") or "").strip()))
+                elif tag == "preset":
+                    label = _preset_label(element)
+                    if label is not None:
+                        try:
+                            presets.append((int(element.get("id", ""), 16), label))
+                        except ValueError:
+                            pass
+                # The data has been taken; keep the partial tree small
+                element.clear()
+        parser.close()
+    except ParseError as err:
+        _LOGGER.debug("Malformed NRI reply: %s", err)
+        return None
+
+    return ReceiverInfo(
+        model_name=fields.get("model"),
+        firmware=fields.get("firmwareversion"),
+        identifier=fields.get("macaddress"),
+        zones=tuple(zones),
+        selectors=tuple(selectors),
+        presets=tuple(presets),
+    )
+
+
+def query_receiver_info(receiver: Any) -> ReceiverInfo | None:
+    """
+    Query and parse the NRI XML of a receiver.
+
+    Runs in the executor.
+
+    Args:
+        receiver: The connected eISCP receiver.
+
+    Returns:
+        ReceiverInfo | None: The information, or None if the receiver did
+        not answer.
+    """
+    try:
+        reply = receiver.raw(NRI_QUERY)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        _LOGGER.debug("NRI query failed: %s", err)
+        return None
+    if not isinstance(reply, str) or not reply.startswith(_NRI):
+        return None
+    return parse_receiver_info(iter_chunks(reply))
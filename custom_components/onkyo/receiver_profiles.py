@@ -1,4 +1,6 @@
 """Receiver profiles for Onkyo/Pioneer/Integra."""
+# Generated by ingest_profiles.py; edit the profile files instead
+# Input hash: 483bcd4484fd283806d4a3c451521adff65179ce9e47fa6200153dbea1645fd2
 
 from __future__ import annotations
 
@@ -62,6 +64,13 @@ RECEIVER_PROFILES = {
             "https://www.manua.ls/pioneer/vsx-831/manual",
             "https://www.manualslib.com/manual/1100480/Pioneer-Vsx-831.html",
         ],
+        "timing": {
+            "command_interval": 0.15,
+            "max_pipelined_queries": 2,
+            "power_on_delay": 2.0,
+            "power_on_timeout": 8.0,
+            "slow_commands": {"PWR": 1.0, "SLI": 0.5},
+        },
         "tuners": {"fm": True, "am": True, "dab": False},
         "zones": {"main": True, "zone2": False, "zone3": False, "zone_b": False},
     },
@@ -93,7 +102,10 @@ RECEIVER_PROFILES = {
         },
         "hdmi_outputs": {
             "dual_main_sub": False,
-            "notes": "Single HDMI OUT; 4K/60, BT.2020; HDR10/Dolby Vision pass‑through per generation.",
+            "notes": (
+                "Single HDMI OUT; 4K/60, BT.2020; HDR10/Dolby Vision pass‑through per "
+                "generation."
+            ),
             "service_codes": [],
         },
         "inputs_present": [
@@ -129,7 +141,7 @@ RECEIVER_PROFILES = {
         "tuners": {"fm": True, "am": True, "dab": False},
         "zones": {"main": True, "zone2": False, "zone3": False, "zone_b": False},
     },
-    "VSX-S520D": {
+    "VSX-932": {
         "brand": "Pioneer",
         "eiscp_port": 60128,
         "ha_defaults": {
@@ -137,18 +149,19 @@ RECEIVER_PROFILES = {
                 "Stereo",
                 "Direct",
                 "Dolby Surround",
+                "DTS Neural:X",
                 "All Channel Stereo",
             ],
-            "max_volume_percent": 50,
+            "max_volume_percent": 55,
             "sources": {
                 "bd": "Blu-ray",
                 "cbl/sat": "Set-top Box",
-                "strm box": "Streaming Box",
-                "game": "Game",
+                "game": "Game Console",
+                "pc": "PC",
                 "tv": "TV (ARC)",
                 "net": "Network",
-                "dab": "DAB Radio",
                 "fm": "FM Radio",
+                "am": "AM Radio",
                 "phono": "Phono",
                 "usb": "USB",
                 "bluetooth": "Bluetooth",
@@ -158,20 +171,24 @@ RECEIVER_PROFILES = {
         },
         "hdmi_outputs": {
             "dual_main_sub": False,
-            "notes": "Single HDMI OUT; 4K/60 4:4:4 pass‑through; BT.2020; HDR10 per generation.",
+            "notes": (
+                "Single HDMI OUT (ARC); 4K/60, BT.2020, HDCP 2.2; HDR10 & Dolby "
+                "Vision passtrough."
+            ),
             "service_codes": [],
         },
         "inputs_present": [
             "bd",
+            "dvd",
             "cbl/sat",
             "game",
-            "strm box",
-            "cd",
+            "pc",
             "tv",
+            "cd",
             "phono",
-            "dab",
-            "fm",
             "net",
+            "fm",
+            "am",
             "usb",
             "bluetooth",
         ],
@@ -182,17 +199,28 @@ RECEIVER_PROFILES = {
             "DTS",
             "AllChStereo",
             "Dolby Surround",
+            "DTS Neural:X",
         ],
-        "model": "VSX-S520D",
+        "model": "VSX-932",
         "net_services": ["chromecast", "dts_play_fi", "flareconnect"],
         "product_page": [
-            "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-s520d/index.php",
-            "https://www.manualslib.com/manual/1201670/Pioneer-Vsx-S520d.html",
+            "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-932/",
+            "https://pioneerhomeusa.com/vsx-932",
+            (
+                "https://intl.pioneer-audiovisual.com/manuals/docs/SN29402804B_VSX-932_BAS_En_171113_web.pdf"
+            ),
         ],
-        "tuners": {"fm": True, "am": False, "dab": True},
+        "timing": {
+            "command_interval": 0.1,
+            "max_pipelined_queries": 3,
+            "power_on_delay": 1.5,
+            "power_on_timeout": 6.0,
+            "slow_commands": {"PWR": 1.0, "SLI": 0.4, "LMD": 0.3},
+        },
+        "tuners": {"fm": True, "am": True, "dab": False},
         "zones": {"main": True, "zone2": False, "zone3": False, "zone_b": False},
     },
-    "VSX-932": {
+    "VSX-933": {
         "brand": "Pioneer",
         "eiscp_port": 60128,
         "ha_defaults": {
@@ -214,15 +242,18 @@ RECEIVER_PROFILES = {
                 "fm": "FM Radio",
                 "am": "AM Radio",
                 "phono": "Phono",
-                "usb": "USB",
                 "bluetooth": "Bluetooth",
+                "usb": "USB",
                 "cd": "CD Player",
             },
             "volume_resolution": None,
         },
         "hdmi_outputs": {
             "dual_main_sub": False,
-            "notes": "Single HDMI OUT (ARC); 4K/60, BT.2020, HDCP 2.2; HDR10 & Dolby Vision passtrough.",
+            "notes": (
+                "Single HDMI OUT with ARC; all HDMI ports support 4K/60, BT.2020, "
+                "HDCP 2.2, HDR10/HLG/Dolby Vision passthrough."
+            ),
             "service_codes": [],
         },
         "inputs_present": [
@@ -249,17 +280,101 @@ RECEIVER_PROFILES = {
             "Dolby Surround",
             "DTS Neural:X",
         ],
-        "model": "VSX-932",
-        "net_services": ["chromecast", "dts_play_fi", "flareconnect"],
+        "model": "VSX-933",
+        "net_services": [
+            "chromecast",
+            "dts_play_fi",
+            "flareconnect",
+            "airplay",
+            "spotify",
+        ],
         "product_page": [
-            "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-932/",
-            "https://pioneerhomeusa.com/vsx-932",
-            "https://intl.pioneer-audiovisual.com/manuals/docs/SN29402804B_VSX-932_BAS_En_171113_web.pdf",
+            "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-933/",
+            "https://intl.pioneer-av.com/vsx-933",
+            "https://www.manualslib.com/manual/1384477/Pioneer-Vsx-933.html",
+        ],
+        "timing": {
+            "command_interval": 0.1,
+            "max_pipelined_queries": 3,
+            "power_on_delay": 1.5,
+            "power_on_timeout": 6.0,
+            "slow_commands": {"PWR": 1.0, "SLI": 0.4, "LMD": 0.3},
+        },
+        "tuners": {"fm": True, "am": True, "dab": False},
+        "zones": {"main": True, "zone2": True, "zone3": False, "zone_b": False},
+    },
+    "VSX-LX101": {
+        "brand": "Pioneer",
+        "eiscp_port": 60128,
+        "ha_defaults": {
+            "listening_modes": [
+                "Stereo",
+                "Direct",
+                "Dolby Surround",
+                "DTS Neural:X",
+                "All Channel Stereo",
+            ],
+            "max_volume_percent": 60,
+            "sources": {
+                "bd": "Blu-ray",
+                "cbl/sat": "Set-top Box",
+                "game": "Game",
+                "pc": "PC",
+                "tv": "TV (ARC)",
+                "net": "Network",
+                "fm": "FM",
+                "am": "AM",
+                "phono": "Phono",
+                "bluetooth": "Bluetooth",
+                "cd": "CD",
+            },
+            "volume_resolution": None,
+        },
+        "hdmi_outputs": {
+            "dual_main_sub": False,
+            "notes": (
+                "Single HDMI OUT; inputs support 4K/60, HDCP 2.2; HDR/BT.2020 "
+                "generation."
+            ),
+            "service_codes": [],
+        },
+        "inputs_present": [
+            "bd",
+            "dvd",
+            "cbl/sat",
+            "game",
+            "pc",
+            "tv",
+            "cd",
+            "phono",
+            "net",
+            "fm",
+            "am",
+            "usb",
+            "bluetooth",
+        ],
+        "listening_mode_families": [
+            "Stereo",
+            "Direct",
+            "Dolby",
+            "DTS",
+            "AllChStereo",
+            "Dolby Surround",
+            "DTS Neural:X",
+        ],
+        "model": "VSX-LX101",
+        "net_services": ["chromecast", "airplay", "flareconnect"],
+        "product_page": [
+            "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-lx101/",
+            (
+                "https://www.snapav.com/wcsstore/ExtendedSitesCatalogAssetStore/attachments/documents/Pioneer/ManualsAndGuides/PE-VSX-LX101_Single%20Sheet.pdf"
+            ),
+            "https://www.manualslib.com/manual/1115059/Pioneer-Vsx-Lx101.html",
         ],
         "tuners": {"fm": True, "am": True, "dab": False},
         "zones": {"main": True, "zone2": False, "zone3": False, "zone_b": False},
     },
-    "VSX-933": {
+    "VSX-LX103": {
         "brand": "Pioneer",
         "eiscp_port": 60128,
         "ha_defaults": {
@@ -270,7 +385,7 @@ RECEIVER_PROFILES = {
                 "DTS Neural:X",
                 "All Channel Stereo",
             ],
-            "max_volume_percent": 55,
+            "max_volume_percent": 60,
             "sources": {
                 "bd": "Blu-ray",
                 "cbl/sat": "Set-top Box",
@@ -289,7 +404,9 @@ RECEIVER_PROFILES = {
         },
         "hdmi_outputs": {
             "dual_main_sub": False,
-            "notes": "Single HDMI OUT with ARC; all HDMI ports support 4K/60, BT.2020, HDCP 2.2, HDR10/HLG/Dolby Vision passthrough.",
+            "notes": (
+                "HDMI OUT (ARC); 4K/60, BT.2020; HDR10/HLG/Dolby Vision passthrough."
+            ),
             "service_codes": [],
         },
         "inputs_present": [
@@ -316,23 +433,169 @@ RECEIVER_PROFILES = {
             "Dolby Surround",
             "DTS Neural:X",
         ],
-        "model": "VSX-933",
+        "model": "VSX-LX103",
+        "net_services": ["chromecast", "dts_play_fi", "flareconnect", "airplay"],
+        "product_page": [
+            "https://pioneerhomeusa.com/vsx-lx103",
+            "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-lx103/",
+            "https://www.manua.ls/pioneer/vsx-lx103/manual",
+        ],
+        "tuners": {"fm": True, "am": True, "dab": False},
+        "zones": {"main": True, "zone2": True, "zone3": False, "zone_b": False},
+    },
+    "VSX-LX104": {
+        "brand": "Pioneer",
+        "eiscp_port": 60128,
+        "ha_defaults": {
+            "listening_modes": [
+                "Stereo",
+                "Direct",
+                "Dolby Surround",
+                "DTS Neural:X",
+                "All Channel Stereo",
+            ],
+            "max_volume_percent": 60,
+            "sources": {
+                "bd": "Blu-ray",
+                "cbl/sat": "Set-top Box",
+                "game": "Game",
+                "pc": "PC",
+                "tv": "TV (ARC/eARC)",
+                "net": "Network",
+                "fm": "FM",
+                "am": "AM",
+                "phono": "Phono",
+                "usb": "USB",
+                "bluetooth": "Bluetooth",
+                "cd": "CD",
+            },
+            "volume_resolution": None,
+        },
+        "hdmi_outputs": {
+            "dual_main_sub": True,
+            "notes": (
+                "Dual HDMI OUT (MAIN/SUB); 4K/60, BT.2020; HDR10/HLG/Dolby Vision; "
+                "HDCP 2.3."
+            ),
+            "service_codes": ["main", "sub"],
+        },
+        "inputs_present": [
+            "bd",
+            "dvd",
+            "cbl/sat",
+            "game",
+            "pc",
+            "tv",
+            "cd",
+            "phono",
+            "net",
+            "fm",
+            "am",
+            "usb",
+            "bluetooth",
+        ],
+        "listening_mode_families": [
+            "Stereo",
+            "Direct",
+            "Dolby",
+            "DTS",
+            "AllChStereo",
+            "Dolby Surround",
+            "DTS Neural:X",
+        ],
+        "model": "VSX-LX104",
+        "net_services": ["airplay2", "dts_play_fi", "sonos"],
+        "product_page": [
+            "https://intl.pioneer-av.com/vsx-lx104",
+            (
+                "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-lx104/index.php"
+            ),
+            "https://www.manua.ls/pioneer/vsx-lx104/manual",
+        ],
+        "tuners": {"fm": True, "am": True, "dab": False},
+        "zones": {"main": True, "zone2": True, "zone3": False, "zone_b": False},
+    },
+    "VSX-LX302": {
+        "brand": "Pioneer",
+        "eiscp_port": 60128,
+        "ha_defaults": {
+            "listening_modes": [
+                "Stereo",
+                "Direct",
+                "Dolby Surround",
+                "DTS Neural:X",
+                "All Channel Stereo",
+            ],
+            "max_volume_percent": 60,
+            "sources": {
+                "bd": "Blu-ray",
+                "cbl/sat": "Set-top Box",
+                "game": "Game",
+                "pc": "PC",
+                "tv": "TV (ARC)",
+                "net": "Network",
+                "fm": "FM",
+                "am": "AM",
+                "phono": "Phono",
+                "usb": "USB",
+                "bluetooth": "Bluetooth",
+                "cd": "CD",
+            },
+            "volume_resolution": None,
+        },
+        "hdmi_outputs": {
+            "dual_main_sub": True,
+            "notes": (
+                "Dual HDMI OUT (MAIN/SUB); 4K/60 pass‑through; HDR10/HLG/Dolby "
+                "Vision."
+            ),
+            "service_codes": ["main", "sub"],
+        },
+        "inputs_present": [
+            "bd",
+            "dvd",
+            "cbl/sat",
+            "game",
+            "pc",
+            "tv",
+            "cd",
+            "phono",
+            "net",
+            "fm",
+            "am",
+            "usb",
+            "bluetooth",
+        ],
+        "listening_mode_families": [
+            "Stereo",
+            "Direct",
+            "Dolby",
+            "DTS",
+            "AllChStereo",
+            "Dolby Surround",
+            "DTS Neural:X",
+        ],
+        "model": "VSX-LX302",
         "net_services": [
             "chromecast",
             "dts_play_fi",
             "flareconnect",
             "airplay",
             "spotify",
+            "tidal",
+            "deezer",
         ],
         "product_page": [
-            "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-933/",
-            "https://intl.pioneer-av.com/vsx-933",
-            "https://www.manualslib.com/manual/1384477/Pioneer-Vsx-933.html",
+            "https://pioneerhomeusa.com/vsx-lx302",
+            (
+                "https://pioneer-audiovisual.com/products/av_receiver/vsx-lx302/specification.php"
+            ),
+            "https://www.manua.ls/pioneer/vsx-lx302/manual",
         ],
         "tuners": {"fm": True, "am": True, "dab": False},
         "zones": {"main": True, "zone2": True, "zone3": False, "zone_b": False},
     },
-    "VSX-LX101": {
+    "VSX-LX303": {
         "brand": "Pioneer",
         "eiscp_port": 60128,
         "ha_defaults": {
@@ -354,15 +617,19 @@ RECEIVER_PROFILES = {
                 "fm": "FM",
                 "am": "AM",
                 "phono": "Phono",
+                "usb": "USB",
                 "bluetooth": "Bluetooth",
                 "cd": "CD",
             },
             "volume_resolution": None,
         },
         "hdmi_outputs": {
-            "dual_main_sub": False,
-            "notes": "Single HDMI OUT; inputs support 4K/60, HDCP 2.2; HDR/BT.2020 generation.",
-            "service_codes": [],
+            "dual_main_sub": True,
+            "notes": (
+                "Dual HDMI OUT (MAIN/SUB); 4K/60; HDR10/HLG/Dolby Vision; HDCP 2.2; "
+                "no eARC on this generation."
+            ),
+            "service_codes": ["main", "sub"],
         },
         "inputs_present": [
             "bd",
@@ -388,14 +655,117 @@ RECEIVER_PROFILES = {
             "Dolby Surround",
             "DTS Neural:X",
         ],
-        "model": "VSX-LX101",
-        "net_services": ["chromecast", "airplay", "flareconnect"],
+        "model": "VSX-LX303",
+        "net_services": ["chromecast", "dts_play_fi", "flareconnect", "airplay"],
         "product_page": [
-            "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-lx101/",
-            "https://www.snapav.com/wcsstore/ExtendedSitesCatalogAssetStore/attachments/documents/Pioneer/ManualsAndGuides/PE-VSX-LX101_Single%20Sheet.pdf",
-            "https://www.manualslib.com/manual/1115059/Pioneer-Vsx-Lx101.html",
+            "https://pioneerhomeusa.com/vsx-lx303",
+            "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-lx303/",
+            "https://www.manualslib.com/manual/2345468/Pioneer-Vsx-Lx303.html",
         ],
         "tuners": {"fm": True, "am": True, "dab": False},
+        "zones": {"main": True, "zone2": True, "zone3": True, "zone_b": False},
+    },
+    "VSX-LX503": {
+        "brand": "Pioneer",
+        "eiscp_port": 60128,
+        "hdmi_outputs": {
+            "dual_main_sub": True,
+            "notes": (
+                "Dual HDMI OUT (MAIN/SUB); 4K/60; HDR10/HLG/Dolby Vision; HDCP 2.2."
+            ),
+            "service_codes": ["main", "sub"],
+        },
+        "inputs_present": [
+            "bd",
+            "dvd",
+            "cbl/sat",
+            "game",
+            "pc",
+            "tv",
+            "cd",
+            "phono",
+            "net",
+            "fm",
+            "am",
+            "usb",
+            "bluetooth",
+        ],
+        "model": "VSX-LX503",
+        "net_services": ["chromecast", "dts_play_fi", "flareconnect", "airplay"],
+        "product_page": [
+            "https://pioneerhomeusa.com/vsx-lx503",
+            "https://www.manualslib.com/manual/1452339/Pioneer-Vsx-Lx503.html",
+            "https://www.manua.ls/pioneer/vsx-lx503/manual",
+        ],
+        "tuners": {"fm": True, "am": True, "dab": False},
+        "zones": {"main": True, "zone2": True, "zone3": True, "zone_b": False},
+    },
+    "VSX-S520D": {
+        "brand": "Pioneer",
+        "eiscp_port": 60128,
+        "ha_defaults": {
+            "listening_modes": [
+                "Stereo",
+                "Direct",
+                "Dolby Surround",
+                "All Channel Stereo",
+            ],
+            "max_volume_percent": 50,
+            "sources": {
+                "bd": "Blu-ray",
+                "cbl/sat": "Set-top Box",
+                "strm box": "Streaming Box",
+                "game": "Game",
+                "tv": "TV (ARC)",
+                "net": "Network",
+                "dab": "DAB Radio",
+                "fm": "FM Radio",
+                "phono": "Phono",
+                "usb": "USB",
+                "bluetooth": "Bluetooth",
+                "cd": "CD Player",
+            },
+            "volume_resolution": None,
+        },
+        "hdmi_outputs": {
+            "dual_main_sub": False,
+            "notes": (
+                "Single HDMI OUT; 4K/60 4:4:4 pass‑through; BT.2020; HDR10 per "
+                "generation."
+            ),
+            "service_codes": [],
+        },
+        "inputs_present": [
+            "bd",
+            "cbl/sat",
+            "game",
+            "strm box",
+            "cd",
+            "tv",
+            "phono",
+            "dab",
+            "fm",
+            "net",
+            "usb",
+            "bluetooth",
+        ],
+        "listening_mode_families": [
+            "Stereo",
+            "Direct",
+            "Dolby",
+            "DTS",
+            "AllChStereo",
+            "Dolby Surround",
+        ],
+        "model": "VSX-S520D",
+        "net_services": ["chromecast", "dts_play_fi", "flareconnect"],
+        "product_page": [
+            (
+                "https://intl.pioneer-audiovisual.com/products/av_receiver/vsx-s520d/index.php"
+            ),
+            "https://www.manualslib.com/manual/1201670/Pioneer-Vsx-S520d.html",
+        ],
+        "tuners": {"fm": True, "am": False, "dab": True},
         "zones": {"main": True, "zone2": False, "zone3": False, "zone_b": False},
     },
 }
@@ -0,0 +1,125 @@
+"""
+Integration-wide pacing of receiver startup and polling.
+
+With many receivers, every entry would otherwise connect, detect zones and
+poll at the same instant. Startup work takes a slot of a shared scheduler,
+so only a few receivers do it at a time, and each receiver polls at its
+own fixed phase within the poll interval.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import zlib
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .const import DATA_SCHEDULER, STARTUP_CONCURRENCY
+
+
+class StartupScheduler:
+    """Cap the number of receivers doing startup work at the same time."""
+
+    def __init__(self, limit: int = STARTUP_CONCURRENCY) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            limit: The number of receivers that may work at the same time.
+        """
+        self._semaphore = asyncio.Semaphore(limit)
+        self.active = 0
+        self.peak = 0
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Wait for a free slot and hold it for the duration of the block."""
+        async with self._semaphore:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                yield
+            finally:
+                self.active -= 1
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> StartupScheduler:
+    """
+    Return the scheduler shared by all entries.
+
+    Args:
+        hass: The Home Assistant instance.
+
+    Returns:
+        StartupScheduler: The scheduler.
+    """
+    scheduler: StartupScheduler | None = hass.data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_SCHEDULER] = StartupScheduler()
+    return scheduler
+
+
+def poll_offset(key: str, interval: float) -> float:
+    """
+    Return the phase offset of a receiver within the poll interval.
+
+    The offset is derived from a hash, so it is spread evenly over the
+    receivers and stays the same across restarts.
+
+    Args:
+        key: A stable key of the receiver (its host).
+        interval: The poll interval in seconds.
+
+    Returns:
+        float: The offset in seconds, in [0, interval).
+    """
+    return zlib.crc32(key.encode()) / 0x1_0000_0000 * interval
+
+
+@callback
+def async_track_phased_interval(
+    hass: HomeAssistant,
+    action: Callable[[datetime], Any],
+    interval: timedelta,
+    offset: float,
+) -> CALLBACK_TYPE:
+    """
+    Run an action every interval, shifted by an offset.
+
+    The first run is at ``offset + interval``.
+
+    Args:
+        hass: The Home Assistant instance.
+        action: The action, called with the current time.
+        interval: The interval between runs.
+        offset: Seconds to wait before the first run.
+
+    Returns:
+        CALLBACK_TYPE: Function cancelling the tracking.
+    """
+    cancel: CALLBACK_TYPE
+
+    @callback
+    def _async_start(_now: datetime) -> None:
+        nonlocal cancel
+        cancel = async_track_time_interval(
+            hass, action, interval, cancel_on_shutdown=True
+        )
+
+    cancel = async_call_later(
+        hass,
+        offset,
+        HassJob(_async_start, "onkyo poll phase", cancel_on_shutdown=True),
+    )
+
+    @callback
+    def _async_cancel() -> None:
+        cancel()
+
+    return _async_cancel
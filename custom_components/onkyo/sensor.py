@@ -0,0 +1,172 @@
+"""
+Audio and video information sensors for Onkyo receivers.
+
+The sensors are fed by the IFA/IFV messages the receiver pushes when the
+signal changes, and query them once after every source change, as some
+models only report the new signal when asked. They never poll, and only
+write their state when a field actually changed.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .av_info import INFO_SCHEMAS, InfoFields, InfoSchema
+from .capabilities import model_supports
+from .connection import OnkyoConnectionManager
+from .const import DOMAIN, SIGNAL_CONNECTED
+
+_LOGGER = logging.getLogger(__name__)
+
+# The information messages describe the main zone
+INFO_ZONE = "main"
+
+# Updates announcing a source change
+SOURCE_COMMANDS = ("input-selector", "selector")
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """
+    Set up the Onkyo information sensors from a config entry.
+
+    Args:
+        hass: The Home Assistant instance.
+        entry: The configuration entry.
+        async_add_entities: Callback to add entities.
+    """
+    receiver_data = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        OnkyoInformationSensor(
+            receiver_data["connection_manager"], entry, receiver_data["name"], schema
+        )
+        for schema in INFO_SCHEMAS
+    )
+
+
+class OnkyoInformationSensor(SensorEntity):
+    """The audio or video signal the receiver is processing."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        connection_manager: OnkyoConnectionManager,
+        entry: ConfigEntry,
+        name: str,
+        schema: InfoSchema,
+    ) -> None:
+        """
+        Initialize the sensor.
+
+        Args:
+            connection_manager: The connection manager of the receiver.
+            entry: The configuration entry.
+            name: The name of the receiver.
+            schema: The layout of the information message shown.
+        """
+        self._conn_manager = connection_manager
+        self._schema = schema
+        self._model_name = entry.data.get("model_name")
+        self._entry = entry
+
+        # The decoded fields and the source they were last queried for
+        self._fields: InfoFields = ()
+        self._source: Any = None
+
+        host = entry.data.get("host", "unknown")
+        self._attr_name = f"{name} {schema.name}"
+        self._attr_unique_id = f"{host}_{schema.key}"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, host)})
+        self._attr_native_value: str | None = None
+        self._attr_extra_state_attributes: dict[str, Any] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the receiver's updates."""
+        await super().async_added_to_hass()
+
+        updates = self._conn_manager.updates
+        self.async_on_remove(
+            updates.async_subscribe(
+                INFO_ZONE, self._schema.command, self._handle_information
+            )
+        )
+        for command in SOURCE_COMMANDS:
+            self.async_on_remove(
+                updates.async_subscribe(INFO_ZONE, command, self._handle_source)
+            )
+
+        # Ask once for the current signal, now or once setup connected
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_CONNECTED.format(self._entry.entry_id),
+                self._async_request_information,
+            )
+        )
+        if self._conn_manager.connected:
+            self._async_request_information()
+
+    @callback
+    def _handle_information(self, zone: str, command: str, value: Any) -> None:
+        """
+        Show a pushed or queried information message.
+
+        Args:
+            zone: The zone of the update.
+            command: The eISCP command name.
+            value: The message value.
+        """
+        if (fields := self._schema.decode(value)) is None or fields == self._fields:
+            return
+        self._fields = fields
+        attributes = dict(fields)
+        self._attr_native_value = attributes.get(self._schema.state_field)
+        self._attr_extra_state_attributes = attributes
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_source(self, zone: str, command: str, value: Any) -> None:
+        """
+        Query the information once for every new source.
+
+        Args:
+            zone: The zone of the update.
+            command: The eISCP command name.
+            value: The new source.
+        """
+        if value == self._source:
+            return
+        self._source = value
+        self._async_request_information()
+
+    @callback
+    def _async_request_information(self) -> None:
+        """Query the information in the background."""
+        self.hass.async_create_task(
+            self._async_query(), f"Query {self._schema.iscp} of {self._attr_name}"
+        )
+
+    async def _async_query(self) -> None:
+        """Query the information unless the model is known not to report it."""
+        if not model_supports(self._model_name, INFO_ZONE, self._schema.iscp, "QSTN"):
+            _LOGGER.debug("%s does not report %s", self._model_name, self._schema.iscp)
+            return
+        result = await self._conn_manager.async_send_command(
+            "command", f"{self._schema.command}=query"
+        )
+        if isinstance(result, tuple) and result:
+            result = result[-1]
+        if result is not None:
+            self._handle_information(INFO_ZONE, self._schema.command, result)
@@ -0,0 +1,89 @@
+"""Change-detecting state model for Onkyo receiver zones."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class ZoneState:
+    """
+    Compact, versioned state of a single receiver zone.
+
+    Every field change bumps ``version`` and is recorded, so entities can
+    tell exactly what changed since the last state write and skip writes
+    when nothing moved. Changes to attribute-only fields also bump
+    ``attributes_version`` so extra attributes are rebuilt only when needed.
+    """
+
+    __slots__ = (
+        "state",
+        "available",
+        "volume_level",
+        "volume_raw",
+        "is_volume_muted",
+        "source",
+        "source_list",
+        "listening_modes",
+        "hdmi_output",
+        "version",
+        "attributes_version",
+        "_changed",
+    )
+
+    # Fields that only feed extra_state_attributes
+    ATTRIBUTE_FIELDS = frozenset({"listening_modes", "hdmi_output", "volume_raw"})
+
+    def __init__(self, **initial: Any) -> None:
+        """
+        Initialize the zone state.
+
+        Args:
+            **initial: Initial field values; unspecified fields start empty.
+        """
+        self.state: Any = None
+        self.available = False
+        self.volume_level: float | None = None
+        self.volume_raw: int | None = None
+        self.is_volume_muted = False
+        self.source: str | None = None
+        self.source_list: list[str] = []
+        self.listening_modes: list[str] = []
+        self.hdmi_output: str | None = None
+        for name, value in initial.items():
+            setattr(self, name, value)
+        self.version = 0
+        self.attributes_version = 0
+        self._changed: set[str] = set()
+
+    def update(self, **changes: Any) -> frozenset[str]:
+        """
+        Apply field changes and bump the version if anything moved.
+
+        Args:
+            **changes: Field names and their new values.
+
+        Returns:
+            frozenset[str]: The names of the fields that actually changed.
+        """
+        changed = set()
+        for name, value in changes.items():
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                changed.add(name)
+        if changed:
+            self.version += 1
+            self._changed |= changed
+            if not changed.isdisjoint(self.ATTRIBUTE_FIELDS):
+                self.attributes_version += 1
+        return frozenset(changed)
+
+    def pop_changes(self) -> frozenset[str]:
+        """
+        Return and clear the fields changed since the last call.
+
+        Returns:
+            frozenset[str]: The names of the changed fields.
+        """
+        changed = frozenset(self._changed)
+        self._changed.clear()
+        return changed
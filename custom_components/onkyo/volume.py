@@ -0,0 +1,126 @@
+"""Precomputed volume conversion tables for Onkyo receivers."""
+
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+from typing import Any
+
+from .const import CONF_MAX_VOLUME, CONF_VOLUME_RESOLUTION, DEFAULT_VOLUME_RESOLUTION
+from .helpers import get_profile_defaults
+
+
+class VolumeTable:
+    """
+    Bidirectional lookup table between receiver volume steps and HA levels.
+
+    The HA level for every receiver step is computed once, so converting a
+    receiver value is a single array index and converting an HA level back
+    is a single scale-and-round against the same table, which keeps both
+    directions round-trip stable.
+    """
+
+    __slots__ = (
+        "resolution",
+        "max_volume",
+        "max_step",
+        "_scale",
+        "_levels",
+    )
+
+    def __init__(self, resolution: int, max_volume: int) -> None:
+        """
+        Build the lookup table.
+
+        Args:
+            resolution: Number of receiver steps from minimum to maximum volume.
+            max_volume: Maximum volume limit as a percentage of the full range.
+        """
+        self.resolution = resolution
+        self.max_volume = max_volume
+
+        # Number of receiver steps that map onto the full HA slider
+        self._scale = resolution * (max_volume / 100)
+        self.max_step = min(resolution, round(self._scale))
+
+        if self._scale > 0:
+            self._levels = array(
+                "d",
+                (min(1.0, step / self._scale) for step in range(resolution + 1)),
+            )
+        else:
+            self._levels = array("d", bytes(8 * (resolution + 1)))
+
+    def to_ha(self, receiver_volume: int) -> float:
+        """
+        Convert a receiver volume step to an HA level (0.0-1.0).
+
+        Args:
+            receiver_volume: The receiver volume step.
+
+        Returns:
+            float: The Home Assistant volume level.
+        """
+        if receiver_volume <= 0:
+            return 0.0
+        if receiver_volume > self.resolution:
+            return self._levels[-1]
+        return self._levels[receiver_volume]
+
+    def to_receiver(self, ha_volume: float) -> int:
+        """
+        Convert an HA level (0.0-1.0) to a receiver volume step.
+
+        Args:
+            ha_volume: The Home Assistant volume level.
+
+        Returns:
+            int: The receiver volume step, clamped to the usable range.
+        """
+        return min(self.max_step, max(0, round(ha_volume * self._scale)))
+
+
+@lru_cache(maxsize=32)
+def get_volume_table(resolution: int, max_volume: int) -> VolumeTable:
+    """
+    Return a shared volume table for the given settings.
+
+    Zones of the same receiver share the same table instance.
+
+    Args:
+        resolution: Number of receiver steps from minimum to maximum volume.
+        max_volume: Maximum volume limit as a percentage.
+
+    Returns:
+        VolumeTable: The lookup table.
+    """
+    return VolumeTable(resolution, max_volume)
+
+
+def volume_table_for_entry(
+    options: dict[str, Any], data: dict[str, Any]
+) -> VolumeTable:
+    """
+    Build the volume table for a config entry.
+
+    Options take precedence over entry data, which takes precedence over the
+    model profile defaults.
+
+    Args:
+        options: The config entry options.
+        data: The config entry data.
+
+    Returns:
+        VolumeTable: The lookup table for the entry.
+    """
+    defaults = get_profile_defaults(data.get("model_name"))
+
+    max_volume = options.get(CONF_MAX_VOLUME, data.get(CONF_MAX_VOLUME, 100))
+    resolution = options.get(
+        CONF_VOLUME_RESOLUTION,
+        data.get(
+            CONF_VOLUME_RESOLUTION,
+            defaults.volume_resolution or DEFAULT_VOLUME_RESOLUTION,
+        ),
+    )
+    return get_volume_table(int(resolution), int(max_volume))
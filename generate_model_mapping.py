@@ -1,93 +1,399 @@
+"""
+Generate the Onkyo model mapping and capability modules.
+
+Reads the eISCP command definitions and writes:
+
+- custom_components/onkyo/onkyo_model_mapping.py: per-model source and
+  listening-mode sets
+- custom_components/onkyo/onkyo_model_capabilities.py: the capability
+  index (per-model zones, commands and values as bitsets)
+
+Every generated module records a hash of its inputs and of this script, so
+modules whose inputs did not change are skipped. Modules are written
+atomically. Run with --force to regenerate regardless.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
 import yaml
 
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "custom_components" / "onkyo"
+FILTERED_YAML = ROOT / "eiscp_commands_filtered.yaml"
+DUMP_YAML = ROOT / "eiscp_commands_dump.yaml"
+
+CAPABILITY_ZONES = ("main", "zone2", "zone3", "zone4", "dock")
+LISTENING_MODE_SKIP = ("up", "down", "query")
+LINE_WIDTH = 88
+HASH_PREFIX = "# Input hash: "
+
+
+class _Loader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+    """YAML loader accepting the range keys (e.g. ``[0, 200]``) of the dump."""
+
+
+def _construct_mapping(loader, node, deep=False):
+    loader.flatten_mapping(node)
+    mapping = {}
+    for key_node, value_node in node.value:
+        key = loader.construct_object(key_node, deep=True)
+        if isinstance(key, list):
+            key = tuple(key)
+        mapping[key] = loader.construct_object(value_node, deep=deep)
+    return mapping
+
+
+_Loader.add_constructor(
+    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _construct_mapping
+)
+
+
+class Timings:
+    """Accumulate the time spent in each pipeline step."""
+
+    def __init__(self):
+        self.steps = {}
+
+    @contextmanager
+    def measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.steps[name] = self.steps.get(name, 0.0) + elapsed
+
+    def report(self):
+        total = sum(self.steps.values())
+        for name, elapsed in self.steps.items():
+            print(f"  {name:<28} {elapsed * 1000:8.1f} ms")
+        print(f"  {'total':<28} {total * 1000:8.1f} ms")
+
+
+def input_hash(*paths):
+    """Return a hash of the given input files and of this script."""
+    digest = hashlib.sha256()
+    for path in (Path(__file__).resolve(), *paths):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
 
-def generate_mapping():
+
+def stored_hash(path):
+    """Return the input hash recorded in a generated module, if any."""
     try:
-        with open("eiscp_commands_filtered.yaml") as f:
-            try:
-                data = yaml.load(f, Loader=yaml.FullLoader)
-            except AttributeError:
-                data = yaml.load(f)
-    except Exception as e:
-        print(f"Error loading YAML: {e}")
-        return
-
-    model_sets = data.get("modelsets", {})
-
-    model_to_sets = {}
-    for set_name, models in model_sets.items():
+        with open(path, encoding="utf-8") as f:
+            for _ in range(5):
+                line = f.readline()
+                if line.startswith(HASH_PREFIX):
+                    return line[len(HASH_PREFIX) :].strip()
+    except OSError:
+        pass
+    return None
+
+
+def write_atomic(path, content):
+    """Write a file so readers never see a partially written module."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_yaml(path):
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+def model_to_sets(data):
+    """Return the modelsets each model belongs to."""
+    result = {}
+    for set_name, models in data.get("modelsets", {}).items():
         for model in models:
-            if model not in model_to_sets:
-                model_to_sets[model] = set()
-            model_to_sets[model].add(set_name)
+            result.setdefault(model, set()).add(set_name)
+    return result
+
+
+def value_id(key):
+    """Return the interned string form of a value key."""
+    if isinstance(key, tuple):
+        return "-".join(str(part) for part in key)
+    return str(key)
+
+
+def _shared_sets(model_to_list, prefix):
+    """Deduplicate per-model lists into shared, numbered sets."""
+    unique_lists = {}
+    list_to_id = {}
+
+    counter = 1
+    for l_tuple in model_to_list.values():
+        if l_tuple not in list_to_id:
+            sid = f"{prefix}{counter}"
+            list_to_id[l_tuple] = sid
+            unique_lists[sid] = list(l_tuple)
+            counter += 1
+
+    model_to_id = {model: list_to_id[items] for model, items in model_to_list.items()}
+    return unique_lists, model_to_id
+
+
+def _render_sets(lines, var_name, unique_lists):
+    lines.append(f"{var_name} = {{")
+    for sid, items in sorted(unique_lists.items(), key=lambda x: int(x[0][1:])):
+        lines.append(f'    "{sid}": [')
+        lines.extend(f'        "{item}",' for item in items)
+        lines.append("    ],")
+    lines.append("}")
+    lines.append("")
+
 
+def _render_mapping(lines, var_name, model_to_id):
+    lines.append(f"{var_name} = {{")
+    lines.extend(
+        f'    "{model}": "{sid}",' for model, sid in sorted(model_to_id.items())
+    )
+    lines.append("}")
+    lines.append("")
+
+
+def _render_tuple(lines, head, items, indent, tail=""):
+    """Render a tuple one item per line, as ruff formats it."""
+    if len(items) == 1:
+        line = f"{indent}{head}({items[0]},){tail}"
+        if len(line) <= LINE_WIDTH:
+            lines.append(line)
+            return
+    lines.append(f"{indent}{head}(")
+    lines.extend(f"{indent}    {item}," for item in items)
+    lines.append(f"{indent}){tail}")
+
+
+def _render_bitset(lines, bits, indent):
+    """Render a bitset as a hex int literal split over several lines."""
+    digits = f"{bits:x}"
+    chunk = LINE_WIDTH - len(indent) - 7
+    chunks = [digits[i : i + chunk] for i in range(0, len(digits), chunk)]
+    lines.append(f"{indent}int(")
+    lines.extend(f'{indent}    "{part}"' for part in chunks[:-1])
+    lines.append(f'{indent}    "{chunks[-1]}",')
+    lines.append(f"{indent}    16,")
+    lines.append(f"{indent}),")
+
+
+def build_sources(data, sets_by_model):
     sli_values = data.get("main", {}).get("SLI", {}).get("values", {})
 
     model_to_source_list = {}
-
-    for model, sets in model_to_sets.items():
+    for model, sets in sets_by_model.items():
         sources = []
         for value_data in sli_values.values():
             names = value_data.get("name")
-            if isinstance(names, list):
-                source_id = names[0]
-            else:
-                source_id = names
+            source_id = names[0] if isinstance(names, list) else names
+            if value_data.get("models") in sets:
+                sources.append(source_id)
 
-            required_sets = value_data.get("models")
-            if not required_sets:
+        sources.sort()
+        model_to_source_list[model] = tuple(sources)
+    return _shared_sets(model_to_source_list, "S")
+
+
+def build_listening_modes(data, sets_by_model):
+    lmd_values = data.get("main", {}).get("LMD", {}).get("values", {})
+
+    model_to_mode_list = {}
+    for model, sets in sets_by_model.items():
+        # Listening modes use the last alias, like build_sounds_mode_list().
+        # Only two-digit mode codes are modes; MOVIE, MUSIC, ... cycle groups
+        modes = set()
+        for key, value_data in lmd_values.items():
+            if len(str(key)) != 2:
+                continue
+            names = value_data.get("name")
+            mode_id = names[-1] if isinstance(names, list) else names
+            if mode_id in LISTENING_MODE_SKIP:
                 continue
+            if value_data.get("models") in sets:
+                modes.add(mode_id)
 
-            target_set = required_sets
+        model_to_mode_list[model] = tuple(sorted(modes))
+    return _shared_sets(model_to_mode_list, "L")
 
-            if target_set in sets:
-                sources.append(source_id)
 
-        sources.sort()
-        model_to_source_list[model] = tuple(sources)
+def render_mapping(digest, sources, listening_modes):
+    source_sets, model_source_sets = sources
+    mode_sets, model_mode_sets = listening_modes
 
-    unique_source_lists = {}
-    source_list_to_id = {}
+    lines = [
+        '"""Model to source and listening-mode mapping for Onkyo receivers."""',
+        "# Generated from eiscp-commands.yaml",
+        f"{HASH_PREFIX}{digest}",
+        "# pylint: disable=line-too-long",
+        "",
+    ]
+    _render_sets(lines, "SOURCE_SETS", source_sets)
+    _render_mapping(lines, "MODEL_SET_MAPPING", model_source_sets)
+    lines.append(
+        "MODEL_SOURCES = "
+        "{model: SOURCE_SETS[sid] for model, sid in MODEL_SET_MAPPING.items()}"
+    )
+    lines.append("")
+    _render_sets(lines, "LISTENING_MODE_SETS", mode_sets)
+    _render_mapping(lines, "MODEL_LISTENING_MODE_MAPPING", model_mode_sets)
+    lines.extend(
+        [
+            "MODEL_LISTENING_MODES = {",
+            "    model: LISTENING_MODE_SETS[lid]",
+            "    for model, lid in MODEL_LISTENING_MODE_MAPPING.items()",
+            "}",
+        ]
+    )
+    return "\n".join(lines) + "\n"
 
-    counter = 1
-    for s_tuple in model_to_source_list.values():
-        if s_tuple not in source_list_to_id:
-            sid = f"S{counter}"
-            source_list_to_id[s_tuple] = sid
-            unique_source_lists[sid] = list(s_tuple)
-            counter += 1
 
-    print('"""Model to source mapping for Onkyo receivers."""')
-    print("# Generated from eiscp-commands.yaml")
-    print("# pylint: disable=line-too-long")
-    print("")
-
-    print("SOURCE_SETS = {")
-    for sid, sources in sorted(
-        unique_source_lists.items(), key=lambda x: int(x[0][1:])
-    ):  # noqa: E501
-        # Split source list into chunks of 5
-        chunks = [sources[i : i + 5] for i in range(0, len(sources), 5)]
-        print(f'    "{sid}": [')
-        for chunk in chunks:
-            items = ", ".join([f"'{s}'" for s in chunk])
-            print(f"        {items},")
-        print("    ],")
-
-    print("}")
-    print("")
-
-    print("MODEL_SET_MAPPING = {")
-    for model, s_tuple in sorted(model_to_source_list.items()):
-        sid = source_list_to_id[s_tuple]
-        print(f'    "{model}": "{sid}",')
-    print("}")
-    print("")
-
-    print("MODEL_SOURCES = {")
-    print("    model: SOURCE_SETS[sid] for model, sid in MODEL_SET_MAPPING.items()")
-    print("}")
+def build_capabilities(data, sets_by_model):
+    set_names = sorted(data.get("modelsets", {}), key=lambda name: int(name[3:]))
+    set_bit = {name: 1 << index for index, name in enumerate(set_names)}
+
+    # Every value of every command gets a sequential ID; each modelset
+    # becomes a bitset over those IDs
+    command_values = {}
+    modelset_values = dict.fromkeys(set_names, 0)
+    next_id = 0
+    for zone in CAPABILITY_ZONES:
+        zone_commands = command_values[zone] = {}
+        for command, command_data in data.get(zone, {}).items():
+            values = []
+            for key, value_data in command_data.get("values", {}).items():
+                required_set = value_data.get("models")
+                if required_set in modelset_values:
+                    modelset_values[required_set] |= 1 << next_id
+                values.append(value_id(key))
+                next_id += 1
+            zone_commands[command] = values
+
+    model_modelsets = {
+        model: sum(set_bit[name] for name in sets)
+        for model, sets in sets_by_model.items()
+    }
+    return set_names, command_values, modelset_values, model_modelsets
+
+
+def render_capabilities(digest, capabilities):
+    set_names, command_values, modelset_values, model_modelsets = capabilities
+
+    lines = [
+        '"""Model capability index for Onkyo receivers."""',
+        "# Generated from eiscp_commands_dump.yaml by generate_model_mapping.py",
+        f"{HASH_PREFIX}{digest}",
+        "# pylint: disable=line-too-long",
+        "",
+    ]
+    _render_tuple(lines, "MODELSETS = ", [f'"{name}"' for name in set_names], "")
+    lines += [
+        "",
+        "# Value keys per zone and command; value IDs are assigned in this order",
+        "COMMAND_VALUES = {",
+    ]
+    for zone, commands in command_values.items():
+        lines.append(f'    "{zone}": {{')
+        for command, values in commands.items():
+            _render_tuple(
+                lines, f'"{command}": ', [f'"{v}"' for v in values], " " * 8, ","
+            )
+        lines.append("    },")
+    lines.append("}")
+    lines.append("")
+
+    lines.append("# Bitset of supported value IDs per modelset, in MODELSETS order")
+    lines.append("MODELSET_VALUES = (")
+    for set_name in set_names:
+        _render_bitset(lines, modelset_values[set_name], "    ")
+    lines.append(")")
+    lines.append("")
+
+    lines.append("# Bitmask of the modelsets (MODELSETS order) each model belongs to")
+    lines.append("MODEL_MODELSETS = {")
+    lines.extend(
+        f'    "{model}": 0x{mask:03X},'
+        for model, mask in sorted(model_modelsets.items())
+    )
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _generate_mapping(timings):
+    with timings.measure("load filtered yaml"):
+        data = load_yaml(FILTERED_YAML)
+    with timings.measure("build sources"):
+        sets_by_model = model_to_sets(data)
+        sources = build_sources(data, sets_by_model)
+    with timings.measure("build listening modes"):
+        listening_modes = build_listening_modes(data, sets_by_model)
+    return lambda digest: render_mapping(digest, sources, listening_modes)
+
+
+def _generate_capabilities(timings):
+    with timings.measure("load command dump"):
+        data = load_yaml(DUMP_YAML)
+    with timings.measure("build zones and capabilities"):
+        capabilities = build_capabilities(data, model_to_sets(data))
+    return lambda digest: render_capabilities(digest, capabilities)
+
+
+# Generated module, its inputs and the stage building it
+TARGETS = (
+    (OUTPUT_DIR / "onkyo_model_mapping.py", (FILTERED_YAML,), _generate_mapping),
+    (
+        OUTPUT_DIR / "onkyo_model_capabilities.py",
+        (DUMP_YAML,),
+        _generate_capabilities,
+    ),
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate even if the inputs are unchanged",
+    )
+    args = parser.parse_args(argv)
+
+    timings = Timings()
+    for target, inputs, stage in TARGETS:
+        with timings.measure("hash inputs"):
+            digest = input_hash(*inputs)
+        if not args.force and stored_hash(target) == digest:
+            print(f"{target.name}: up to date")
+            continue
+
+        try:
+            render = stage(timings)
+        except (OSError, yaml.YAMLError) as err:
+            print(f"{target.name}: error loading YAML: {err}", file=sys.stderr)
+            return 1
+        with timings.measure("render"):
+            content = render(digest)
+        with timings.measure("write"):
+            write_atomic(target, content)
+        print(f"{target.name}: generated")
+
+    print("Timing:")
+    timings.report()
+    return 0
 
 
 if __name__ == "__main__":
-    generate_mapping()
+    sys.exit(main())
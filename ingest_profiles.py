@@ -0,0 +1,473 @@
+"""
+Ingest receiver profile files into the receiver profile registry.
+
+Reads every profile file matching PROFILE_GLOBS and writes
+custom_components/onkyo/receiver_profiles.py.
+
+Files are streamed one device block at a time, so a truncated or broken
+block only costs that block (or, for a truncated block, its unfinished
+field) instead of the whole file. Every block is validated against
+PROFILE_SCHEMA, sanitized names (``cbl_sat``) are mapped back to the names
+used by the integration (``cbl/sat``) and blocks describing the same model
+are merged field by field, later files taking precedence. Files are merged
+in PROFILE_GLOBS order, so adding a batch is a matter of dropping the file
+next to the others and running this script.
+
+Like generate_model_mapping.py, the registry records a hash of its inputs
+and is only rewritten when they change (or with --force). The module is
+compiled before it is written atomically.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+import yaml
+
+from generate_model_mapping import (
+    HASH_PREFIX,
+    LINE_WIDTH,
+    OUTPUT_DIR,
+    ROOT,
+    Timings,
+    input_hash,
+    stored_hash,
+    write_atomic,
+)
+
+TARGET = OUTPUT_DIR / "receiver_profiles.py"
+
+# Profile files, lowest precedence first; matches of one glob sort by name
+PROFILE_GLOBS = ("Pioneer_Batch*.txt", "Pioneer_Batch*.yml", "Pioneer_VSX_*.yml")
+
+# Sanitized exports replace spaces and special characters with underscores
+SANITIZED_NAMES = {
+    "cbl_sat": "cbl/sat",
+    "strm_box": "strm box",
+    "Dolby_Surround": "Dolby Surround",
+    "DTS_Neural_X": "DTS Neural:X",
+}
+
+# Sections merged key by key; every other field is replaced as a whole
+MERGED_SECTIONS = ("ha_defaults", "hdmi_outputs", "timing", "tuners", "zones")
+
+# Fields a merged profile cannot do without
+REQUIRED_FIELDS = ("brand", "model", "eiscp_port")
+
+_ITEM_RE = re.compile(r"^( *)- ")
+_TOP_LEVEL_RE = re.compile(r"^([A-Za-z_][\w-]*):")
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+class SchemaError(ValueError):
+    """A profile block does not match the schema."""
+
+
+def _unescape(value):
+    """Drop backslash escapes left in plain YAML scalars (``Dolby\\ Surround``)."""
+    return _ESCAPE_RE.sub(r"\1", value)
+
+
+def _desanitize(value):
+    value = _unescape(value)
+    return SANITIZED_NAMES.get(value, value)
+
+
+def _string(value, path):
+    if not isinstance(value, str):
+        raise SchemaError(f"{path}: expected a string, got {value!r}")
+    return _unescape(value)
+
+
+def _name(value, path):
+    return _desanitize(_string(value, path))
+
+
+def _optional_int(value, path):
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise SchemaError(f"{path}: expected an integer, got {value!r}")
+    return value
+
+
+def _optional_number(value, path):
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        raise SchemaError(f"{path}: expected a number, got {value!r}")
+    return value
+
+
+def _percent(value, path):
+    value = _optional_int(value, path)
+    if value is not None and not 0 <= value <= 100:
+        raise SchemaError(f"{path}: {value} is not a percentage")
+    return value
+
+
+def _port(value, path):
+    value = _optional_int(value, path)
+    if value is None or not 0 < value < 65536:
+        raise SchemaError(f"{path}: {value!r} is not a port")
+    return value
+
+
+def _seconds(value, path):
+    value = _optional_number(value, path)
+    if value is not None and value < 0:
+        raise SchemaError(f"{path}: {value} is not a duration")
+    return value
+
+
+def _positive_int(value, path):
+    value = _optional_int(value, path)
+    if value is not None and value < 1:
+        raise SchemaError(f"{path}: {value} is not a positive count")
+    return value
+
+
+def _iscp_command(value, path):
+    value = _string(value, path)
+    if len(value) != 3 or not value.isalnum() or not value.isupper():
+        raise SchemaError(f"{path}: {value!r} is not a three letter ISCP command")
+    return value
+
+
+def _flag(value, path):
+    if not isinstance(value, bool):
+        raise SchemaError(f"{path}: expected true or false, got {value!r}")
+    return value
+
+
+def _list_of(item):
+    def validate(value, path):
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            raise SchemaError(f"{path}: expected a list, got {value!r}")
+        return [item(entry, f"{path}[{i}]") for i, entry in enumerate(value)]
+
+    return validate
+
+
+def _mapping_of(key, value_validator):
+    def validate(value, path):
+        if not isinstance(value, dict):
+            raise SchemaError(f"{path}: expected a mapping, got {value!r}")
+        return {
+            key(name, f"{path} key"): value_validator(entry, f"{path}.{name}")
+            for name, entry in value.items()
+        }
+
+    return validate
+
+
+def _section(fields):
+    def validate(value, path):
+        if not isinstance(value, dict):
+            raise SchemaError(f"{path}: expected a mapping, got {value!r}")
+        if unknown := sorted(set(value) - set(fields)):
+            raise SchemaError(f"{path}: unknown fields {', '.join(unknown)}")
+        return {
+            name: fields[name](entry, f"{path}.{name}") for name, entry in value.items()
+        }
+
+    return validate
+
+
+# Schema of a device block; all fields but the model are optional, as a
+# block may only add to a model described in another file
+PROFILE_SCHEMA = _section(
+    {
+        "brand": _string,
+        "model": _string,
+        "product_page": _list_of(_string),
+        "eiscp_port": _port,
+        "zones": _mapping_of(_string, _flag),
+        "hdmi_outputs": _section(
+            {
+                "dual_main_sub": _flag,
+                "notes": _string,
+                "service_codes": _list_of(_string),
+            }
+        ),
+        "tuners": _mapping_of(_string, _flag),
+        "net_services": _list_of(_string),
+        "inputs_present": _list_of(_name),
+        "listening_mode_families": _list_of(_name),
+        "ha_defaults": _section(
+            {
+                "volume_resolution": _optional_int,
+                "max_volume_percent": _percent,
+                "sources": _mapping_of(_name, _string),
+                "listening_modes": _list_of(_string),
+            }
+        ),
+        "timing": _section(
+            {
+                "command_interval": _seconds,
+                "max_pipelined_queries": _positive_int,
+                "power_on_delay": _seconds,
+                "power_on_timeout": _seconds,
+                "reliable_push": _flag,
+                "slow_commands": _mapping_of(_iscp_command, _seconds),
+            }
+        ),
+    }
+)
+
+
+def profile_files(root=ROOT):
+    """Return the profile files in merge order."""
+    files = []
+    for pattern in PROFILE_GLOBS:
+        files.extend(path for path in sorted(root.glob(pattern)) if path not in files)
+    return files
+
+
+def iter_device_blocks(lines):
+    """
+    Yield (line number, text) of every device block in a profile file.
+
+    A block is one item of a top-level ``devices:`` list, dedented so it
+    parses as a mapping of its own. Files may repeat ``devices:``.
+    """
+    in_devices = False
+    item_indent = None
+    start = 0
+    block = []
+    for lineno, line in enumerate(lines, 1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if top_level := _TOP_LEVEL_RE.match(line):
+            in_devices = top_level.group(1) == "devices"
+            item_indent = None
+        elif in_devices:
+            item = _ITEM_RE.match(line)
+            if item and item_indent in (None, len(item.group(1))):
+                if block:
+                    yield start, "".join(block)
+                item_indent = len(item.group(1))
+                start = lineno
+                block = [line[item.end() :]]
+            elif block:
+                width = item_indent + 2
+                block.append(line[min(width, len(line) - len(line.lstrip(" "))) :])
+            continue
+        if block:
+            yield start, "".join(block)
+            block = []
+    if block:
+        yield start, "".join(block)
+
+
+def _field_starts(text):
+    """Return the offsets of the top-level fields of a dedented block."""
+    offsets = []
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        if line[:1] not in ("", " ", "\n", "#"):
+            offsets.append(offset)
+        offset += len(line)
+    return offsets
+
+
+def parse_block(text):
+    """
+    Parse a device block, dropping unfinished fields of a truncated block.
+
+    Returns:
+        (data, dropped): The parsed mapping and the number of fields that
+        had to be dropped to make the block parse.
+    """
+    starts = _field_starts(text)
+    for dropped in range(len(starts)):
+        end = starts[len(starts) - dropped] if dropped else len(text)
+        try:
+            data = yaml.safe_load(text[:end])
+        except yaml.YAMLError:
+            continue
+        if isinstance(data, dict):
+            return data, dropped
+    raise yaml.YAMLError("no complete field")
+
+
+def read_profiles(path, errors):
+    """Yield the validated device blocks of a profile file."""
+    with open(path, encoding="utf-8") as f:
+        for lineno, text in iter_device_blocks(f):
+            where = f"{path.name}:{lineno}"
+            try:
+                data, dropped = parse_block(text)
+            except yaml.YAMLError as err:
+                errors.append(f"{where}: unparsable device block: {err}")
+                continue
+            if dropped:
+                print(
+                    f"{where}: truncated block, dropped {dropped} unfinished field(s)",
+                    file=sys.stderr,
+                )
+            try:
+                if "model" not in data:
+                    raise SchemaError("block has no model")
+                profile = PROFILE_SCHEMA(data, data["model"])
+            except SchemaError as err:
+                errors.append(f"{where}: {err}")
+                continue
+            yield profile
+
+
+def merge_profile(profiles, profile):
+    """Merge a device block into the profile of the same model."""
+    merged = profiles.setdefault(profile["model"], {})
+    for field, value in profile.items():
+        if field in MERGED_SECTIONS:
+            section = merged.setdefault(field, {})
+            section.update(
+                (key, item)
+                for key, item in value.items()
+                if item is not None or key not in section
+            )
+        elif value is not None or field not in merged:
+            merged[field] = value
+
+
+def _literal(value):
+    """Return a value as a Python literal with double-quoted strings."""
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, dict):
+        items = ", ".join(f"{_literal(k)}: {_literal(v)}" for k, v in value.items())
+        return f"{{{items}}}"
+    if isinstance(value, list):
+        return f"[{', '.join(_literal(item) for item in value)}]"
+    return repr(value)
+
+
+def _wrap_string(value, indent):
+    """Split a string into literals that fit the line width at indent."""
+    width = LINE_WIDTH - len(indent) - 2
+    parts, line = [], ""
+    for word in re.findall(r"\S+\s*", value):
+        if line and len(_literal(line + word.rstrip())) > width:
+            parts.append(line)
+            line = ""
+        line += word
+    parts.append(line)
+    return [_literal(part) for part in parts]
+
+
+def _render(value, prefix):
+    """Render a value after prefix, one item per line if it does not fit."""
+    flat = _literal(value)
+    if len(prefix) + len(flat) + 1 <= LINE_WIDTH:
+        return flat
+    indent = prefix[: len(prefix) - len(prefix.lstrip())]
+    inner = indent + "    "
+    if isinstance(value, str):
+        # In parentheses, split into implicitly joined literals if needed
+        parts = _wrap_string(value, inner)
+        return "\n".join(("(", *(f"{inner}{part}" for part in parts), f"{indent})"))
+    if not value or not isinstance(value, dict | list):
+        return flat
+    if isinstance(value, dict):
+        items = []
+        for key, item in value.items():
+            key_prefix = f"{inner}{_literal(key)}: "
+            items.append(f"{key_prefix}{_render(item, key_prefix)},")
+        opening, closing = "{", "}"
+    else:
+        items = [f"{inner}{_render(item, inner)}," for item in value]
+        opening, closing = "[", "]"
+    return "\n".join((opening, *items, f"{indent}{closing}"))
+
+
+def _sorted_profile(profile):
+    profile = dict(sorted(profile.items()))
+    for section in ("ha_defaults", "hdmi_outputs", "timing"):
+        if section in profile:
+            profile[section] = dict(sorted(profile[section].items()))
+    return profile
+
+
+def render_profiles(digest, profiles):
+    lines = [
+        '"""Receiver profiles for Onkyo/Pioneer/Integra."""',
+        "# Generated by ingest_profiles.py; edit the profile files instead",
+        f"{HASH_PREFIX}{digest}",
+        "",
+        "from __future__ import annotations",
+        "",
+        "RECEIVER_PROFILES = {",
+    ]
+    for model, profile in sorted(profiles.items()):
+        prefix = f"    {_literal(model)}: "
+        lines.append(f"{prefix}{_render(_sorted_profile(profile), prefix)},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def ingest(paths, timings):
+    """Read, validate and merge profile files; return (profiles, errors)."""
+    profiles = {}
+    errors = []
+    for path in paths:
+        with timings.measure(f"read {path.name}"):
+            for profile in read_profiles(path, errors):
+                merge_profile(profiles, profile)
+
+    for model, profile in profiles.items():
+        if missing := [field for field in REQUIRED_FIELDS if field not in profile]:
+            errors.append(f"{model}: missing {', '.join(missing)}")
+    return profiles, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate even if the inputs are unchanged",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only validate the profile files",
+    )
+    args = parser.parse_args(argv)
+
+    timings = Timings()
+    paths = profile_files()
+    with timings.measure("hash inputs"):
+        digest = input_hash(Path(__file__).resolve(), *paths)
+    if not (args.force or args.check) and stored_hash(TARGET) == digest:
+        print(f"{TARGET.name}: up to date")
+        return 0
+
+    profiles, errors = ingest(paths, timings)
+    for error in errors:
+        print(error, file=sys.stderr)
+    if errors:
+        return 1
+    if args.check:
+        print(f"{len(profiles)} profiles from {len(paths)} files: ok")
+        return 0
+
+    with timings.measure("render"):
+        content = render_profiles(digest, profiles)
+    with timings.measure("compile"):
+        compile(content, str(TARGET), "exec")
+    with timings.measure("write"):
+        write_atomic(TARGET, content)
+    print(f"{TARGET.name}: generated {len(profiles)} profiles")
+
+    print("Timing:")
+    timings.report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
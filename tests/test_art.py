@@ -0,0 +1,174 @@
+"""Tests for the album art of the network sources."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.onkyo.art import ArtAssembler, ArtCache, track_key
+from custom_components.onkyo.connection import OnkyoConnectionManager
+from custom_components.onkyo.const import DOMAIN
+from custom_components.onkyo.media_player import OnkyoMediaPlayer
+
+IMAGE = bytes(range(256)) * 10
+
+
+def _messages(image, image_type="1", chunk=1024):
+    """Return the NJA messages carrying an image."""
+    chunks = [image[i : i + chunk] for i in range(0, len(image), chunk)]
+    markers = ["0"] + ["1"] * (len(chunks) - 2) + ["2"]
+    return [f"{image_type}{m}{c.hex()}" for m, c in zip(markers, chunks, strict=True)]
+
+
+def test_assembler_joins_chunks():
+    """Test that an image is assembled from its chunks, growing the buffer."""
+    assembler = ArtAssembler(capacity=1000)
+    *head, last = _messages(IMAGE)
+
+    assert all(assembler.feed(message) is None for message in head)
+    art = assembler.feed(last)
+
+    assert art.content == IMAGE
+    assert art.content_type == "image/jpeg"
+    # The buffer is reused for the next image
+    assert assembler.feed(_messages(b"\x01\x02", chunk=1)[0]) is None
+    assert assembler.feed(_messages(b"\x01\x02", chunk=1)[1]).content == b"\x01\x02"
+
+
+def test_assembler_drops_incomplete_images():
+    """Test that chunks without a start or with bad data are dropped."""
+    assembler = ArtAssembler()
+    first, *rest = _messages(IMAGE)
+
+    assert [assembler.feed(message) for message in rest] == [None] * len(rest)
+    assert assembler.feed(first) is None
+    assert assembler.feed("11zz") is None
+    assert assembler.feed(rest[-1]) is None
+
+
+def test_assembler_links_and_no_image():
+    """Test art sent as a link and the no-image message."""
+    assembler = ArtAssembler()
+
+    assert assembler.feed("2-http://192.168.1.2/art.jpg").url == (
+        "http://192.168.1.2/art.jpg"
+    )
+    assert assembler.feed("n-").content is None
+
+
+def test_cache_evicts_least_recently_used():
+    """Test that the cache stays within its size, dropping the oldest image."""
+    cache = ArtCache(max_size=25)
+    cache.put("a", b"a" * 10, "image/jpeg")
+    cache.put("b", b"b" * 10, "image/jpeg")
+    assert cache.get("a") is not None
+
+    cache.put("c", b"c" * 10, "image/jpeg")
+    cache.put("huge", b"h" * 30, "image/jpeg")
+
+    assert "b" not in cache
+    assert "huge" not in cache
+    assert cache.get("a") == (b"a" * 10, "image/jpeg")
+    assert "c" in cache
+
+
+@pytest.mark.asyncio
+async def test_media_player_serves_cached_art(hass):
+    """Test that a track that plays again shows its art without assembly."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "1.2.3.4"})
+    manager = OnkyoConnectionManager(hass, MagicMock())
+    player = OnkyoMediaPlayer(
+        receiver=manager.receiver,
+        connection_manager=manager,
+        name="Onkyo",
+        zone="main",
+        hass=hass,
+        entry=entry,
+    )
+    player.hass = hass
+    player.entity_id = "media_player.onkyo"
+    player.async_write_ha_state = MagicMock()
+    await player.async_added_to_hass()
+    updates = manager.updates
+
+    # The chunks are hex throughout, yet must arrive as text
+    manager._async_handle_message("NTISong")
+    for message in _messages(IMAGE):
+        manager._async_handle_message(f"NJA{message}")
+
+    assert player.media_image_hash == track_key(None, "Song", None)
+    assert await player.async_get_media_image() == (IMAGE, "image/jpeg")
+
+    updates.async_dispatch("dock", "net-usb-title-name", "Other song")
+    assert player.media_image_hash is None
+
+    player._art_assembler = MagicMock()
+    updates.async_dispatch("dock", "net-usb-title-name", "Song")
+    updates.async_dispatch("dock", "net-usb-jacket-art", _messages(IMAGE)[0])
+
+    assert await player.async_get_media_image() == (IMAGE, "image/jpeg")
+    player._art_assembler.feed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_media_player_fetches_linked_art_once(hass):
+    """Test that art sent as a link is fetched once and then cached."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "1.2.3.4"})
+    manager = OnkyoConnectionManager(hass, MagicMock())
+    player = OnkyoMediaPlayer(
+        receiver=manager.receiver,
+        connection_manager=manager,
+        name="Onkyo",
+        zone="main",
+        hass=hass,
+        entry=entry,
+    )
+    player._async_fetch_image = AsyncMock(return_value=(b"jpeg", "image/jpeg"))
+    player._handle_now_playing("dock", "net-usb-title-name", "Song")
+    player._handle_jacket_art("dock", "net-usb-jacket-art", "2-http://host/a.jpg")
+
+    assert player.media_image_url == "http://host/a.jpg"
+    assert await player.async_get_media_image() == (b"jpeg", "image/jpeg")
+    assert await player.async_get_media_image() == (b"jpeg", "image/jpeg")
+    player._async_fetch_image.assert_awaited_once_with("http://host/a.jpg")
+
+
+@pytest.mark.asyncio
+async def test_media_player_keys_art_sent_before_title(hass):
+    """Test that art arriving ahead of its title is keyed to that title."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "1.2.3.4"})
+    manager = OnkyoConnectionManager(hass, MagicMock())
+    player = OnkyoMediaPlayer(
+        receiver=manager.receiver,
+        connection_manager=manager,
+        name="Onkyo",
+        zone="main",
+        hass=hass,
+        entry=entry,
+    )
+    other = bytes(reversed(IMAGE))
+    player._handle_now_playing("dock", "net-usb-title-name", "Song")
+    for message in _messages(IMAGE):
+        player._handle_jacket_art("dock", "net-usb-jacket-art", message)
+
+    # The next track's art starts before, and ends after, its title
+    first, *rest = _messages(other)
+    player._handle_jacket_art("dock", "net-usb-jacket-art", first)
+    player._handle_now_playing("dock", "net-usb-title-name", "Next")
+    for message in rest:
+        player._handle_jacket_art("dock", "net-usb-jacket-art", message)
+
+    assert player.media_image_hash == track_key(None, "Next", None)
+    assert await player.async_get_media_image() == (other, "image/jpeg")
+
+    # The art of the track after it is complete before its title
+    for message in _messages(IMAGE[::2]):
+        player._handle_jacket_art("dock", "net-usb-jacket-art", message)
+    player._handle_now_playing("dock", "net-usb-title-name", "Last")
+
+    assert player.media_image_hash == track_key(None, "Last", None)
+    assert await player.async_get_media_image() == (IMAGE[::2], "image/jpeg")
+    player._handle_now_playing("dock", "net-usb-title-name", "Song")
+    assert await player.async_get_media_image() == (IMAGE, "image/jpeg")
+    player._handle_now_playing("dock", "net-usb-title-name", "Next")
+    assert await player.async_get_media_image() == (other, "image/jpeg")
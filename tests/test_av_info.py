@@ -0,0 +1,38 @@
+"""Tests for decoding the audio and video information messages."""
+
+from custom_components.onkyo.av_info import AUDIO_INFORMATION, VIDEO_INFORMATION
+
+
+def test_decode_audio_information():
+    """Test that fields are named by position and empty ones are left out."""
+    fields = AUDIO_INFORMATION.decode("HDMI 1,PCM,48 kHz,2.0 ch,All Ch Stereo,5.1 ch,,")
+
+    assert dict(fields) == {
+        "input_port": "HDMI 1",
+        "input_format": "PCM",
+        "sample_rate": "48 kHz",
+        "input_channels": "2.0 ch",
+        "listening_mode": "All Ch Stereo",
+        "output_channels": "5.1 ch",
+    }
+
+
+def test_decode_video_information():
+    """Test decoding of a video message with HDR fields."""
+    fields = dict(
+        VIDEO_INFORMATION.decode(
+            "HDMI 2,3840 x 2160p  60 Hz,YCbCr 4:2:0,10 bit,HDMI Main,"
+            "3840 x 2160p  60 Hz,YCbCr 4:2:0,10 bit,Through,HDR10,HDR10,"
+        )
+    )
+
+    assert fields["input_resolution"] == "3840 x 2160p  60 Hz"
+    assert fields["input_hdr"] == "HDR10"
+    assert fields["output_hdr"] == "HDR10"
+
+
+def test_decode_rejects_other_values():
+    """Test that values that are not messages are not decoded."""
+    assert AUDIO_INFORMATION.decode(None) is None
+    assert AUDIO_INFORMATION.decode(("audio-information", "N/A")) is None
+    assert AUDIO_INFORMATION.decode("") == ()
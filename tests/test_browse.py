@@ -0,0 +1,174 @@
+"""Tests for browsing the network menus."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.components.media_player.errors import BrowseError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.onkyo.browse import (
+    NET_MEDIA_TYPE,
+    NetListBrowser,
+    content_id,
+    parse_content_id,
+    parse_list_page,
+    parse_list_title,
+)
+from custom_components.onkyo.connection import decode_message
+from custom_components.onkyo.const import DOMAIN
+from custom_components.onkyo.media_player import OnkyoMediaPlayer
+
+TOTAL = 30
+
+
+def _reply(start, count, total=TOTAL):
+    """Return an NLA reply listing items of a menu."""
+    items = "".join(
+        f'<item iconid="29" title="Item {i}" url=""/>'
+        for i in range(start, min(start + count, total))
+    )
+    return (
+        'NLAX0001S000<?xml version="1.0" encoding="utf-8"?>'
+        f'<response status="ok"><items offset="{start}" totalitems="{total}">'
+        f"{items}</items></response>"
+    )
+
+
+@pytest.fixture
+def manager():
+    """Return a connection manager answering NLA list requests."""
+    manager = MagicMock()
+    manager.sent = []
+
+    async def send(kind, message):
+        manager.sent.append(message)
+        if message.startswith("NLAL"):
+            return _reply(int(message[10:14], 16), int(message[14:18], 16))
+        return None
+
+    manager.async_send_command = AsyncMock(side_effect=send)
+    return manager
+
+
+def test_content_ids():
+    """Test that content IDs carry the menu path and page."""
+    assert content_id(()) == "net"
+    assert content_id((0, 3), 2) == "net/0/3?page=2"
+    assert parse_content_id("net/0/3?page=2") == ((0, 3), 2)
+    assert parse_content_id("net") == ((), 0)
+    with pytest.raises(ValueError):
+        parse_content_id("radio/1")
+
+
+def test_parse_list_page():
+    """Test parsing of NLA replies."""
+    page = parse_list_page(_reply(25, 25))
+
+    assert (page.offset, page.total, page.next_offset) == (25, TOTAL, None)
+    assert page.items[0].index == 25
+    assert page.items[0].title == "Item 25"
+    assert parse_list_page("NLAX0001E000") is None
+    assert parse_list_page("NLAX0001S000<response") is None
+
+
+def test_parse_list_title():
+    """Test reading the depth and item count of an NLT message."""
+    assert parse_list_title("0E010000001E02000000000000TuneIn") == (2, 30)
+    assert parse_list_title("0E01") is None
+
+
+@pytest.mark.asyncio
+async def test_pages_cached_and_prefetched(hass, manager):
+    """Test that pages are read once and the next one ahead of time."""
+    browser = NetListBrowser(hass, manager)
+
+    page = await browser.async_get_page((0,), 0)
+    await hass.async_block_till_done()
+    assert [item.title for item in page.items[:2]] == ["Item 0", "Item 1"]
+    assert manager.sent == [
+        "NTCTOP",
+        "NLAI0001000000----",
+        "NLAL00020100000019",
+        "NLAL00030100190019",
+    ]
+
+    manager.sent.clear()
+    assert (await browser.async_get_page((0,), 1)).items[0].title == "Item 25"
+    assert await browser.async_get_page((0,), 0) is page
+    await hass.async_block_till_done()
+    assert manager.sent == []
+
+    # Going one level deeper only selects the item
+    await browser.async_get_page((0, 4), 0)
+    await hass.async_block_till_done()
+    assert manager.sent[0] == "NLAI0004010004----"
+    assert browser.item_title((0, 4)) == "Item 4"
+
+
+@pytest.mark.asyncio
+async def test_cache_dropped_when_menu_moves(hass, manager):
+    """Test that a menu change not made by us drops the cache."""
+    browser = NetListBrowser(hass, manager)
+    await browser.async_get_page((0,), 0)
+    await hass.async_block_till_done()
+
+    # The receiver reports the menu we are in: nothing changes
+    browser.handle_list_title("dock", "net-usb-list-title-info", "0E010000001E01")
+    manager.sent.clear()
+    await browser.async_get_page((0,), 0)
+    assert manager.sent == []
+
+    # Someone went back to the top menu with the remote; the all-hex
+    # message must reach the browser as text
+    browser.handle_list_title(*decode_message("NLT0E010000000800"))
+    await browser.async_get_page((0,), 0)
+    await hass.async_block_till_done()
+    assert manager.sent[:2] == ["NTCTOP", "NLAI0004000000----"]
+
+
+@pytest.mark.asyncio
+async def test_media_player_browses_network_menus(hass, manager):
+    """Test browsing from the main zone, page by page."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "1.2.3.4"})
+    player = OnkyoMediaPlayer(
+        receiver=MagicMock(),
+        connection_manager=manager,
+        name="Onkyo",
+        zone="main",
+        hass=hass,
+        entry=entry,
+    )
+    player.async_write_ha_state = MagicMock()
+
+    # Browsing never switches away from what is playing
+    player._attr_source = "dvd"
+    with pytest.raises(BrowseError):
+        await player.async_browse_media()
+    assert manager.sent == []
+
+    player._attr_source = "net"
+    top = await player.async_browse_media()
+    assert top.title == "Network"
+    assert len(top.children) == 26
+    assert top.children[-1].media_content_id == "net?page=1"
+    assert top.children[3].media_content_type == NET_MEDIA_TYPE
+
+    menu = await player.async_browse_media(NET_MEDIA_TYPE, "net/3")
+    await hass.async_block_till_done()
+    assert menu.title == "Item 3"
+
+    # Playing an item of the menu the receiver is in only selects it
+    manager.sent.clear()
+    await player.async_play_media(NET_MEDIA_TYPE, "net/3/7")
+    assert manager.sent == ["NLAI0005010007----"]
+
+    zone2 = OnkyoMediaPlayer(
+        receiver=MagicMock(),
+        connection_manager=manager,
+        name="Onkyo zone2",
+        zone="zone2",
+        hass=hass,
+        entry=entry,
+    )
+    with pytest.raises(BrowseError):
+        await zone2.async_browse_media()
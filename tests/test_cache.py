@@ -0,0 +1,118 @@
+"""Tests for the Onkyo persistent cache."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.onkyo.cache import (
+    OnkyoCache,
+    ReceiverLists,
+    async_get_cache,
+    topology_key,
+)
+from custom_components.onkyo.const import LIST_CACHE_TTL, LIST_SOURCES, STORAGE_KEY
+
+
+@pytest.mark.asyncio
+async def test_cache_is_loaded_once(hass):
+    """Test that all callers share a single loaded cache."""
+    first, second = await asyncio.gather(async_get_cache(hass), async_get_cache(hass))
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_cancelled_load_does_not_block_later_callers(hass):
+    """Test that a cancelled load releases its waiters and is retried."""
+    loading = asyncio.Event()
+
+    async def _slow_load(self):
+        loading.set()
+        await asyncio.Event().wait()
+
+    with patch.object(OnkyoCache, "async_load", _slow_load):
+        loader = asyncio.ensure_future(async_get_cache(hass))
+        await loading.wait()
+        waiter = asyncio.ensure_future(async_get_cache(hass))
+        await asyncio.sleep(0)
+        loader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        with pytest.raises(asyncio.CancelledError):
+            await loader
+
+    cache = await asyncio.wait_for(async_get_cache(hass), 1)
+    assert isinstance(cache, OnkyoCache)
+
+
+@pytest.mark.asyncio
+async def test_cache_loads_stored_zones(hass, hass_storage):
+    """Test that zones stored by a previous run are returned."""
+    key = topology_key("TX-NR686", "1.0")
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {"zones": {"entry": {"key": key, "zones": ["main", "zone2"]}}},
+    }
+    cache = OnkyoCache(hass)
+    await cache.async_load()
+
+    assert cache.async_get_zones("entry", key) == ["main", "zone2"]
+    assert cache.async_get_zones("entry", topology_key("TX-NR686", "2.0")) is None
+
+
+@pytest.mark.asyncio
+async def test_receiver_lists_shared_between_zones(hass):
+    """Test that concurrent zones trigger a single query and share the result."""
+    cache = OnkyoCache(hass)
+    lists = ReceiverLists(cache, "entry", "key")
+    fetch = AsyncMock(return_value=["dvd", "tv"])
+
+    main, zone2 = await asyncio.gather(
+        lists.async_get(LIST_SOURCES, fetch), lists.async_get(LIST_SOURCES, fetch)
+    )
+
+    fetch.assert_awaited_once()
+    assert main == ("dvd", "tv")
+    assert main is zone2
+
+    # A restart reuses the stored copy without querying the receiver
+    restarted = ReceiverLists(cache, "entry", "key")
+    fetch.reset_mock()
+    assert await restarted.async_get(LIST_SOURCES, fetch) == ("dvd", "tv")
+    fetch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_receiver_lists_ttl(hass):
+    """Test that stored lists expire after the TTL."""
+    cache = OnkyoCache(hass)
+    cache.async_set_list("entry", "key", LIST_SOURCES, ["dvd"])
+    fetch = AsyncMock(return_value=["dvd", "tv"])
+
+    expired = dt_util.utcnow() + timedelta(seconds=LIST_CACHE_TTL + 1)
+    with patch("custom_components.onkyo.cache.dt_util.utcnow", return_value=expired):
+        lists = ReceiverLists(cache, "entry", "key")
+        assert await lists.async_get(LIST_SOURCES, fetch) == ("dvd", "tv")
+
+    fetch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_receiver_lists_invalidation(hass):
+    """Test that only stored lists are invalidated on request."""
+    cache = OnkyoCache(hass)
+    cache.async_set_list("entry", "key", LIST_SOURCES, ["dvd"])
+    fetch = AsyncMock(return_value=["dvd", "tv"])
+    lists = ReceiverLists(cache, "entry", "key")
+
+    assert await lists.async_get(LIST_SOURCES, fetch) == ("dvd",)
+    assert lists.async_invalidate(LIST_SOURCES, only_stored=True)
+    assert await lists.async_get(LIST_SOURCES, fetch) == ("dvd", "tv")
+
+    # The fresh copy came from the receiver, so it is kept
+    assert not lists.async_invalidate(LIST_SOURCES, only_stored=True)
+    fetch.assert_awaited_once()
@@ -0,0 +1,50 @@
+"""Tests for the Onkyo model capability index."""
+
+from custom_components.onkyo.capabilities import get_capabilities, model_supports
+from custom_components.onkyo.onkyo_model_capabilities import (
+    COMMAND_VALUES,
+    MODEL_MODELSETS,
+    MODELSET_VALUES,
+    MODELSETS,
+)
+
+
+def test_index_is_consistent():
+    """Test that the generated tables agree with each other."""
+    value_count = sum(
+        len(values)
+        for commands in COMMAND_VALUES.values()
+        for values in commands.values()
+    )
+    assert len(MODELSET_VALUES) == len(MODELSETS)
+    assert all(bits.bit_length() <= value_count for bits in MODELSET_VALUES)
+    assert all(0 < mask < 1 << len(MODELSETS) for mask in MODEL_MODELSETS.values())
+
+
+def test_zone_support():
+    """Test zone support lookups."""
+    capabilities = get_capabilities("TX-SR876")
+    assert capabilities is not None
+    assert capabilities.supports_zone("main")
+    assert capabilities.supports_zone("zone2")
+    assert not capabilities.supports_zone("zone4")
+
+    assert get_capabilities("DTR-80.3").supports_zone("zone4")
+
+
+def test_value_support():
+    """Test command and value support lookups."""
+    capabilities = get_capabilities("TX-SR876")
+    assert capabilities.supports_command("main", "SLI")
+    assert capabilities.supports_value("main", "SLI", "QSTN")
+    assert capabilities.supports_value("main", "MVL", (0, 200))
+    assert not capabilities.supports_command("zone4", "PW4")
+
+
+def test_unknown_models_and_commands_are_not_gated():
+    """Test that missing index entries never block a query."""
+    assert get_capabilities(None) is None
+    assert get_capabilities("NOT-A-MODEL") is None
+    assert model_supports("NOT-A-MODEL", "zone4", "PW4")
+    assert model_supports("TX-SR876", "main", "XYZ")
+    assert not model_supports("TX-SR876", "zone4", "PW4")
@@ -7,6 +7,7 @@ from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.onkyo.const import CONF_RECEIVER_MAX_VOLUME, DOMAIN
+from custom_components.onkyo.discovery import DiscoveredReceiver
 
 
 @pytest.fixture(name="mock_setup_entry")
@@ -21,7 +22,7 @@ def mock_setup_entry():
 @pytest.fixture(name="mock_eiscp")
 def mock_eiscp():
     """Mock eISCP library."""
-    with patch("custom_components.onkyo.config_flow.eISCP") as mock_eiscp:
+    with patch("custom_components.onkyo.config_flow.PushReceiver") as mock_eiscp:
         receiver = mock_eiscp.return_value
         receiver.command = MagicMock()
         receiver.model_name = "VSX-831"  # Default mock model
@@ -61,6 +62,7 @@ async def test_form(hass, mock_setup_entry, mock_eiscp):
     }
     assert result2["options"]["receiver_max_volume"] == 80
     assert len(mock_setup_entry.mock_calls) == 1
+    mock_eiscp.return_value.command.assert_any_call("system-power=query")
 
 
 @pytest.mark.asyncio
@@ -117,7 +119,9 @@ async def test_form_connect_refused(hass, mock_eiscp):
 @pytest.mark.asyncio
 async def test_form_import_error(hass):
     """Test library import error."""
-    with patch("custom_components.onkyo.config_flow.eISCP", side_effect=ImportError):
+    with patch(
+        "custom_components.onkyo.config_flow.PushReceiver", side_effect=ImportError
+    ):
         result = await hass.config_entries.flow.async_init(
             DOMAIN, context={"source": config_entries.SOURCE_USER}
         )
@@ -166,6 +170,79 @@ async def test_ssdp_discovery(hass, mock_setup_entry, mock_eiscp):
     assert result2["data"]["host"] == "1.1.1.1"
 
 
+@pytest.mark.asyncio
+async def test_scan_network(hass, mock_setup_entry, mock_eiscp):
+    """Test that an empty host scans the network and offers the receivers."""
+    receiver = DiscoveredReceiver("1.1.1.2", 60129, "VSX-932", "XX", "0009B0123456")
+    mock_eiscp.return_value.model_name = None
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    with patch(
+        "custom_components.onkyo.config_flow.async_discover",
+        return_value=[receiver],
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"name": "Test Receiver", CONF_RECEIVER_MAX_VOLUME: 120}
+        )
+
+    assert result2["type"] == FlowResultType.FORM
+    assert result2["step_id"] == "scan"
+
+    result3 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"host": "1.1.1.2"}
+    )
+
+    assert result3["type"] == FlowResultType.CREATE_ENTRY
+    # What the user entered before scanning is kept
+    assert result3["title"] == "Test Receiver"
+    assert result3["data"]["name"] == "Test Receiver"
+    assert result3["options"][CONF_RECEIVER_MAX_VOLUME] == 120
+    assert result3["data"]["host"] == "1.1.1.2"
+    assert result3["data"]["port"] == 60129
+    mock_eiscp.assert_called_with("1.1.1.2", 60129)
+    # The model comes from the scan when the connection does not report it
+    assert result3["data"]["model_name"] == "VSX-932"
+
+
+@pytest.mark.asyncio
+async def test_scan_network_names_entry_after_model(hass, mock_setup_entry, mock_eiscp):
+    """Test that a scanned receiver without a given name is named by model."""
+    receiver = DiscoveredReceiver("1.1.1.2", 60128, "VSX-932", "XX", "0009B0123456")
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    with patch(
+        "custom_components.onkyo.config_flow.async_discover",
+        return_value=[receiver],
+    ):
+        await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"host": "1.1.1.2"}
+    )
+
+    assert result2["type"] == FlowResultType.CREATE_ENTRY
+    assert result2["title"] == "VSX-932"
+
+
+@pytest.mark.asyncio
+async def test_scan_network_nothing_found(hass, mock_eiscp):
+    """Test that an empty scan returns to the manual form."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    with patch("custom_components.onkyo.config_flow.async_discover", return_value=[]):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"host": ""}
+        )
+
+    assert result2["type"] == FlowResultType.FORM
+    assert result2["step_id"] == "user"
+    assert result2["errors"] == {"base": "no_receivers_found"}
+
+
 @pytest.mark.asyncio
 async def test_options_flow(hass, mock_setup_entry):
     """Test options flow."""
@@ -1,10 +1,20 @@
 """Tests for the Onkyo connection manager."""
 
+import gc
+import socket
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
+from eiscp.core import command_to_iscp, eISCPPacket
 
-from custom_components.onkyo.connection import OnkyoConnectionManager
+from custom_components.onkyo.connection import (
+    OnkyoConnectionManager,
+    PushReceiver,
+    async_get_connection_registry,
+    decode_message,
+)
+from custom_components.onkyo.profiles import ReceiverTiming
 
 
 @pytest.fixture
@@ -49,6 +59,25 @@ async def test_send_command_reconnect_success(hass, connection_manager, mock_rec
     assert mock_receiver.command.call_count >= 2
 
 
+@pytest.mark.asyncio
+async def test_connect(hass, connection_manager, mock_receiver):
+    """Test the single background connection attempt."""
+    mock_receiver.command.side_effect = TimeoutError
+
+    assert not await connection_manager.async_connect()
+    assert not connection_manager.connected
+    mock_receiver.disconnect.assert_called_once()
+
+    mock_receiver.command.side_effect = None
+    mock_receiver.command.return_value = ("system-power", "standby")
+
+    assert await connection_manager.async_connect()
+    assert connection_manager.connected
+    # A command eISCP can encode
+    mock_receiver.command.assert_called_with("system-power=query")
+    assert command_to_iscp(*mock_receiver.command.call_args.args) == "PWRQSTN"
+
+
 @pytest.mark.asyncio
 async def test_send_command_failure(hass, connection_manager, mock_receiver):
     """Test sending a command failure handling."""
@@ -97,3 +126,178 @@ async def test_close(hass, connection_manager, mock_receiver):
 
     # Disconnect is run in executor
     assert not connection_manager.connected
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_allows_pipelined_burst(hass, mock_receiver):
+    """Test that models accepting pipelined queries send a burst unspaced."""
+    timing = ReceiverTiming(command_interval=0.1, max_pipelined_queries=2)
+    connection_manager = OnkyoConnectionManager(hass, mock_receiver, timing)
+    connection_manager._is_connected = True
+    connection_manager._last_command_time = hass.loop.time()
+
+    with patch("asyncio.sleep") as mock_sleep:
+        await connection_manager.async_send_command("raw", "PWRQSTN")
+        mock_sleep.assert_not_awaited()
+        await connection_manager.async_send_command("raw", "MVLQSTN")
+        mock_sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_slow_command_settle_time(hass, mock_receiver):
+    """Test that a slow command holds off the next command."""
+    timing = ReceiverTiming(command_interval=0.0, slow_commands={"SLI": 0.5})
+    connection_manager = OnkyoConnectionManager(hass, mock_receiver, timing)
+    connection_manager._is_connected = True
+
+    with patch("asyncio.sleep") as mock_sleep:
+        await connection_manager.async_send_command("raw", "SLI01")
+        mock_sleep.assert_not_awaited()
+        await connection_manager.async_send_command("raw", "PWRQSTN")
+        assert 0.4 < mock_sleep.await_args.args[0] <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_registry_shares_connection_per_host(hass):
+    """Test that users of one receiver share a connection until the last leaves."""
+    registry = async_get_connection_registry(hass)
+    assert registry is async_get_connection_registry(hass)
+    create = MagicMock(side_effect=lambda: OnkyoConnectionManager(hass, MagicMock()))
+
+    first, created = registry.async_acquire("1.1.1.1", create)
+    assert created
+    second, created = registry.async_acquire("1.1.1.1", create)
+    assert not created
+    other, _ = registry.async_acquire("1.1.1.1", create, port=60129)
+
+    assert first is second
+    assert other is not first
+    assert create.call_count == 2
+    assert registry.async_get("1.1.1.1") is first
+
+    await registry.async_release(first)
+    first.receiver.disconnect.assert_not_called()
+
+    await registry.async_release(second)
+    first.receiver.disconnect.assert_called_once()
+    assert registry.async_get("1.1.1.1") is None
+    assert registry.async_get("1.1.1.1", 60129) is other
+
+
+class _Subscriber:
+    def __init__(self):
+        self.updates = []
+
+    def handle(self, zone, command, value):
+        self.updates.append((zone, command, value))
+
+
+@pytest.mark.asyncio
+async def test_updates_routed_by_zone_and_command(
+    hass, connection_manager, mock_receiver
+):
+    """Test that updates only reach the subscribers of their zone and command."""
+    volume, zone2_volume = _Subscriber(), _Subscriber()
+    updates = connection_manager.updates
+    unsubscribe = updates.async_subscribe("main", "volume", volume.handle)
+    updates.async_subscribe("zone2", "volume", zone2_volume.handle)
+
+    updates.async_dispatch("main", "volume", 40)
+    updates.async_dispatch("main", "power", "on")
+    assert volume.updates == [("main", "volume", 40)]
+    assert zone2_volume.updates == []
+
+    unsubscribe()
+    updates.async_dispatch("main", "volume", 41)
+    assert volume.updates == [("main", "volume", 40)]
+
+
+@pytest.mark.asyncio
+async def test_updates_drop_collected_subscribers(hass, connection_manager):
+    """Test that a subscriber that is gone is dropped without unsubscribing."""
+    updates = connection_manager.updates
+    kept, dropped = _Subscriber(), _Subscriber()
+    updates.async_subscribe("main", "muting", kept.handle)
+    updates.async_subscribe("main", "muting", dropped.handle)
+
+    del dropped
+    gc.collect()
+    updates.async_dispatch("main", "muting", "on")
+
+    assert kept.updates == [("main", "muting", "on")]
+    assert len(updates._subscribers[("main", "muting")]) == 1
+
+
+def test_decode_message():
+    """Test that messages get the names shared by all zones."""
+    assert decode_message("MVL2A") == ("main", "volume", 42)
+    assert decode_message("PWR01") == ("main", "power", "on")
+    assert decode_message("ZMT01") == ("zone2", "muting", "on")
+    assert decode_message("SLI2B") == ("main", "input-selector", ("network", "net"))
+    assert decode_message("IFA1F,PCM,48 kHz") == (
+        "main",
+        "audio-information",
+        "1F,PCM,48 kHz",
+    )
+    assert decode_message("XYZ00") is None
+
+
+@pytest.mark.asyncio
+async def test_pushed_messages_dispatched(hass, connection_manager, mock_receiver):
+    """Test that messages of the receiver's thread reach the subscribers."""
+    volume, zone2_power = _Subscriber(), _Subscriber()
+    updates = connection_manager.updates
+    updates.async_subscribe("main", "volume", volume.handle)
+    updates.async_subscribe("zone2", "power", zone2_power.handle)
+
+    for message in ("MVL2A", "ZPW01", "XYZ00"):
+        await hass.async_add_executor_job(mock_receiver.on_message, message)
+    await hass.async_block_till_done()
+
+    assert volume.updates == [("main", "volume", 42)]
+    assert zone2_power.updates == [("zone2", "power", "on")]
+
+    await connection_manager.async_close()
+    assert mock_receiver.on_message is None
+
+
+def _packet(message):
+    return eISCPPacket(f"!1{message}\x1a\r\n").get_raw()
+
+
+def test_push_receiver_reports_unsolicited_messages(socket_enabled):
+    """Test that messages around a reply go to the listener, not astray."""
+    server = socket.create_server(("127.0.0.1", 0))
+    receiver = PushReceiver("127.0.0.1", server.getsockname()[1])
+    received = []
+    receiver.on_message = received.append
+
+    def _serve():
+        conn, _ = server.accept()
+        with conn:
+            conn.sendall(_packet("MVL2A"))
+            conn.recv(1024)
+            conn.sendall(_packet("NTIABBA") + _packet("PWR01"))
+            conn.recv(1024)
+
+    with server:
+        thread = threading.Thread(target=_serve)
+        thread.start()
+        try:
+            assert receiver.raw("PWRQSTN") == "PWR01"
+        finally:
+            receiver.disconnect()
+            thread.join()
+
+    assert received == ["MVL2A", "NTIABBA"]
+
+
+def test_push_receiver_fails_without_connection(socket_enabled):
+    """Test that a command fails instead of waiting for a lost thread."""
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        port = server.getsockname()[1]
+    receiver = PushReceiver("127.0.0.1", port)
+
+    with pytest.raises(ConnectionError):
+        receiver.raw("PWRQSTN")
+    receiver.disconnect()
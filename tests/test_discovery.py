@@ -0,0 +1,51 @@
+"""Tests for the Onkyo eISCP discovery."""
+
+from custom_components.onkyo.discovery import (
+    DiscoveredReceiver,
+    build_packet,
+    parse_response,
+)
+
+
+def _packet(message: bytes) -> bytes:
+    """Return an eISCP packet as a receiver sends it."""
+    return (
+        b"ISCP"
+        + (16).to_bytes(4, "big")
+        + len(message).to_bytes(4, "big")
+        + b"\x01\x00\x00\x00"
+        + message
+    )
+
+
+def test_build_packet():
+    """Test the eISCP framing of the discovery query."""
+    packet = build_packet("!xECNQSTN")
+
+    assert packet[:4] == b"ISCP"
+    assert packet[4:8] == (16).to_bytes(4, "big")
+    assert packet[8:12] == (10).to_bytes(4, "big")
+    assert packet[16:] == b"!xECNQSTN\r"
+
+
+def test_parse_response():
+    """Test parsing a discovery reply."""
+    packet = _packet(b"!1ECNVSX-932/60128/XX/0009B0123456\x1a\r\n")
+
+    receiver = parse_response(packet, "192.168.1.20")
+
+    assert receiver == DiscoveredReceiver(
+        host="192.168.1.20",
+        port=60128,
+        model_name="VSX-932",
+        region="XX",
+        identifier="0009B0123456",
+    )
+    assert receiver.mac == "00:09:b0:12:34:56"
+
+
+def test_parse_response_ignores_other_packets():
+    """Test that our own query and garbage are ignored."""
+    assert parse_response(build_packet("!xECNQSTN"), "192.168.1.2") is None
+    assert parse_response(b"garbage", "192.168.1.2") is None
+    assert parse_response(_packet(b"!1PWR01\x1a\r\n"), "192.168.1.2") is None
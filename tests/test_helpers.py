@@ -1,7 +1,10 @@
 """Tests for Onkyo helpers."""
 
+from types import MappingProxyType
 from unittest.mock import patch
 
+import pytest
+
 from custom_components.onkyo import helpers
 
 # Mock COMMANDS structure
@@ -25,6 +28,14 @@ MOCK_COMMANDS = {
 }
 
 
+@pytest.fixture(autouse=True)
+def clear_catalogs():
+    """Make every test build its catalogs from the patched commands."""
+    helpers.clear_catalog_cache()
+    yield
+    helpers.clear_catalog_cache()
+
+
 def test_build_sources_list():
     """Test building sources list."""
     with patch.dict("custom_components.onkyo.helpers.COMMANDS", MOCK_COMMANDS):
@@ -37,6 +48,16 @@ def test_build_sources_list():
         assert "07" not in sources
 
 
+def test_build_receiver_sources():
+    """Test building sources from the selectors a receiver reported."""
+    with patch.dict("custom_components.onkyo.helpers.COMMANDS", MOCK_COMMANDS):
+        sources = helpers.build_receiver_sources(
+            [("02", "Tape deck"), ("01", ""), ("07", "Skipped"), ("FF", "Unknown")]
+        )
+
+        assert sources == {"video2": "Tape deck", "video1": "video1"}
+
+
 def test_build_sounds_mode_list():
     """Test building sound modes list."""
     with patch.dict("custom_components.onkyo.helpers.COMMANDS", MOCK_COMMANDS):
@@ -66,3 +87,26 @@ def test_reverse_mapping():
     original = {"key": "value"}
     reversed_dict = helpers.reverse_mapping(original)
     assert reversed_dict == {"value": "key"}
+
+
+def test_catalogs_are_memoized_and_read_only():
+    """Test that catalogs are built once and cannot be modified."""
+    with patch.dict("custom_components.onkyo.helpers.COMMANDS", MOCK_COMMANDS):
+        sources = helpers.build_sources_list()
+        assert helpers.build_sources_list() is sources
+        assert isinstance(sources, MappingProxyType)
+        with pytest.raises(TypeError):
+            sources["video3"] = "video3"  # type: ignore[index]
+
+        modes = helpers.build_sounds_mode_list()
+        assert helpers.build_sounds_mode_list() is modes
+
+
+def test_model_catalog_cache_is_bounded():
+    """Test that per-model catalogs are evicted beyond the cache size."""
+    with patch.dict("custom_components.onkyo.helpers.COMMANDS", MOCK_COMMANDS):
+        for index in range(helpers.CATALOG_CACHE_SIZE * 2):
+            helpers.build_sources_list(f"MODEL-{index}")
+
+    info = helpers._model_sources.cache_info()  # pylint: disable=protected-access
+    assert info.currsize == helpers.CATALOG_CACHE_SIZE
@@ -0,0 +1,62 @@
+"""Import-time tests for the Onkyo integration."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Modules the integration must only import on first real use
+LAZY_MODULES = (
+    "custom_components.onkyo.onkyo_model_mapping",
+    "custom_components.onkyo.onkyo_model_capabilities",
+    "custom_components.onkyo.receiver_profiles",
+)
+
+SETUP_MODULES = (
+    "custom_components.onkyo",
+    "custom_components.onkyo.config_flow",
+    "custom_components.onkyo.media_player",
+)
+
+
+def _import_times(code: str) -> dict[str, tuple[int, int]]:
+    """Run code with -X importtime and return self/cumulative µs per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def test_setup_does_not_import_data_modules():
+    """Test that importing the integration leaves the data modules unloaded."""
+    times = _import_times("; ".join(f"import {m}" for m in SETUP_MODULES))
+
+    for module in SETUP_MODULES:
+        assert module in times
+    for module in LAZY_MODULES:
+        assert module not in times, f"{module} is imported eagerly"
+
+
+def test_data_modules_load_on_first_use():
+    """Test that the accessors import the data modules when needed."""
+    times = _import_times(
+        "from custom_components.onkyo import helpers; "
+        "helpers.build_sources_list('TX-NR609(Ether)'); "
+        "helpers.get_profile_defaults('VSX-831')"
+    )
+
+    assert "custom_components.onkyo.onkyo_model_mapping" in times
+    assert "custom_components.onkyo.receiver_profiles" in times
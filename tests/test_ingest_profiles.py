@@ -0,0 +1,132 @@
+"""Tests for the receiver profile ingestion tool."""
+
+import textwrap
+
+import pytest
+
+from custom_components.onkyo.profiles import get_receiver_profile
+from generate_model_mapping import Timings
+from ingest_profiles import SchemaError, ingest, iter_device_blocks, parse_block
+
+SANITIZED = """\
+spec_version: "1.1"
+notes:
+  - "All mapping keys are sanitized"
+devices:
+  - brand: "Pioneer"
+    model: "VSX-1"
+    eiscp_port: 60128
+    inputs_present: [ bd, cbl_sat ]
+    listening_mode_families: [ "Dolby_Surround", "DTS_Neural_X" ]
+    ha_defaults:
+      max_volume_percent: 55
+      sources:
+        cbl_sat: "Set-top Box"
+  - brand: "Pioneer"
+    model: "VSX-2"
+    eiscp_port: 60128
+    zones: { main: true, zone2
+"""
+
+BATCH = """\
+# Batch with repeated devices keys
+devices:
+  - brand: Pioneer
+    model: VSX-1
+    listening_mode_families: [ Stereo, Dolby\\ Surround ]
+    ha_defaults:
+      volume_resolution: null
+      max_volume_percent: 60
+
+devices:
+  - brand: Pioneer
+    model: VSX-3
+    eiscp_port: 60128
+"""
+
+
+def _write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_iter_device_blocks_handles_repeated_devices_keys():
+    """Test that every list item becomes a dedented block."""
+    blocks = list(iter_device_blocks(BATCH.splitlines(keepends=True)))
+
+    assert [lineno for lineno, _ in blocks] == [3, 11]
+    assert blocks[1][1].startswith("brand: Pioneer\nmodel: VSX-3\n")
+
+
+def test_parse_block_drops_unfinished_field():
+    """Test that a truncated block keeps its complete fields."""
+    text = textwrap.dedent(
+        """\
+        model: VSX-2
+        eiscp_port: 60128
+        zones: { main: true, zone2
+        """
+    )
+    data, dropped = parse_block(text)
+
+    assert data == {"model": "VSX-2", "eiscp_port": 60128}
+    assert dropped == 1
+
+
+def test_ingest_normalizes_and_merges(tmp_path):
+    """Test sanitized names and field-wise merging of duplicate models."""
+    paths = [
+        _write(tmp_path, "Batch3.txt", SANITIZED),
+        _write(tmp_path, "Batch1.yml", BATCH),
+    ]
+    profiles, errors = ingest(paths, Timings())
+
+    assert errors == []
+    assert sorted(profiles) == ["VSX-1", "VSX-2", "VSX-3"]
+    merged = profiles["VSX-1"]
+    assert merged["inputs_present"] == ["bd", "cbl/sat"]
+    # Later files replace lists, and unescape plain scalars
+    assert merged["listening_mode_families"] == ["Stereo", "Dolby Surround"]
+    # Sections merge key by key; null does not overwrite a known value
+    assert merged["ha_defaults"] == {
+        "max_volume_percent": 60,
+        "sources": {"cbl/sat": "Set-top Box"},
+        "volume_resolution": None,
+    }
+    assert "zones" not in profiles["VSX-2"]
+
+
+def test_ingest_reports_schema_errors(tmp_path):
+    """Test that invalid blocks and incomplete profiles are reported."""
+    path = _write(
+        tmp_path,
+        "Bad.yml",
+        "devices:\n"
+        "  - model: VSX-4\n"
+        "    eiscp_port: 60128\n"
+        "    ha_defaults: { max_volume_percent: 150 }\n"
+        "  - model: VSX-5\n"
+        "    zonez: { main: true }\n"
+        "  - model: VSX-6\n",
+    )
+    profiles, errors = ingest([path], Timings())
+
+    assert len(errors) == 3
+    assert "VSX-4.ha_defaults.max_volume_percent: 150" in errors[0]
+    assert "unknown fields zonez" in errors[1]
+    assert errors[2] == "VSX-6: missing brand, eiscp_port"
+    assert list(profiles) == ["VSX-6"]
+    assert issubclass(SchemaError, ValueError)
+
+
+@pytest.mark.parametrize(
+    ("model_name", "zones"),
+    [("VSX-LX103", {"main", "zone2"}), ("VSX-LX503", {"main", "zone2", "zone3"})],
+)
+def test_ingested_profiles_are_registered(model_name, zones):
+    """Test that models from the batch files are in the registry."""
+    profile = get_receiver_profile(model_name)
+
+    assert profile is not None
+    assert profile.zones == zones
@@ -1,17 +1,29 @@
 """Tests for Onkyo init."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.onkyo import (
+    _async_connect_receiver,
     async_migrate_entry,
     async_setup_entry,
     async_unload_entry,
+    async_update_options,
+)
+from custom_components.onkyo.const import (
+    DOMAIN,
+    SIGNAL_CONNECTED,
+    SIGNAL_OPTIONS_UPDATED,
+)
+from custom_components.onkyo.probe import (
+    ReceiverProbe,
+    async_store_probe,
+    async_take_probe,
 )
-from custom_components.onkyo.const import DOMAIN
 
 
 @pytest.fixture
@@ -32,8 +44,10 @@ async def test_setup_entry_success(hass, mock_entry):
     """Test successful entry setup."""
     mock_entry.add_to_hass(hass)
     with (
-        patch("custom_components.onkyo.eISCP") as mock_eiscp,
-        patch("custom_components.onkyo._test_connection", return_value=True),
+        patch("custom_components.onkyo.PushReceiver") as mock_eiscp,
+        patch(
+            "custom_components.onkyo._async_connect_receiver", new_callable=AsyncMock
+        ) as mock_connect,
         patch(
             "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups"
         ) as mock_forward,
@@ -45,18 +59,79 @@ async def test_setup_entry_success(hass, mock_entry):
         assert mock_entry.entry_id in hass.data[DOMAIN]
         mock_forward.assert_called_once()
 
+    # Setup does not wait for the receiver; it connects in the background
+    mock_eiscp.return_value.command.assert_not_called()
+    connection_manager = hass.data[DOMAIN][mock_entry.entry_id]["connection_manager"]
+    mock_connect.assert_called_once_with(hass, mock_entry, connection_manager)
+
+
+@pytest.mark.asyncio
+async def test_setup_entry_takes_over_probe(hass, mock_entry):
+    """Test that setup reuses the connection the config flow left open."""
+    mock_entry.add_to_hass(hass)
+    receiver = MagicMock()
+    async_store_probe(
+        hass, ReceiverProbe("1.1.1.1", receiver, "TX-NR686", None, ["main", "zone2"])
+    )
+    with (
+        patch("custom_components.onkyo.PushReceiver") as mock_eiscp,
+        patch("custom_components.onkyo._async_connect_receiver") as mock_connect,
+        patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups"),
+    ):
+        assert await async_setup_entry(hass, mock_entry)
+
+    mock_eiscp.assert_not_called()
+    mock_connect.assert_not_called()
+    data = hass.data[DOMAIN][mock_entry.entry_id]
+    assert data["receiver"] is receiver
+    assert data["connection_manager"].connected
+    assert data["zones"] == ["main", "zone2"]
+    assert async_take_probe(hass, "1.1.1.1") is None
+
+
+@pytest.mark.asyncio
+async def test_entries_share_connection_to_receiver(hass, mock_entry):
+    """Test that two entries for one receiver share a single connection."""
+    other_entry = MockConfigEntry(
+        domain=DOMAIN, data={"host": "1.1.1.1", "name": "Again"}, unique_id="again"
+    )
+    mock_entry.add_to_hass(hass)
+    other_entry.add_to_hass(hass)
+    with (
+        patch("custom_components.onkyo.PushReceiver") as mock_eiscp,
+        patch(
+            "custom_components.onkyo._async_connect_receiver", new_callable=AsyncMock
+        ),
+        patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups"),
+    ):
+        assert await async_setup_entry(hass, mock_entry)
+        assert await async_setup_entry(hass, other_entry)
+
+    mock_eiscp.assert_called_once_with("1.1.1.1", 60128)
+    first = hass.data[DOMAIN][mock_entry.entry_id]["connection_manager"]
+    assert hass.data[DOMAIN][other_entry.entry_id]["connection_manager"] is first
+
+    with patch(
+        "homeassistant.config_entries.ConfigEntries.async_unload_platforms",
+        return_value=True,
+    ):
+        assert await async_unload_entry(hass, mock_entry)
+        mock_eiscp.return_value.disconnect.assert_not_called()
+        assert await async_unload_entry(hass, other_entry)
+        mock_eiscp.return_value.disconnect.assert_called_once()
+
 
 @pytest.mark.asyncio
 async def test_setup_entry_timeout(hass, mock_entry):
     """Test setup with connection timeout."""
     mock_entry.add_to_hass(hass)
     with (
-        patch("custom_components.onkyo.eISCP"),
-        patch("custom_components.onkyo._test_connection", side_effect=TimeoutError),
+        patch("custom_components.onkyo.PushReceiver") as mock_eiscp,
         patch(
             "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups"
         ) as mock_forward,
     ):
+        mock_eiscp.return_value.command.side_effect = TimeoutError
         # Setup should succeed (allow offline setup)
         assert await async_setup_entry(hass, mock_entry)
         assert DOMAIN in hass.data
@@ -68,15 +143,12 @@ async def test_setup_entry_os_error(hass, mock_entry):
     """Test setup with network error."""
     mock_entry.add_to_hass(hass)
     with (
-        patch("custom_components.onkyo.eISCP"),
-        patch(
-            "custom_components.onkyo._test_connection",
-            side_effect=OSError("Network unreachable"),
-        ),
+        patch("custom_components.onkyo.PushReceiver") as mock_eiscp,
         patch(
             "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups"
         ) as mock_forward,
     ):
+        mock_eiscp.return_value.command.side_effect = OSError("Network unreachable")
         # Setup should succeed (allow offline setup)
         assert await async_setup_entry(hass, mock_entry)
         assert DOMAIN in hass.data
@@ -87,14 +159,60 @@ async def test_setup_entry_os_error(hass, mock_entry):
 async def test_setup_entry_unexpected_error(hass, mock_entry):
     """Test setup with unexpected error."""
     mock_entry.add_to_hass(hass)
+    with patch("custom_components.onkyo.PushReceiver", side_effect=Exception("Boom")):
+        with pytest.raises(ConfigEntryNotReady):
+            await async_setup_entry(hass, mock_entry)
+
+
+@pytest.mark.asyncio
+async def test_connect_receiver_signals_entities(hass, mock_entry):
+    """Test that entities are only told to refresh once the receiver answers."""
+    connection_manager = MagicMock()
+    connection_manager.async_connect = AsyncMock(side_effect=[False, True])
+    connected = MagicMock()
+    async_dispatcher_connect(
+        hass, SIGNAL_CONNECTED.format(mock_entry.entry_id), connected
+    )
+
+    await _async_connect_receiver(hass, mock_entry, connection_manager)
+    await hass.async_block_till_done()
+    connected.assert_not_called()
+
+    await _async_connect_receiver(hass, mock_entry, connection_manager)
+    await hass.async_block_till_done()
+    connected.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_options_applied_without_reload(hass, mock_entry):
+    """Test that changing options keeps the entry and its connection loaded."""
+    mock_entry.add_to_hass(hass)
     with (
-        patch("custom_components.onkyo.eISCP"),
+        patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups"),
+        patch("custom_components.onkyo.PushReceiver"),
         patch(
-            "custom_components.onkyo._test_connection", side_effect=Exception("Boom")
+            "custom_components.onkyo._async_connect_receiver", new_callable=AsyncMock
         ),
     ):
-        with pytest.raises(ConfigEntryNotReady):
-            await async_setup_entry(hass, mock_entry)
+        await async_setup_entry(hass, mock_entry)
+
+    updated = MagicMock()
+    async_dispatcher_connect(
+        hass, SIGNAL_OPTIONS_UPDATED.format(mock_entry.entry_id), updated
+    )
+    with patch.object(hass.config_entries, "async_reload") as mock_reload:
+        hass.config_entries.async_update_entry(
+            mock_entry,
+            options={"max_volume": 80, "sources": {"dvd": "DVD"}},
+        )
+        await async_update_options(hass, mock_entry)
+        await hass.async_block_till_done()
+
+    mock_reload.assert_not_called()
+    updated.assert_called()
+    assert hass.data[DOMAIN][mock_entry.entry_id]["options"]["sources"] == {
+        "dvd": "DVD"
+    }
 
 
 @pytest.mark.asyncio
@@ -105,8 +223,10 @@ async def test_unload_entry(hass, mock_entry):
     # Mock forward entry setups to avoid loading platform
     with (
         patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups"),
-        patch("custom_components.onkyo.eISCP"),
-        patch("custom_components.onkyo._test_connection", return_value=True),
+        patch("custom_components.onkyo.PushReceiver"),
+        patch(
+            "custom_components.onkyo._async_connect_receiver", new_callable=AsyncMock
+        ),
     ):
         await async_setup_entry(hass, mock_entry)
 
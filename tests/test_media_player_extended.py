@@ -6,14 +6,18 @@ import pytest
 from homeassistant.components.media_player import (
     MediaPlayerState,
 )
+from homeassistant.core import State
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.onkyo.const import ATTR_HDMI_OUTPUT, DOMAIN
+from custom_components.onkyo.cache import async_get_cache, topology_key
+from custom_components.onkyo.const import ATTR_HDMI_OUTPUT, ATTR_STALE, DOMAIN
 from custom_components.onkyo.media_player import (
     OnkyoMediaPlayer,
     _detect_zones_safe,
     async_setup_entry,
 )
+from custom_components.onkyo.onkyo_model_mapping import MODEL_LISTENING_MODES
+from custom_components.onkyo.profiles import resolve_mapped_model
 
 
 @pytest.fixture
@@ -139,6 +143,71 @@ async def test_detect_zones_safe(mock_connection_manager):
     assert zones == ["main"]  # Should always return at least main
 
 
+@pytest.mark.asyncio
+async def test_detect_zones_probes_zone4(mock_connection_manager):
+    """Test that zone detection also probes zone 4."""
+    mock_connection_manager.async_send_command.side_effect = [None, None, "on"]
+
+    zones = await _detect_zones_safe(mock_connection_manager)
+
+    assert zones == ["main", "zone4"]
+    mock_connection_manager.async_send_command.assert_any_call(
+        "command", "zone4.power=query"
+    )
+
+
+@pytest.mark.asyncio
+async def test_detect_zones_skips_unsupported_zones(mock_connection_manager):
+    """Test that zones the model does not have are not probed."""
+    mock_connection_manager.async_send_command.return_value = "on"
+
+    zones = await _detect_zones_safe(mock_connection_manager, "TX-SR876")
+
+    assert zones == ["main", "zone2", "zone3"]
+    assert mock_connection_manager.async_send_command.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_setup_entry_uses_cached_zones(
+    hass, mock_connection_manager, mock_receiver, mock_config_entry
+):
+    """Test that cached zones skip detection and are revalidated in background."""
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: {
+            "receiver": mock_receiver,
+            "connection_manager": mock_connection_manager,
+            "name": "Onkyo Receiver",
+        }
+    }
+    cache = await async_get_cache(hass)
+    key = topology_key(None, None)
+    cache.async_set_zones(mock_config_entry.entry_id, key, ["main", "zone2"])
+
+    async_add_entities = MagicMock()
+    detect = AsyncMock(return_value=["main", "zone2", "zone4"])
+
+    with patch("custom_components.onkyo.media_player._detect_zones_safe", detect):
+        await async_setup_entry(hass, mock_config_entry, async_add_entities)
+
+        # Entities come from the cache before detection runs
+        entities = async_add_entities.call_args_list[0][0][0]
+        assert [entity._zone for entity in entities] == ["main", "zone2"]
+
+        await hass.async_block_till_done()
+
+    detect.assert_awaited_once()
+    new_entities = async_add_entities.call_args_list[1][0][0]
+    assert [entity._zone for entity in new_entities] == ["zone4"]
+    assert cache.async_get_zones(mock_config_entry.entry_id, key) == [
+        "main",
+        "zone2",
+        "zone4",
+    ]
+
+    # A different firmware invalidates the cached topology
+    assert cache.async_get_zones(mock_config_entry.entry_id, "model|2.0") is None
+
+
 @pytest.mark.asyncio
 async def test_turn_off(
     hass, mock_connection_manager, mock_receiver, mock_config_entry
@@ -465,11 +534,39 @@ async def test_async_update_all(
     assert "stereo" in player.extra_state_attributes["listening_modes"]
 
 
+@pytest.mark.asyncio
+async def test_list_queries_gated_by_command(
+    hass, mock_connection_manager, mock_receiver, mock_config_entry
+):
+    """Test that list queries are skipped for models lacking their command."""
+    player = OnkyoMediaPlayer(
+        receiver=mock_receiver,
+        connection_manager=mock_connection_manager,
+        name="Test Player",
+        zone="main",
+        hass=hass,
+        entry=mock_config_entry,
+    )
+    mock_connection_manager.async_send_command.return_value = {"dvd": "DVD"}
+
+    with patch(
+        "custom_components.onkyo.media_player.model_supports",
+        side_effect=lambda model, zone, command, value: command != "LMD",
+    ) as supports:
+        await player._async_fetch_source_list()
+        await player._async_fetch_listening_modes()
+
+    assert [c.args[2] for c in supports.call_args_list] == ["SLI", "LMD"]
+    mock_connection_manager.async_send_command.assert_awaited_once_with(
+        "raw", "SLIQSTN"
+    )
+
+
 @pytest.mark.asyncio
 async def test_remove_from_hass(
     hass, mock_connection_manager, mock_receiver, mock_config_entry
 ):
-    """Test cleanup when removed."""
+    """Test that push updates stop reaching an entity once it is removed."""
     player = OnkyoMediaPlayer(
         receiver=mock_receiver,
         connection_manager=mock_connection_manager,
@@ -478,9 +575,23 @@ async def test_remove_from_hass(
         hass=hass,
         entry=mock_config_entry,
     )
+    unsubscribe = MagicMock()
+    mock_connection_manager.connected = False
+    mock_connection_manager.updates = MagicMock()
+    mock_connection_manager.updates.async_subscribe.return_value = unsubscribe
+    player.hass = hass
+    player.entity_id = "media_player.test_player"
+
+    await player.async_added_to_hass()
+    subscribed = {
+        call.args[:2]
+        for call in mock_connection_manager.updates.async_subscribe.call_args_list
+    }
+    assert ("main", "volume") in subscribed
+    assert ("main", "power") in subscribed
 
-    await player.async_will_remove_from_hass()
-    mock_receiver.unregister_callback.assert_called_with(player._handle_receiver_update)
+    player._call_on_remove_callbacks()
+    assert unsubscribe.call_count == len(subscribed)
 
 
 @pytest.mark.asyncio
@@ -774,6 +885,40 @@ async def test_fetch_lists_failure(
     assert player.extra_state_attributes.get("listening_modes") is None
 
 
+@pytest.mark.asyncio
+async def test_fetch_listening_modes_from_model_mapping(
+    hass, mock_connection_manager, mock_receiver
+):
+    """Test that models the mapping narrows down are not queried."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "1.2.3.4", "name": "Onkyo", "model_name": "TX-NR609(Ether)"},
+        entry_id="model_entry_id",
+    )
+    player = OnkyoMediaPlayer(
+        receiver=mock_receiver,
+        connection_manager=mock_connection_manager,
+        name="Test Player",
+        zone="main",
+        hass=hass,
+        entry=entry,
+    )
+    mock_connection_manager.async_send_command.return_value = {"stereo": "Stereo"}
+
+    # A set holding every mapped mode tells nothing about the model
+    await player._async_fetch_listening_modes()
+
+    mock_connection_manager.async_send_command.assert_awaited_once_with("raw", "LMQSTN")
+
+    mock_connection_manager.async_send_command.reset_mock()
+    mapped = resolve_mapped_model("TX-NR609(Ether)")
+    with patch.dict(MODEL_LISTENING_MODES, {mapped: ["direct", "stereo"]}):
+        await player._async_fetch_listening_modes()
+
+    assert player.extra_state_attributes["listening_modes"] == ["direct", "stereo"]
+    mock_connection_manager.async_send_command.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_fetch_lists_empty(
     hass, mock_connection_manager, mock_receiver, mock_config_entry
@@ -795,3 +940,74 @@ async def test_fetch_lists_empty(
 
     await player._async_fetch_listening_modes()
     assert player.extra_state_attributes.get("listening_modes") is None
+
+
+@pytest.mark.asyncio
+async def test_restored_state_is_stale_until_update(
+    hass, mock_connection_manager, mock_receiver, mock_config_entry
+):
+    """Test that a restored state stays available until the receiver answers."""
+    mock_connection_manager.connected = False
+    player = OnkyoMediaPlayer(
+        receiver=mock_receiver,
+        connection_manager=mock_connection_manager,
+        name="Test Player",
+        zone="main",
+        hass=hass,
+        entry=mock_config_entry,
+    )
+    player.async_get_last_state = AsyncMock(
+        return_value=State(
+            "media_player.test_player",
+            MediaPlayerState.ON,
+            {"volume_level": 0.4, "is_volume_muted": True, "source": "dvd"},
+        )
+    )
+
+    await player._async_restore_state()
+
+    assert player.available
+    assert player.state == MediaPlayerState.ON
+    assert player.volume_level == 0.4
+    assert player.is_volume_muted
+    assert player.source == "dvd"
+    assert player.extra_state_attributes[ATTR_STALE] is True
+
+    # The first update replaces the restored state
+    mock_connection_manager.async_send_command.return_value = None
+    await player._async_update_all()
+
+    assert not player.available
+    assert ATTR_STALE not in player.extra_state_attributes
+
+
+@pytest.mark.asyncio
+async def test_source_filter_applied_in_place(
+    hass, mock_connection_manager, mock_receiver
+):
+    """Test that the sources selected in the options filter the source list."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "1.2.3.4", "name": "Onkyo"},
+        options={"sources": {"dvd": "Blu-ray", "tv": "TV"}},
+    )
+    entry.add_to_hass(hass)
+    player = OnkyoMediaPlayer(
+        receiver=mock_receiver,
+        connection_manager=mock_connection_manager,
+        name="Test Player",
+        zone="main",
+        hass=hass,
+        entry=entry,
+    )
+    player.async_write_ha_state = MagicMock()
+    player._update_state(source_list=["dvd", "game", "tv"])
+
+    assert player.source_list == ["dvd", "tv"]
+    assert player.source_list is player.source_list
+
+    hass.config_entries.async_update_entry(entry, options={"sources": {"game": "Game"}})
+    player._async_options_updated()
+
+    assert player.source_list == ["game"]
+    player.async_write_ha_state.assert_called_once()
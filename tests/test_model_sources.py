@@ -1,7 +1,12 @@
 from eiscp.commands import COMMANDS
 
-from custom_components.onkyo.helpers import build_sources_list
-from custom_components.onkyo.onkyo_model_mapping import MODEL_SOURCES
+from custom_components.onkyo.helpers import build_sounds_mode_list, build_sources_list
+from custom_components.onkyo.onkyo_model_mapping import (
+    LISTENING_MODE_SETS,
+    MODEL_LISTENING_MODE_MAPPING,
+    MODEL_LISTENING_MODES,
+    MODEL_SOURCES,
+)
 
 
 # Test with a known model
@@ -59,3 +64,23 @@ def test_build_sources_list_unknown_model():
 def test_build_sources_list_no_model():
     sources = build_sources_list()
     assert len(sources) > 0
+
+
+def test_listening_mode_sets_cover_all_models():
+    assert set(MODEL_LISTENING_MODE_MAPPING) == set(MODEL_SOURCES)
+    assert set(MODEL_LISTENING_MODE_MAPPING.values()) == set(LISTENING_MODE_SETS)
+
+    modes = MODEL_LISTENING_MODES["TX-NR609(Ether)"]
+    assert "stereo" in modes
+    assert "direct" in modes
+    # Wrap-around and query values are not modes
+    assert "up" not in modes
+    assert "query" not in modes
+
+
+def test_build_sounds_mode_list_known_model():
+    modes = build_sounds_mode_list("TX-NR609(Ether)")
+    assert set(modes) <= set(MODEL_LISTENING_MODES["TX-NR609(Ether)"])
+    assert "stereo" in modes
+
+    assert build_sounds_mode_list("UnknownModel") == build_sounds_mode_list()
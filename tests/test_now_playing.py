@@ -0,0 +1,126 @@
+"""Tests for the now-playing metadata of the network sources."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.components.media_player import MediaPlayerState
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.onkyo.connection import OnkyoConnectionManager
+from custom_components.onkyo.const import DOMAIN
+from custom_components.onkyo.media_player import OnkyoMediaPlayer
+from custom_components.onkyo.now_playing import (
+    PLAY_STATUS,
+    TIME,
+    TITLE,
+    NowPlaying,
+    parse_time,
+)
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    ("text", "seconds"),
+    [("03:25", 205), ("1:02:03", 3723), ("--:--", None), ("", None)],
+)
+def test_parse_time(text, seconds):
+    """Test parsing of NTM times."""
+    assert parse_time(text) == seconds
+
+
+def test_position_moves_only_when_it_drifts():
+    """Test that the per-second time updates are interpolated, seeks are not."""
+    now_playing = NowPlaying()
+    assert now_playing.update(PLAY_STATUS, "P--", START)
+    assert now_playing.update(TIME, "00:10/03:00", START)
+    assert (now_playing.position, now_playing.duration) == (10, 180)
+
+    # Ticks in step with the interpolated position change nothing
+    for tick in range(1, 5):
+        second = START + timedelta(seconds=tick)
+        assert not now_playing.update(TIME, f"00:{10 + tick}/03:00", second)
+    assert now_playing.position_updated_at == START
+
+    # A seek does
+    seek = START + timedelta(seconds=5)
+    assert now_playing.update(TIME, "01:30/03:00", seek)
+    assert (now_playing.position, now_playing.position_updated_at) == (90, seek)
+
+
+def test_pause_anchors_position():
+    """Test that pausing keeps the position reached while playing."""
+    now_playing = NowPlaying()
+    now_playing.update(PLAY_STATUS, "P--", START)
+    now_playing.update(TIME, "00:10/03:00", START)
+
+    pause = START + timedelta(seconds=20)
+    assert now_playing.update(PLAY_STATUS, "p--", pause)
+    assert now_playing.position == 30
+    # While paused the position stays put
+    later = pause + timedelta(seconds=60)
+    assert not now_playing.update(TIME, "00:30/03:00", later)
+
+
+def test_clear():
+    """Test that clearing forgets the track once."""
+    now_playing = NowPlaying()
+    assert not now_playing.clear()
+    now_playing.update(TITLE, "Song", START)
+    version = now_playing.version
+
+    assert now_playing.clear()
+    assert now_playing.title is None
+    assert now_playing.version > version
+    assert not now_playing.clear()
+
+
+@pytest.mark.asyncio
+async def test_media_player_shows_pushed_track(hass):
+    """Test that the main zone shows the track pushed in the network zone."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "1.2.3.4"})
+    manager = OnkyoConnectionManager(hass, MagicMock())
+    player = OnkyoMediaPlayer(
+        receiver=manager.receiver,
+        connection_manager=manager,
+        name="Onkyo",
+        zone="main",
+        hass=hass,
+        entry=entry,
+    )
+    player.hass = hass
+    player.entity_id = "media_player.onkyo"
+    player.async_write_ha_state = MagicMock()
+    player._async_update_all = AsyncMock()
+    await player.async_added_to_hass()
+    player._handle_receiver_update("main", "power", "on")
+    player._handle_receiver_update("main", "input-selector", "net")
+
+    # Texts that look like hex numbers stay texts
+    for message in ("NTI1989", "NATABBA", "NSTP--", "NTM00:10/03:00"):
+        manager._async_handle_message(message)
+    player._write_coalescer.async_flush()
+
+    assert player.state == MediaPlayerState.PLAYING
+    assert (player.media_title, player.media_artist) == ("1989", "ABBA")
+    assert (player.media_position, player.media_duration) == (10, 180)
+
+    # The per-second time update does not write the state
+    player.async_write_ha_state.reset_mock()
+    manager._async_handle_message("NTM00:10/03:00")
+    player._write_coalescer.async_flush()
+    player.async_write_ha_state.assert_not_called()
+
+    # The track belongs to the source it played on, even if polling is
+    # what noticed the change
+    with patch.object(
+        manager,
+        "async_send_command",
+        AsyncMock(return_value=("input-selector", ("dvd", "bd", "dvd"))),
+    ):
+        await player._async_update_source()
+    player._write_coalescer.async_flush()
+    assert player.source == "dvd"
+    assert player.state == MediaPlayerState.ON
+    assert player.media_title is None
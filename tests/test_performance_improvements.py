@@ -1,9 +1,12 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.media_player import MediaPlayerState
 from homeassistant.core import HomeAssistant
 
+from custom_components.onkyo import helpers
+from custom_components.onkyo.coalescer import StateWriteCoalescer
 from custom_components.onkyo.media_player import OnkyoMediaPlayer
 
 
@@ -105,3 +108,80 @@ async def test_handle_receiver_update_volume_robustness(hass: HomeAssistant):
         player._handle_receiver_update("main", "volume", "N/A")
     except Exception as e:
         pytest.fail(f"Should not have raised exception: {e}")
+
+
+@pytest.mark.asyncio
+async def test_push_burst_coalesced_into_single_write(hass: HomeAssistant):
+    """Test that a burst of push updates results in a single state write."""
+    receiver = MagicMock()
+    connection_manager = MagicMock()
+    connection_manager.connected = True
+
+    entry = MagicMock()
+    entry.data = {"host": "1.2.3.4", "name": "Test Receiver"}
+    entry.options = {}
+
+    player = OnkyoMediaPlayer(
+        receiver, connection_manager, "Test Receiver", "main", hass, entry
+    )
+    player.hass = hass
+    player.async_write_ha_state = MagicMock()
+    player._attr_state = MediaPlayerState.ON
+
+    # Typical input change burst
+    player._handle_receiver_update("main", "input-selector", "dvd")
+    player._handle_receiver_update("main", "volume", 30)
+    player._handle_receiver_update("main", "muting", "off")
+    player._handle_receiver_update("main", "volume", 32)
+
+    player.async_write_ha_state.assert_not_called()
+    assert player._write_coalescer.pending
+
+    player._write_coalescer.async_flush()
+    player.async_write_ha_state.assert_called_once()
+    assert player.source == "dvd"
+    assert player.volume_level == 0.4
+
+    # Repeating the same values does not produce another write
+    player.async_write_ha_state.reset_mock()
+    player._handle_receiver_update("main", "volume", 32)
+    player._handle_receiver_update("main", "input-selector", "dvd")
+    player._write_coalescer.async_flush()
+    player.async_write_ha_state.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_coalescer_flushes_after_window(hass: HomeAssistant):
+    """Test that the coalescer writes on its own once the window elapses."""
+    write = MagicMock()
+    coalescer = StateWriteCoalescer(hass, write, lambda: "state", delay=0.01)
+
+    coalescer.async_schedule()
+    coalescer.async_schedule()
+    await asyncio.sleep(0.05)
+
+    write.assert_called_once()
+    assert not coalescer.pending
+
+
+def _render_options_sources(model_name: str) -> list[dict[str, str]]:
+    """Mirror the source part of the options-flow form rendering."""
+    all_sources = helpers.build_sources_list(model_name)
+    sorted_sources = sorted(all_sources.items(), key=lambda x: x[1])
+    return [{"value": key, "label": f"{name} ({key})"} for key, name in sorted_sources]
+
+
+def test_options_flow_catalogs_memoized():
+    """Test that rendering the options-flow sources reuses the catalogs."""
+    helpers.clear_catalog_cache()
+    cold = _render_options_sources("DHC-40.1")
+    first = helpers.build_sources_list("DHC-40.1")
+    misses = helpers._model_sources.cache_info().misses
+
+    for _ in range(10):
+        warm = _render_options_sources("DHC-40.1")
+
+    assert warm == cold
+    assert helpers.build_sources_list("DHC-40.1") is first
+    assert helpers._model_sources.cache_info().misses == misses
+    assert helpers._model_sources.cache_info().hits >= 10
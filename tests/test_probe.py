@@ -0,0 +1,147 @@
+"""Tests for the config flow connection hand-off."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.onkyo.const import PROBE_TTL
+from custom_components.onkyo.probe import (
+    ReceiverProbe,
+    async_probe_receiver,
+    async_store_probe,
+    async_take_probe,
+    probe_receiver,
+    query_firmware,
+)
+from custom_components.onkyo.receiver_info import ReceiverInfo
+
+NRI_REPLY = (
+    'NRI<?xml version="1.0" encoding="utf-8"?><response status="ok">'
+    '<device id="TX-NR686"><model>TX-NR686</model>'
+    "<firmwareversion>R1234</firmwareversion>"
+    "<macaddress>0009B0123456</macaddress><zonelist>"
+    '<zone id="1" value="1" name="Main"/><zone id="2" value="1" name="Zone2"/>'
+    "</zonelist></device></response>"
+)
+IDENTIFIER = "0009B0123456001122334455"
+
+
+def test_probe_receiver_queries_only_supported_zones():
+    """Test that only zones the model can have are queried."""
+    receiver = MagicMock()
+    receiver.model_name = "TX-SR876"
+    receiver.command.return_value = "on"
+
+    probe = probe_receiver(receiver, "1.1.1.1", "R1234")
+
+    assert probe.model_name == "TX-SR876"
+    assert probe.firmware == "R1234"
+    assert probe.zones[0] == "main"
+    queried = {call.args[0] for call in receiver.command.call_args_list}
+    assert "zone4.power=query" not in queried
+
+
+def test_probe_receiver_unknown_model():
+    """Test that zones of models missing from the index are left to setup."""
+    receiver = MagicMock()
+    receiver.model_name = "unknown-model"
+    receiver.command.return_value = None
+
+    assert query_firmware(receiver) is None
+    probe = probe_receiver(receiver, "1.1.1.1")
+
+    assert probe.model_name is None
+    assert probe.firmware is None
+    assert probe.zones is None
+    receiver.command.assert_called_once_with("firmware-version=query")
+
+
+def test_probe_receiver_uses_receiver_info():
+    """Test that the NRI information replaces the zone queries."""
+    receiver = MagicMock()
+    receiver.model_name = "unknown-model"
+    info = ReceiverInfo("TX-SR876", "R1234", zones=("main", "zone2"))
+
+    probe = probe_receiver(receiver, "1.1.1.1", None, info)
+
+    assert probe.model_name == "TX-SR876"
+    assert probe.firmware == "R1234"
+    assert probe.zones == ["main", "zone2"]
+    receiver.command.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_receiver_info_read_once_per_firmware(hass):
+    """Test that the NRI XML is only read again after a firmware update."""
+    receiver = MagicMock()
+    receiver.model_name = "unknown-model"
+    receiver.command.return_value = ("firmware-version", "R1234")
+    receiver.raw.return_value = NRI_REPLY
+
+    first = await async_probe_receiver(hass, receiver, "1.1.1.1", IDENTIFIER)
+    second = await async_probe_receiver(hass, receiver, "1.1.1.1", IDENTIFIER)
+
+    assert receiver.raw.call_count == 1
+    assert first.info == second.info
+    assert second.model_name == "TX-NR686"
+    assert second.zones == ["main", "zone2"]
+
+    receiver.command.return_value = ("firmware-version", "R2000")
+    await async_probe_receiver(hass, receiver, "1.1.1.1", IDENTIFIER)
+    assert receiver.raw.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_receiver_info_follows_the_unit(hass):
+    """Test that stored NRI information is never served by address alone."""
+    receiver = MagicMock()
+    receiver.model_name = "unknown-model"
+    receiver.command.return_value = ("firmware-version", "R1234")
+    receiver.raw.return_value = NRI_REPLY
+    await async_probe_receiver(hass, receiver, "1.1.1.1", IDENTIFIER)
+
+    # Another unit now answers at the address
+    await async_probe_receiver(hass, receiver, "1.1.1.1", "0009B0ABCDEF00")
+    # Or the unit is not known from a scan
+    await async_probe_receiver(hass, receiver, "1.1.1.1")
+    assert receiver.raw.call_count == 3
+
+    # The unit moved to another address
+    await async_probe_receiver(hass, receiver, "1.1.1.9", IDENTIFIER)
+    assert receiver.raw.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_take_probe(hass):
+    """Test that a parked probe is handed out once."""
+    probe = ReceiverProbe("1.1.1.1", MagicMock())
+    async_store_probe(hass, probe)
+
+    assert async_take_probe(hass, "1.1.1.1") is probe
+    assert async_take_probe(hass, "1.1.1.1") is None
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=PROBE_TTL))
+    await hass.async_block_till_done()
+    probe.receiver.disconnect.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unclaimed_probe_is_closed(hass):
+    """Test that probes are closed when replaced or when they expire."""
+    first = ReceiverProbe("1.1.1.1", MagicMock())
+    second = ReceiverProbe("1.1.1.1", MagicMock())
+    async_store_probe(hass, first)
+    async_store_probe(hass, second)
+    await hass.async_block_till_done()
+
+    first.receiver.disconnect.assert_called_once()
+    second.receiver.disconnect.assert_not_called()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=PROBE_TTL))
+    await hass.async_block_till_done()
+
+    second.receiver.disconnect.assert_called_once()
+    assert async_take_probe(hass, "1.1.1.1") is None
@@ -0,0 +1,97 @@
+"""Tests for the Onkyo receiver profile registry."""
+
+import dataclasses
+
+import pytest
+
+from custom_components.onkyo.const import COMMAND_DELAY
+from custom_components.onkyo.helpers import get_profile_defaults, get_profile_timing
+from custom_components.onkyo.profiles import (
+    DEFAULT_TIMING,
+    EMPTY_DEFAULTS,
+    ModelNameIndex,
+    get_receiver_profile,
+    normalize_model_name,
+    resolve_mapped_model,
+)
+
+
+@pytest.mark.parametrize(
+    ("model_name", "expected"),
+    [
+        ("TX-NR609(Ether)", "txnr609"),
+        ("/515AE(Ether)", "515ae"),
+        (" vsx 932 ", "vsx932"),
+        ("VSX-LX101", "vsxlx101"),
+    ],
+)
+def test_normalize_model_name(model_name, expected):
+    """Test model name normalization."""
+    assert normalize_model_name(model_name) == expected
+
+
+@pytest.mark.parametrize(
+    "model_name", ["VSX-932", "vsx-932", "VSX 932", "VSX-932(Ether)"]
+)
+def test_profile_lookup_variants(model_name):
+    """Test that reported name variants resolve to the same profile."""
+    profile = get_receiver_profile(model_name)
+    assert profile is not None
+    assert profile.model == "VSX-932"
+    assert profile.defaults.max_volume_percent == 55
+
+
+def test_profile_alias_and_miss():
+    """Test alias resolution and unknown models."""
+    assert get_receiver_profile("VSX-S520").model == "VSX-S520D"
+    assert get_receiver_profile("TX-RZ50") is None
+    assert get_receiver_profile(None) is None
+
+
+def test_profile_lookup_never_guesses():
+    """Test that a similar model only matches when asked for a suggestion."""
+    assert get_receiver_profile("VSX-LX504") is None
+    assert get_receiver_profile("VSX-LX504", fuzzy=True).model == "VSX-LX503"
+    assert get_profile_timing("VSX-LX504") is DEFAULT_TIMING
+    assert get_profile_defaults("VSX-LX504") is EMPTY_DEFAULTS
+    assert resolve_mapped_model("TX-NR609X") is None
+
+
+def test_profiles_are_frozen():
+    """Test that profiles cannot be modified."""
+    profile = get_receiver_profile("VSX-933")
+    assert "zone2" in profile.zones
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        profile.brand = "Onkyo"  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        profile.defaults.sources["bd"] = "BD"  # type: ignore[index]
+
+
+def test_mapped_model_resolution():
+    """Test resolution against the generated model mapping."""
+    assert resolve_mapped_model("tx-nr609") == "TX-NR609(Ether)"
+    assert resolve_mapped_model("515AE") == "/515AE(Ether)"
+    assert resolve_mapped_model("NOT-A-MODEL") is None
+
+
+def test_fuzzy_match_requires_unique_close_match():
+    """Test the trigram nearest-match fallback."""
+    index = ModelNameIndex(["TX-NR676", "TX-NR686", "VSX-932"])
+
+    assert index.resolve("VSX-932E", fuzzy=True) == "VSX-932"
+    assert index.resolve("VSX-932E") is None
+    # Equally close to two models: no guess
+    assert index.resolve("TX-NR6X6", fuzzy=True) is None
+
+
+def test_profile_timing():
+    """Test per-model timing and the defaults for unknown models."""
+    timing = get_profile_timing("VSX-932")
+    assert timing.max_pipelined_queries == 3
+    assert timing.reliable_push is False
+    assert timing.slow_commands["SLI"] == 0.4
+
+    assert get_profile_timing("TX-RZ50") is DEFAULT_TIMING
+    # Profiles without a timing section keep the global defaults
+    assert get_profile_timing("VSX-LX103") == DEFAULT_TIMING
+    assert DEFAULT_TIMING.command_interval == COMMAND_DELAY
@@ -0,0 +1,82 @@
+"""Tests for parsing the receiver information XML."""
+
+from unittest.mock import MagicMock
+
+from custom_components.onkyo.receiver_info import (
+    ReceiverInfo,
+    device_key,
+    iter_chunks,
+    parse_receiver_info,
+    query_receiver_info,
+)
+
+NRI_XML = """\
+NRI<?xml version="1.0" encoding="utf-8"?>
+<response status="ok">
+  <device id="TX-NR686">
+    <brand>ONKYO</brand>
+    <model>TX-NR686</model>
+    <firmwareversion>1100-2000-0000-0010</firmwareversion>
+    <macaddress>0009B0123456</macaddress>
+    <netservicelist count="1">
+      <netservice id="0e" value="1" name="TuneIn Radio"/>
+    </netservicelist>
+    <zonelist count="3">
+      <zone id="1" value="1" name="Main" volmax="80"/>
+      <zone id="2" value="1" name="Zone2" volmax="80"/>
+      <zone id="3" value="0" name="Zone3" volmax="80"/>
+    </zonelist>
+    <selectorlist count="3">
+      <selector id="10" value="1" name="Blu-ray" zone="03"/>
+      <selector id="2b" value="1" name="NET" zone="03"/>
+      <selector id="01" value="0" name="CBL/SAT" zone="01"/>
+    </selectorlist>
+    <presetlist count="3">
+      <preset id="01" band="1" freq="87.50" name="Jazz FM"/>
+      <preset id="02" band="1" freq="101.10" name=""/>
+      <preset id="03" band="0" freq="0" name=""/>
+    </presetlist>
+  </device>
+</response>
+"""
+
+
+def test_parse_receiver_info():
+    """Test that the fields are read from a document fed in small slices."""
+    info = parse_receiver_info(iter_chunks(NRI_XML, size=16))
+
+    assert info == ReceiverInfo(
+        model_name="TX-NR686",
+        firmware="1100-2000-0000-0010",
+        identifier="0009B0123456",
+        zones=("main", "zone2"),
+        selectors=(("10", "Blu-ray"), ("2B", "NET")),
+        presets=((1, "Jazz FM"), (2, "101.10")),
+    )
+    assert ReceiverInfo.from_dict(info.as_dict()) == info
+
+
+def test_parse_receiver_info_rejects_bad_replies():
+    """Test refused queries and truncated documents."""
+    refused = '<?xml version="1.0"?><response status="ng"></response>'
+    assert parse_receiver_info(iter_chunks(refused)) is None
+    assert parse_receiver_info(iter_chunks(NRI_XML[:200])) is None
+
+
+def test_query_receiver_info():
+    """Test that only NRI replies are parsed."""
+    receiver = MagicMock()
+    receiver.raw.return_value = NRI_XML
+    assert query_receiver_info(receiver).model_name == "TX-NR686"
+    receiver.raw.assert_called_once_with("NRIQSTN")
+
+    receiver.raw.side_effect = TimeoutError
+    assert query_receiver_info(receiver) is None
+
+
+def test_device_key():
+    """Test that discovery identifiers and NRI MAC addresses share a key."""
+    assert device_key("0009B0123456001122334455") == "0009b0123456"
+    assert device_key("00:09:B0:12:34:56") == "0009b0123456"
+    assert device_key("unknown") is None
+    assert device_key(None) is None
@@ -0,0 +1,151 @@
+"""Tests for the receiver scheduler."""
+
+import asyncio
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.onkyo import _async_connect_receiver, media_player
+from custom_components.onkyo.connection import OnkyoConnectionManager
+from custom_components.onkyo.const import DATA_SCHEDULER, DOMAIN, STARTUP_CONCURRENCY
+from custom_components.onkyo.media_player import OnkyoMediaPlayer
+from custom_components.onkyo.scheduler import (
+    StartupScheduler,
+    async_get_scheduler,
+    async_track_phased_interval,
+    poll_offset,
+)
+
+RECEIVERS = 50
+HANDSHAKE_TIME = 0.02
+
+
+class SimulatedReceiver:
+    """An eISCP receiver that takes a while to answer its first command."""
+
+    open_sockets = 0
+    peak_sockets = 0
+    _lock = threading.Lock()
+
+    def command(self, *args):
+        """Simulate connecting and answering a power query."""
+        with self._lock:
+            cls = SimulatedReceiver
+            cls.open_sockets += 1
+            cls.peak_sockets = max(cls.peak_sockets, cls.open_sockets)
+        try:
+            time.sleep(HANDSHAKE_TIME)
+            return ("system-power", "standby")
+        finally:
+            with self._lock:
+                SimulatedReceiver.open_sockets -= 1
+
+    def disconnect(self):
+        """Nothing to close."""
+
+
+def test_poll_offsets_are_stable_and_spread():
+    """Test that receivers get fixed phases spread over the interval."""
+    offsets = [poll_offset(f"192.168.1.{i}", 30) for i in range(RECEIVERS)]
+
+    assert offsets == [poll_offset(f"192.168.1.{i}", 30) for i in range(RECEIVERS)]
+    assert all(0 <= offset < 30 for offset in offsets)
+    # Every third of the interval gets a share of the receivers
+    assert all(any(lo <= o < lo + 10 for o in offsets) for lo in (0, 10, 20))
+
+
+@pytest.mark.asyncio
+async def test_phased_interval(hass):
+    """Test that polling starts one interval after the offset."""
+    action = MagicMock()
+    cancel = async_track_phased_interval(hass, action, timedelta(seconds=30), 7)
+    start = dt_util.utcnow()
+
+    async_fire_time_changed(hass, start + timedelta(seconds=8))
+    await hass.async_block_till_done()
+    action.assert_not_called()
+
+    async_fire_time_changed(hass, start + timedelta(seconds=38))
+    await hass.async_block_till_done()
+    assert action.call_count == 1
+
+    cancel()
+    async_fire_time_changed(hass, start + timedelta(seconds=68))
+    await hass.async_block_till_done()
+    assert action.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_startup_connects_within_cap(hass):
+    """Connect 50 simulated receivers, never more than the cap at once."""
+    managers = []
+    entries = []
+    for i in range(RECEIVERS):
+        entry = MockConfigEntry(domain=DOMAIN, data={"host": f"10.0.0.{i}"})
+        entries.append(entry)
+        managers.append(OnkyoConnectionManager(hass, SimulatedReceiver()))
+
+    await asyncio.gather(
+        *(
+            _async_connect_receiver(hass, entry, manager)
+            for entry, manager in zip(entries, managers, strict=True)
+        )
+    )
+
+    scheduler = async_get_scheduler(hass)
+    assert all(manager.connected for manager in managers)
+    assert scheduler.peak == STARTUP_CONCURRENCY
+    assert SimulatedReceiver.peak_sockets <= STARTUP_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_zone_detection_and_list_queries_take_slots(hass):
+    """Test that foreground startup queries are capped like the connects."""
+    hass.data[DATA_SCHEDULER] = StartupScheduler(limit=1)
+    active = peak = 0
+
+    async def _send(*args):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"dvd": "DVD"} if args[0] == "raw" else None
+
+    players = []
+    for i in range(3):
+        entry = MockConfigEntry(domain=DOMAIN, data={"host": f"10.0.0.{i}"})
+        manager = MagicMock()
+        manager.connected = True
+        manager.async_send_command = AsyncMock(side_effect=_send)
+        player = OnkyoMediaPlayer(
+            MagicMock(), manager, f"Onkyo {i}", "main", hass, entry
+        )
+        player.hass = hass
+        players.append(player)
+        entry.add_to_hass(hass)
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+            "receiver": MagicMock(),
+            "connection_manager": manager,
+            "name": f"Onkyo {i}",
+        }
+
+    await asyncio.gather(
+        *(player._async_fetch_source_list() for player in players),
+        *(
+            media_player.async_setup_entry(hass, entry, MagicMock())
+            for entry in hass.config_entries.async_entries(DOMAIN)
+        ),
+    )
+
+    assert all(player.source_list == ["dvd"] for player in players)
+    assert peak == 1
+    assert hass.data[DATA_SCHEDULER].peak == 1
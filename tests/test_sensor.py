@@ -0,0 +1,73 @@
+"""Tests for the Onkyo information sensors."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.onkyo.av_info import AUDIO_INFORMATION, VIDEO_INFORMATION
+from custom_components.onkyo.connection import OnkyoConnectionManager
+from custom_components.onkyo.const import DOMAIN
+from custom_components.onkyo.sensor import OnkyoInformationSensor
+
+AUDIO = "HDMI 1,PCM,48 kHz,2.0 ch,All Ch Stereo,5.1 ch,"
+
+
+@pytest.fixture
+def manager(hass):
+    """Return a connection manager whose commands are mocked."""
+    manager = OnkyoConnectionManager(hass, MagicMock())
+    manager.async_send_command = AsyncMock(return_value=None)
+    return manager
+
+
+async def _async_add_sensor(hass, manager, schema):
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "1.2.3.4"})
+    sensor = OnkyoInformationSensor(manager, entry, "Onkyo", schema)
+    sensor.hass = hass
+    sensor.entity_id = f"sensor.onkyo_{schema.key}"
+    sensor.async_write_ha_state = MagicMock()
+    await sensor.async_added_to_hass()
+    return sensor
+
+
+@pytest.mark.asyncio
+async def test_information_written_only_on_change(hass, manager):
+    """Test that pushed information is shown and repeats are not written."""
+    sensor = await _async_add_sensor(hass, manager, AUDIO_INFORMATION)
+    assert not sensor.should_poll
+
+    manager.updates.async_dispatch("main", "audio-information", AUDIO)
+    manager.updates.async_dispatch("main", "audio-information", AUDIO)
+    manager.updates.async_dispatch("zone2", "audio-information", "x")
+
+    assert sensor.native_value == "PCM"
+    assert sensor.extra_state_attributes["sample_rate"] == "48 kHz"
+    assert sensor.unique_id == "1.2.3.4_audio_information"
+    sensor.async_write_ha_state.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_information_queried_once_per_source(hass, manager):
+    """Test that a source change triggers a single query."""
+    manager.async_send_command.return_value = (
+        "video-information",
+        "HDMI 1,1920 x 1080p  60 Hz,YCbCr 4:2:2,8 bit,HDMI Main,",
+    )
+    sensor = await _async_add_sensor(hass, manager, VIDEO_INFORMATION)
+    manager.async_send_command.assert_not_called()
+
+    manager.updates.async_dispatch("main", "input-selector", "dvd")
+    manager.updates.async_dispatch("main", "input-selector", "dvd")
+    await hass.async_block_till_done()
+
+    manager.async_send_command.assert_awaited_once_with(
+        "command", "video-information=query"
+    )
+    assert sensor.native_value == "1920 x 1080p  60 Hz"
+
+    manager.updates.async_dispatch("main", "input-selector", "game")
+    await hass.async_block_till_done()
+    assert manager.async_send_command.await_count == 2
+    # The reply did not change, so the state was not written again
+    sensor.async_write_ha_state.assert_called_once()
@@ -0,0 +1,89 @@
+"""Tests for the Onkyo zone state model."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.components.media_player import MediaPlayerState
+from homeassistant.core import HomeAssistant
+
+from custom_components.onkyo.media_player import OnkyoMediaPlayer
+from custom_components.onkyo.state import ZoneState
+
+
+def test_zone_state_tracks_changes():
+    """Test that only real changes bump the version."""
+    state = ZoneState()
+    assert state.version == 0
+
+    assert state.update(source="dvd", is_volume_muted=False) == {"source"}
+    assert state.version == 1
+
+    # Same values again
+    assert state.update(source="dvd") == frozenset()
+    assert state.version == 1
+
+    state.update(volume_level=0.5)
+    assert state.pop_changes() == {"source", "volume_level"}
+    assert state.pop_changes() == frozenset()
+
+
+def test_zone_state_attribute_version():
+    """Test that attribute fields have their own version."""
+    state = ZoneState()
+
+    state.update(volume_level=0.3, source="tv")
+    assert state.attributes_version == 0
+
+    state.update(listening_modes=["stereo"])
+    assert state.attributes_version == 1
+
+
+def test_zone_state_uses_slots():
+    """Test that the state object has no per-instance dict."""
+    state = ZoneState()
+    with pytest.raises(AttributeError):
+        state.unknown_field = 1  # pylint: disable=assigning-non-slot
+
+
+@pytest.mark.asyncio
+async def test_poll_without_changes_does_not_write(hass: HomeAssistant):
+    """Test that an unchanged poll neither writes state nor rebuilds attributes."""
+    connection_manager = MagicMock()
+    connection_manager.connected = True
+
+    async def command_side_effect(*args, **kwargs):
+        command = args[1]
+        if "power" in command:
+            return ("system-power", "on")
+        if "volume" in command:
+            return ("master-volume", 40)
+        if "selector" in command:
+            return ("input-selector", "dvd")
+        if "muting" in command:
+            return "off"
+        if command == "SLIQSTN":
+            return {"dvd": "DVD"}
+        if command == "LMQSTN":
+            return {"stereo": "Stereo"}
+        return None
+
+    connection_manager.async_send_command = AsyncMock(side_effect=command_side_effect)
+
+    entry = MagicMock()
+    entry.data = {"host": "1.2.3.4", "name": "Test Receiver"}
+    entry.options = {}
+
+    player = OnkyoMediaPlayer(
+        MagicMock(), connection_manager, "Test Receiver", "main", hass, entry
+    )
+    player.async_write_ha_state = MagicMock()
+
+    await player._async_poll()
+    player.async_write_ha_state.assert_called_once()
+    assert player.state == MediaPlayerState.ON
+    attributes = player.extra_state_attributes
+
+    player.async_write_ha_state.reset_mock()
+    await player._async_poll()
+    player.async_write_ha_state.assert_not_called()
+    assert player.extra_state_attributes is attributes
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from custom_components.onkyo.media_player import OnkyoMediaPlayer
+from custom_components.onkyo.volume import get_volume_table
 
 
 # Minimal mock for ConfigEntry
@@ -135,3 +136,49 @@ def test_ha_volume_to_receiver(
 
     # Assert the result is as expected
     assert receiver_volume == expected_receiver_volume
+
+
+@pytest.mark.parametrize("resolution", [50, 80, 100, 200])
+@pytest.mark.parametrize("max_volume", [1, 37, 55, 80, 100])
+def test_volume_table_round_trip(resolution, max_volume):
+    """Test that every usable receiver step survives a round trip through HA."""
+    table = get_volume_table(resolution, max_volume)
+
+    for step in range(table.max_step + 1):
+        assert table.to_receiver(table.to_ha(step)) == step
+
+    # The full slider never exceeds the usable range
+    assert table.to_receiver(1.0) == table.max_step
+    assert table.to_receiver(1.5) == table.max_step
+    assert table.to_receiver(-0.1) == 0
+
+
+def test_volume_table_rebuilt_on_options_change():
+    """Test that options changes rebuild the table without a new entity."""
+    mock_entry = MockConfigEntry(
+        data={"host": "1.2.3.4", "name": "Test Receiver"},
+        options={"max_volume": 100, "volume_resolution": 80},
+    )
+    player = OnkyoMediaPlayer(
+        receiver=MagicMock(),
+        connection_manager=MagicMock(),
+        name="Test Receiver",
+        zone="main",
+        hass=MagicMock(),
+        entry=mock_entry,
+    )
+    player.async_write_ha_state = MagicMock()
+    assert player._ha_volume_to_receiver(1.0) == 80
+
+    player._handle_receiver_update("main", "volume", 40)
+    player._write_coalescer.async_flush()
+    assert player.volume_level == 0.5
+    player.async_write_ha_state.reset_mock()
+
+    mock_entry._options = {"max_volume": 50, "volume_resolution": 200}
+    player._async_options_updated()
+
+    # 40 of the 100 usable half-steps
+    assert player._ha_volume_to_receiver(1.0) == 100
+    assert player.volume_level == 0.4
+    player.async_write_ha_state.assert_called_once()